@@ -0,0 +1,101 @@
+"""Cache invalidation NOTIFY triggers
+
+Every row change on the cached catalog tables (products, categories,
+reviews) sends a NOTIFY on the 'cache_invalidation' channel, so writes that
+bypass the services (seed scripts, admin SQL, migrations) still evict the
+cache. services/db_change_listener.py turns the notifications into cache
+invalidations.
+
+Payload (JSON): {"table": "products", "op": "UPDATE",
+                 "new": {"id_key": 1, ...}, "old": {"id_key": 1, ...}}
+with the primary key plus the columns passed as trigger arguments (the
+foreign keys the cache keys depend on). TRUNCATE sends table and op only.
+
+PostgreSQL only: a no-op on other databases.
+
+Revision ID: 3f9a1c7e52d4
+Revises: b837c6e261e1
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f9a1c7e52d4'
+down_revision: Union[str, None] = 'b837c6e261e1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+CHANNEL = 'cache_invalidation'
+
+# table -> extra columns included in the payload
+TABLES = {
+    'products': ['category_id'],
+    'categories': [],
+    'reviews': ['product_id'],
+}
+
+NOTIFY_FUNCTION = f"""
+CREATE OR REPLACE FUNCTION notify_cache_invalidation() RETURNS trigger
+LANGUAGE plpgsql AS $$
+DECLARE
+    payload jsonb := jsonb_build_object('table', TG_TABLE_NAME, 'op', TG_OP);
+    columns text[] := ARRAY['id_key'] || TG_ARGV;
+    col text;
+    new_row jsonb := '{{}}'::jsonb;
+    old_row jsonb := '{{}}'::jsonb;
+BEGIN
+    IF TG_LEVEL = 'ROW' THEN
+        FOREACH col IN ARRAY columns LOOP
+            IF TG_OP <> 'DELETE' THEN
+                new_row := new_row || jsonb_build_object(col, to_jsonb(NEW) -> col);
+            END IF;
+            IF TG_OP <> 'INSERT' THEN
+                old_row := old_row || jsonb_build_object(col, to_jsonb(OLD) -> col);
+            END IF;
+        END LOOP;
+        IF TG_OP <> 'DELETE' THEN
+            payload := payload || jsonb_build_object('new', new_row);
+        END IF;
+        IF TG_OP <> 'INSERT' THEN
+            payload := payload || jsonb_build_object('old', old_row);
+        END IF;
+    END IF;
+
+    PERFORM pg_notify('{CHANNEL}', payload::text);
+    RETURN NULL;
+END;
+$$;
+"""
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute(NOTIFY_FUNCTION)
+    for table, columns in TABLES.items():
+        arguments = ", ".join(f"'{column}'" for column in columns)
+        op.execute(f"""
+            CREATE TRIGGER {table}_cache_invalidation
+            AFTER INSERT OR UPDATE OR DELETE ON {table}
+            FOR EACH ROW EXECUTE FUNCTION notify_cache_invalidation({arguments})
+        """)
+        op.execute(f"""
+            CREATE TRIGGER {table}_cache_invalidation_truncate
+            AFTER TRUNCATE ON {table}
+            FOR EACH STATEMENT EXECUTE FUNCTION notify_cache_invalidation()
+        """)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    for table in TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_cache_invalidation_truncate ON {table}")
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_cache_invalidation ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS notify_cache_invalidation()")
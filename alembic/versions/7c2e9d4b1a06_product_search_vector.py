@@ -0,0 +1,72 @@
+"""Product full-text search vector
+
+Adds products.search_vector (tsvector of the product name, weight A, and its
+category name, weight B) with a GIN index, so ProductRepository searches use
+the index and rank results with ts_rank instead of scanning with ILIKE.
+
+A generated column cannot read another table (the category name), so the
+vector is kept up to date by triggers:
+- products: BEFORE INSERT / UPDATE OF name, category_id
+- categories: AFTER UPDATE OF name rewrites the vectors of its products
+
+Existing rows are backfilled with the cache invalidation NOTIFY trigger
+disabled (the vector is not part of any cached data).
+
+PostgreSQL only: a no-op on other databases (SQLite searches with ILIKE).
+
+Revision ID: 7c2e9d4b1a06
+Revises: 3f9a1c7e52d4
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from models.product import PRODUCT_SEARCH_TRIGGERS, search_vector_sql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c2e9d4b1a06'
+down_revision: Union[str, None] = '3f9a1c7e52d4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.add_column('products', sa.Column('search_vector', postgresql.TSVECTOR(), nullable=True))
+
+    # Same trigger DDL as ProductModel uses for create_all()
+    for statement in PRODUCT_SEARCH_TRIGGERS:
+        op.execute(statement)
+
+    # Backfill without one NOTIFY per row
+    op.execute("ALTER TABLE products DISABLE TRIGGER products_cache_invalidation")
+    op.execute(f"""
+        UPDATE products SET search_vector = {search_vector_sql(
+            'name', '(SELECT c.name FROM categories c WHERE c.id_key = products.category_id)'
+        )}
+    """)
+    op.execute("ALTER TABLE products ENABLE TRIGGER products_cache_invalidation")
+
+    op.create_index(
+        'ix_products_search_vector', 'products', ['search_vector'],
+        unique=False, postgresql_using='gin'
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.drop_index('ix_products_search_vector', table_name='products')
+    op.execute("DROP TRIGGER IF EXISTS categories_search_vector ON categories")
+    op.execute("DROP TRIGGER IF EXISTS products_search_vector ON products")
+    op.execute("DROP FUNCTION IF EXISTS categories_search_vector_update()")
+    op.execute("DROP FUNCTION IF EXISTS products_search_vector_update()")
+    op.drop_column('products', 'search_vector')
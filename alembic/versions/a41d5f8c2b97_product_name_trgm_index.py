@@ -0,0 +1,42 @@
+"""Product name trigram index
+
+Enables pg_trgm and adds a GIN trigram index on products.name, so the
+typeahead endpoint (/api/v1/products/suggest) answers ILIKE '%term%' and
+similarity() ordering from the index instead of scanning the table.
+
+PostgreSQL only: a no-op on other databases.
+
+Revision ID: a41d5f8c2b97
+Revises: 7c2e9d4b1a06
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a41d5f8c2b97'
+down_revision: Union[str, None] = '7c2e9d4b1a06'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        'ix_products_name_trgm', 'products', ['name'],
+        unique=False, postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'}
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    # The extension stays: other objects may depend on it
+    op.drop_index('ix_products_name_trgm', table_name='products')
@@ -0,0 +1,50 @@
+"""Product review aggregates
+
+Adds products.rating_avg and products.rating_count, maintained by
+ReviewService in the same transaction as every review write, so product
+listings show ratings without loading the reviews.
+
+Existing products are backfilled from the reviews table (on PostgreSQL with
+the cache invalidation NOTIFY trigger disabled: one notification per row
+would only evict the cache in bulk).
+
+Revision ID: d5b3e8a90f12
+Revises: a41d5f8c2b97
+Create Date: 2026-10-17 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5b3e8a90f12'
+down_revision: Union[str, None] = 'a41d5f8c2b97'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    postgresql = op.get_bind().dialect.name == 'postgresql'
+
+    op.add_column('products', sa.Column('rating_avg', sa.Float(), nullable=True))
+    op.add_column('products', sa.Column('rating_count', sa.Integer(), nullable=False, server_default='0'))
+
+    if postgresql:
+        op.execute("ALTER TABLE products DISABLE TRIGGER products_cache_invalidation")
+    op.execute("""
+        UPDATE products SET
+            rating_avg = (SELECT AVG(r.rating) FROM reviews r WHERE r.product_id = products.id_key),
+            rating_count = (SELECT COUNT(*) FROM reviews r WHERE r.product_id = products.id_key)
+    """)
+    if postgresql:
+        op.execute("ALTER TABLE products ENABLE TRIGGER products_cache_invalidation")
+
+
+def downgrade() -> None:
+    # batch mode: SQLite cannot drop columns in place
+    with op.batch_alter_table('products') as batch_op:
+        batch_op.drop_column('rating_count')
+        batch_op.drop_column('rating_avg')
@@ -0,0 +1,86 @@
+"""
+Cache Codec Benchmark
+
+Measures encoded size, encode time and decode time of `products:list`
+payloads (product dicts with nested category and reviews, as produced by
+ProductSchema.model_dump()) for every cache codec, against the legacy
+json.dumps / json.loads text format.
+
+No Redis needed: network cost scales with the reported size.
+
+Usage:
+    python -m benchmarks.bench_cache_codecs --sizes 100 500 1000
+"""
+import argparse
+import json
+import time
+
+from services.cache_codecs import CacheCodec
+
+SPECS = ["json", "orjson", "msgpack", "orjson+zlib", "orjson+lz4", "msgpack+lz4"]
+
+
+def build_products(count: int, reviews_per_product: int = 3) -> list:
+    return [
+        {
+            "id_key": i,
+            "name": f"Product {i} - Wireless Noise Cancelling Headphones",
+            "price": 199.99 + i,
+            "stock": i % 50,
+            "image_url": f"/static/images/{i:08d}-5f1c2d3e.jpg",
+            "category_id": i % 12,
+            "active": True,
+            "category": {"id_key": i % 12, "name": f"Category {i % 12}"},
+            "reviews": [
+                {
+                    "id_key": i * 10 + r,
+                    "rating": 1 + (i + r) % 5,
+                    "comment": "Great sound, comfortable for long sessions, battery lasts all week.",
+                    "product_id": i,
+                }
+                for r in range(reviews_per_product)
+            ],
+        }
+        for i in range(count)
+    ]
+
+
+def timeit(func, repeat: int) -> float:
+    """Best-of-3 mean time per call in microseconds"""
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            func()
+        best = min(best, (time.perf_counter() - start) / repeat)
+    return best * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 500, 1000])
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--threshold", type=int, default=1024)
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        products = build_products(size)
+        print(f"\nproducts:list with {size} items")
+        print(f"{'codec':<14} {'bytes':>10} {'encode µs':>11} {'decode µs':>11}")
+
+        legacy = json.dumps(products)
+        encode_us = timeit(lambda: json.dumps(products), args.repeat)
+        decode_us = timeit(lambda: json.loads(legacy), args.repeat)
+        print(f"{'legacy text':<14} {len(legacy.encode()):>10,} {encode_us:>11,.0f} {decode_us:>11,.0f}")
+
+        for spec in SPECS:
+            codec = CacheCodec(spec, compression_threshold=args.threshold)
+            encoded = codec.encode(products)
+            assert CacheCodec.decode(encoded) == products
+            encode_us = timeit(lambda: codec.encode(products), args.repeat)
+            decode_us = timeit(lambda: CacheCodec.decode(encoded), args.repeat)
+            print(f"{codec.spec:<14} {len(encoded):>10,} {encode_us:>11,.0f} {decode_us:>11,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+"""
+Middleware Stack Micro-Benchmark
+
+Compares requests/sec of the middleware stack assembled in create_fastapi_app
+(CORS + RequestID + RateLimiter) implemented as:
+- baseline:  no middleware at all
+- legacy:    BaseHTTPMiddleware versions of RequestID and RateLimiter
+- asgi:      the pure ASGI versions shipped in middleware/
+
+Requests are driven straight through the ASGI interface (no sockets), and
+Redis is replaced by an in-memory asyncio fake, so the numbers isolate the
+middleware overhead itself.
+
+Usage:
+    python -m benchmarks.bench_middleware --requests 20000
+"""
+import argparse
+import asyncio
+import time
+import uuid
+from unittest.mock import patch
+
+from fastapi import FastAPI
+from fastapi.middleware.cors import CORSMiddleware
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.responses import JSONResponse
+
+from middleware.rate_limiter import RateLimiterMiddleware
+from middleware.request_id_middleware import RequestIDMiddleware
+
+
+class FakeAsyncRedis:
+    """In-memory async Redis with the commands used by RateLimiterMiddleware"""
+
+    def __init__(self):
+        self.data = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def expire(self, key, seconds):
+        return True
+
+    async def delete(self, key):
+        self.data.pop(key, None)
+
+    def pipeline(self):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    def incr(self, key):
+        self.commands.append(key)
+
+    def expire(self, key, seconds):
+        pass
+
+    async def execute(self):
+        key = self.commands.pop()
+        self.redis.data[key] = int(self.redis.data.get(key, 0)) + 1
+        return [self.redis.data[key], True]
+
+
+class LegacyRequestIDMiddleware(BaseHTTPMiddleware):
+    """Previous BaseHTTPMiddleware implementation of RequestIDMiddleware"""
+
+    async def dispatch(self, request, call_next):
+        request_id = request.headers.get('X-Request-ID') or str(uuid.uuid4())
+        request.state.request_id = request_id
+        start_time = time.time()
+        response = await call_next(request)
+        duration_ms = round((time.time() - start_time) * 1000, 2)
+        response.headers['X-Request-ID'] = request_id
+        response.headers['X-Response-Time'] = f"{duration_ms}ms"
+        return response
+
+
+class LegacyRateLimiterMiddleware(BaseHTTPMiddleware):
+    """Previous BaseHTTPMiddleware implementation of RateLimiterMiddleware"""
+
+    def __init__(self, app, calls: int = 100, period: int = 60):
+        super().__init__(app)
+        self.limiter = RateLimiterMiddleware(app, calls=calls, period=period)
+
+    async def dispatch(self, request, call_next):
+        client_ip = self.limiter._get_client_ip(request.scope)
+        if not await self.limiter._is_allowed(client_ip):
+            return JSONResponse(status_code=429, content={"detail": "Rate limit exceeded"})
+        response = await call_next(request)
+        remaining = await self.limiter._get_remaining(client_ip)
+        response.headers["X-RateLimit-Limit"] = str(self.limiter.calls)
+        response.headers["X-RateLimit-Remaining"] = str(remaining)
+        response.headers["X-RateLimit-Reset"] = str(self.limiter.period)
+        return response
+
+
+def build_app(variant: str) -> FastAPI:
+    """Build a one-endpoint app with the same middleware order as create_fastapi_app"""
+    app = FastAPI()
+
+    @app.get("/api/v1/products/")
+    async def list_products():
+        return [{"id_key": 1, "name": "Laptop", "price": 999.99}]
+
+    if variant == "baseline":
+        return app
+
+    request_id_cls = RequestIDMiddleware if variant == "asgi" else LegacyRequestIDMiddleware
+    rate_limiter_cls = RateLimiterMiddleware if variant == "asgi" else LegacyRateLimiterMiddleware
+
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=["https://frontecommercefinal.vercel.app"],
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+    app.add_middleware(request_id_cls)
+    # Effectively unlimited so every request takes the allowed path
+    app.add_middleware(rate_limiter_cls, calls=10 ** 9, period=60)
+    return app
+
+
+async def run_requests(app: FastAPI, total: int, concurrency: int) -> float:
+    """Drive `total` GET requests through the ASGI app and return requests/sec"""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/api/v1/products/",
+        "raw_path": b"/api/v1/products/",
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"testserver"), (b"x-forwarded-for", b"10.0.0.1")],
+        "client": ("10.0.0.1", 12345),
+        "server": ("testserver", 80),
+    }
+
+    async def one_request():
+        # Like a real server: the body arrives once, then receive() blocks
+        # until the response is complete and reports a disconnect
+        request_sent = False
+        response_done = asyncio.Event()
+
+        async def receive():
+            nonlocal request_sent
+            if not request_sent:
+                request_sent = True
+                return {"type": "http.request", "body": b"", "more_body": False}
+            await response_done.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            if message["type"] == "http.response.body" and not message.get("more_body", False):
+                response_done.set()
+
+        await app(dict(scope, state={}), receive, send)
+
+    async def worker(count: int):
+        for _ in range(count):
+            await one_request()
+
+    per_worker = total // concurrency
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(per_worker) for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    return (per_worker * concurrency) / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    args = parser.parse_args()
+
+    results = {}
+    with patch("middleware.rate_limiter.get_async_redis_client", side_effect=FakeAsyncRedis):
+        for variant in ("baseline", "legacy", "asgi"):
+            app = build_app(variant)
+            # Warm up (builds the middleware stack, JIT-free but primes caches)
+            asyncio.run(run_requests(app, 500, 10))
+            results[variant] = asyncio.run(run_requests(app, args.requests, args.concurrency))
+
+    print(f"{'variant':<10} {'req/s':>12} {'vs baseline':>12}")
+    for variant, rps in results.items():
+        print(f"{variant:<10} {rps:>12,.0f} {rps / results['baseline']:>11.0%}")
+    print(f"\nASGI speedup over BaseHTTPMiddleware: {results['asgi'] / results['legacy']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Product List Benchmark
+
+Compares one product list page loaded by ProductRepository.find_all (ORM
+objects, joined category, ProductSummarySchema.model_validate) against
+find_all_lean (Core column select mapped to ProductListSchema), on
+an in-memory SQLite catalog. Times include the query and the schema mapping.
+
+Usage:
+    python -m benchmarks.bench_product_list --limits 20 100 500
+"""
+import argparse
+import time
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from models.base_model import base as Base
+from models.category import CategoryModel
+from models.product import ProductModel
+from models.review import ReviewModel
+from repositories.product_repository import ProductRepository
+
+
+def build_catalog(session, products: int, reviews_per_product: int = 3):
+    categories = [CategoryModel(name=f"Category {i}") for i in range(12)]
+    session.add_all(categories)
+    session.flush()
+    for i in range(products):
+        product = ProductModel(
+            name=f"Product {i} - Wireless Noise Cancelling Headphones", price=199.99 + i, stock=i % 50,
+            image_url=f"/static/images/{i:08d}.jpg", category_id=categories[i % 12].id_key
+        )
+        product.reviews = [
+            ReviewModel(rating=1 + (i + r) % 5, comment="Great sound, comfortable for long sessions.")
+            for r in range(reviews_per_product)
+        ]
+        session.add(product)
+    session.commit()
+
+
+def timeit(func, repeat: int) -> float:
+    """Best-of-3 mean time per call in milliseconds"""
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            func()
+        best = min(best, (time.perf_counter() - start) / repeat)
+    return best * 1e3
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--products", type=int, default=2000)
+    parser.add_argument("--limits", type=int, nargs="+", default=[20, 100, 500])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+    with Session() as session:
+        build_catalog(session, args.products)
+
+    def page(lean: bool, limit: int):
+        # Fresh session per page, as in a request
+        with Session() as session:
+            repository = ProductRepository(session)
+            (repository.find_all_lean if lean else repository.find_all)(limit=limit)
+
+    print(f"{'limit':>6} {'find_all ms':>12} {'lean ms':>9} {'speedup':>8}")
+    for limit in args.limits:
+        full_ms = timeit(lambda: page(False, limit), args.repeat)
+        lean_ms = timeit(lambda: page(True, limit), args.repeat)
+        print(f"{limit:>6} {full_ms:>12.2f} {lean_ms:>9.2f} {full_ms / lean_ms:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
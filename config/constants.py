@@ -24,6 +24,131 @@ class CacheConfig:
     CATEGORY_LIST_TTL = 3600  # 1 hour (rarely changes)
     CATEGORY_ITEM_TTL = 3600  # 1 hour
 
+    # In-process L1 cache in front of Redis (per worker, opt-in)
+    L1_ENABLED = os.getenv('CACHE_L1_ENABLED', 'false').lower() == 'true'
+    L1_MAX_ENTRIES = int(os.getenv('CACHE_L1_MAX_ENTRIES', '10000'))
+
+    # L1 TTL per key prefix (longest matching prefix wins, unmatched keys skip L1).
+    # Kept well below the Redis TTLs as a safety net on top of the pub/sub
+    # invalidation bus. Override with e.g. "categories=600,products:id=5"
+    L1_TTL_POLICIES = {
+        "categories": 300,
+        "products:id": 30,
+        "products:list": 15,
+        "products:filter": 10,
+        "products:missing": 10,
+        "products:suggest": 30,
+    }
+    L1_TTL_POLICIES.update({
+        prefix.strip(): int(ttl)
+        for prefix, ttl in (
+            item.split('=', 1)
+            for item in os.getenv('CACHE_L1_POLICIES', '').split(',')
+            if '=' in item
+        )
+    })
+
+    # Pub/sub channel used to propagate L1 invalidations between workers
+    INVALIDATION_CHANNEL = os.getenv('CACHE_INVALIDATION_CHANNEL', 'cache:invalidation')
+
+    # Namespaces invalidated by bumping a generation counter (single INCR)
+    # instead of deleting every matching key
+    VERSIONED_NAMESPACES = ("products:list", "products:filter", "products:suggest", "categories")
+
+    # Binary codecs per key prefix ("orjson", "msgpack", optionally "+zlib"/"+lz4").
+    # Prefixes without a codec keep the plain JSON text format.
+    # Override with e.g. "products:list=msgpack+zlib,categories=orjson"
+    CODEC_POLICIES = {
+        "products:list": "orjson+lz4",
+        "products:filter": "orjson+lz4",
+    }
+    CODEC_POLICIES.update({
+        prefix.strip(): spec.strip()
+        for prefix, spec in (
+            item.split('=', 1)
+            for item in os.getenv('CACHE_CODEC_POLICIES', '').split(',')
+            if '=' in item
+        )
+    })
+    # Payloads smaller than this are stored uncompressed
+    COMPRESSION_THRESHOLD = int(os.getenv('CACHE_COMPRESSION_THRESHOLD', '1024'))
+
+    # Negative cache of IDs that raised InstanceNotFoundError (crawlers, broken
+    # links): repeated 404s are answered without a DB round trip
+    NEGATIVE_TTL = int(os.getenv('CACHE_NEGATIVE_TTL', '60'))
+
+    # Stale-while-revalidate for hot catalog keys: entries are served this many
+    # seconds past their TTL while one worker refreshes them in the background
+    STALE_TTL = int(os.getenv('CACHE_STALE_TTL', '600'))
+    REFRESH_WORKERS = int(os.getenv('CACHE_REFRESH_WORKERS', '4'))
+
+    # XFetch probabilistic early recompute for the busiest keys (categories
+    # list, first page of product lists). 0 disables it, > 1 refreshes earlier
+    XFETCH_BETA = float(os.getenv('CACHE_XFETCH_BETA', '1.0'))
+
+    # Cache warming of hot catalog keys at startup and after invalidations
+    WARM_ENABLED = os.getenv('CACHE_WARM_ENABLED', 'true').lower() == 'true'
+    # Concurrent warm loads (each holds one DB connection), kept well below the pool
+    WARM_CONCURRENCY = int(os.getenv('CACHE_WARM_CONCURRENCY', '2'))
+    # Invalidations within this many seconds are coalesced into one warm pass
+    WARM_DEBOUNCE_SECONDS = float(os.getenv('CACHE_WARM_DEBOUNCE_SECONDS', '0.5'))
+    # Learned (most requested) targets warmed in addition to the configured ones
+    WARM_LEARNED_TARGETS = int(os.getenv('CACHE_WARM_LEARNED_TARGETS', '20'))
+    # Bounds of the request counts behind the learned targets: distinct targets
+    # counted per worker between warm passes, members kept in the shared Redis
+    # ZSET (lowest scores trimmed) and its TTL (dropped when nothing is recorded)
+    WARM_MAX_COUNTED = int(os.getenv('CACHE_WARM_MAX_COUNTED', '500'))
+    WARM_HOT_SET_SIZE = int(os.getenv('CACHE_WARM_HOT_SET_SIZE', '200'))
+    WARM_HOT_SET_TTL = int(os.getenv('CACHE_WARM_HOT_SET_TTL', str(7 * 24 * 3600)))
+    # Always-warm targets: (loader, params) pairs, loaders are registered by services
+    WARM_TARGETS = (
+        ("categories:list", {"skip": 0, "limit": 100}),
+        ("products:list", {"skip": 0, "limit": 100, "include_inactive": False}),
+        ("products:filter", {"active": True, "skip": 0, "limit": 100}),
+    )
+
+    # Invalidate on DB NOTIFY (triggers from alembic revision 3f9a1c7e52d4), so
+    # writes that bypass the services (seeds, admin SQL) evict the cache too.
+    # PostgreSQL only; one worker of the deployment listens (Redis lock)
+    DB_NOTIFY_ENABLED = os.getenv('CACHE_DB_NOTIFY_ENABLED', 'true').lower() == 'true'
+    DB_NOTIFY_CHANNEL = os.getenv('CACHE_DB_NOTIFY_CHANNEL', 'cache_invalidation')
+    # Leader lock TTL; a dead listener is replaced within this many seconds
+    DB_NOTIFY_LEADER_TTL = int(os.getenv('CACHE_DB_NOTIFY_LEADER_TTL', '30'))
+
+    # Repository query cache (find / find_all of repositories that opt in with
+    # query_cache_ttl). Keys embed per-table versions bumped on every commit
+    QUERY_CACHE_ENABLED = os.getenv('CACHE_QUERY_CACHE_ENABLED', 'true').lower() == 'true'
+    QUERY_CACHE_TTL = int(os.getenv('CACHE_QUERY_CACHE_TTL', '300'))
+
+    # Typeahead (/products/suggest): cached per normalized prefix and limit.
+    # Shorter prefixes match most of the catalog and are not searched
+    SUGGEST_TTL = int(os.getenv('CACHE_SUGGEST_TTL', '120'))
+    SUGGEST_MIN_CHARS = int(os.getenv('SUGGEST_MIN_CHARS', '2'))
+    SUGGEST_DEFAULT_LIMIT = 8
+    SUGGEST_MAX_LIMIT = 20
+
+    RESPONSE_CACHE_ENABLED = os.getenv('RESPONSE_CACHE_ENABLED', 'true').lower() == 'true'
+    # max-age of cached catalog GETs for browsers/nginx. 0 = always revalidate
+    # with If-None-Match (answered with an empty 304 while unchanged)
+    HTTP_MAX_AGE = int(os.getenv('CACHE_HTTP_MAX_AGE', '0'))
+
+
+class CircuitBreakerConfig:
+    """Redis circuit breaker thresholds (cache + rate limiting fail fast while Redis is unhealthy)"""
+    ENABLED = os.getenv('REDIS_BREAKER_ENABLED', 'true').lower() == 'true'
+    # Rolling window of the last N Redis calls; nothing trips before MIN_CALLS
+    WINDOW_SIZE = int(os.getenv('REDIS_BREAKER_WINDOW_SIZE', '50'))
+    MIN_CALLS = int(os.getenv('REDIS_BREAKER_MIN_CALLS', '10'))
+    # Trip when this fraction of the window failed...
+    FAILURE_RATE = float(os.getenv('REDIS_BREAKER_FAILURE_RATE', '0.5'))
+    # ...or took longer than SLOW_CALL_SECONDS
+    SLOW_CALL_SECONDS = float(os.getenv('REDIS_BREAKER_SLOW_CALL_SECONDS', '0.25'))
+    SLOW_CALL_RATE = float(os.getenv('REDIS_BREAKER_SLOW_CALL_RATE', '0.5'))
+    # Seconds to stay open before letting probe calls through (half-open)
+    OPEN_SECONDS = float(os.getenv('REDIS_BREAKER_OPEN_SECONDS', '5'))
+    # Successful probes needed to close again (any failed probe re-opens)
+    HALF_OPEN_PROBES = int(os.getenv('REDIS_BREAKER_HALF_OPEN_PROBES', '3'))
+
 
 class LogConfig:
     """Logging configuration constants"""
@@ -56,6 +181,30 @@ class DatabaseConfig:
     DEFAULT_POOL_RECYCLE = 3600  # 1 hour
 
 
+class ExecutorConfig:
+    """Service dispatch constants (bounded thread pool for sync service calls)"""
+    # 'inline' runs sync service calls on the event loop (legacy behaviour),
+    # 'threadpool' runs them in a dedicated pool sized against the DB pool
+    DISPATCH_MODE = os.getenv('SERVICE_DISPATCH_MODE', 'inline').lower()
+
+    # One thread per pooled DB connection: more threads would only queue on the pool
+    MAX_WORKERS = int(os.getenv('SERVICE_EXECUTOR_WORKERS', os.getenv('DB_POOL_SIZE', '50')))
+
+    # Default concurrency cap per route group (controller tag), so a single
+    # slow group cannot take every worker thread
+    DEFAULT_GROUP_LIMIT = int(os.getenv('SERVICE_EXECUTOR_GROUP_LIMIT', str(max(1, MAX_WORKERS // 2))))
+
+    # Per-group overrides, e.g. "Products=30,Orders=10"
+    GROUP_LIMITS = {
+        name.strip(): int(limit)
+        for name, limit in (
+            item.split('=', 1)
+            for item in os.getenv('SERVICE_EXECUTOR_GROUP_LIMITS', '').split(',')
+            if '=' in item
+        )
+    }
+
+
 class ValidationConfig:
     """Validation-related constants"""
     # Price validation
@@ -1,9 +1,10 @@
 import os
 import logging
-from typing import Generator
+from typing import AsyncGenerator, Generator, Optional
 
 from dotenv import load_dotenv
 from sqlalchemy import create_engine, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, Session
 
 from models.address import AddressModel  # noqa
@@ -47,6 +48,21 @@ DATABASE_URI = os.getenv(
     f"{os.getenv('POSTGRES_DB', 'postgres')}"
 )
 
+# Async database layer (asyncpg driver). When enabled, controllers that provide
+# an async service factory run their queries without blocking the event loop.
+DB_ASYNC_ENABLED = os.getenv('DB_ASYNC_ENABLED', 'false').lower() == 'true'
+
+
+def _to_async_uri(uri: str) -> str:
+    """Translate a sync PostgreSQL URI into its asyncpg equivalent."""
+    for prefix in ("postgresql+psycopg2://", "postgresql://", "postgres://"):
+        if uri.startswith(prefix):
+            return "postgresql+asyncpg://" + uri[len(prefix):]
+    return uri
+
+
+ASYNC_DATABASE_URI = os.getenv("ASYNC_DATABASE_URL", _to_async_uri(DATABASE_URI))
+
 
 # Create engine with optimized connection pooling for high concurrency
 engine = create_engine(
@@ -81,6 +97,75 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+# Async engine is created lazily so asyncpg is only required when it is used
+_async_engine: Optional[AsyncEngine] = None
+AsyncSessionLocal: Optional[async_sessionmaker] = None
+
+
+def get_async_engine() -> AsyncEngine:
+    """
+    Get (and lazily create) the async engine.
+
+    Uses the same pool sizing as the sync engine, so each worker gets the
+    same connection budget regardless of the execution mode.
+    """
+    global _async_engine, AsyncSessionLocal
+
+    if _async_engine is None:
+        _async_engine = create_async_engine(
+            ASYNC_DATABASE_URI,
+            pool_pre_ping=True,
+            pool_size=POOL_SIZE,
+            max_overflow=MAX_OVERFLOW,
+            pool_timeout=POOL_TIMEOUT,
+            pool_recycle=POOL_RECYCLE,
+            echo=False,
+        )
+        AsyncSessionLocal = async_sessionmaker(
+            bind=_async_engine,
+            class_=AsyncSession,
+            autoflush=False,
+            expire_on_commit=False,  # Avoid implicit IO when reading attributes after commit
+        )
+        logger.info("Async database engine created (asyncpg).")
+
+    return _async_engine
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Async dependency injection for database sessions.
+
+    Usage:
+        @app.get("/items")
+        async def get_items(db: AsyncSession = Depends(get_async_db)):
+            result = await db.execute(select(Item))
+            return result.scalars().all()
+    """
+    get_async_engine()
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+def new_async_session() -> AsyncSession:
+    """
+    Standalone async session for work outside a request (e.g. background
+    cache refreshes). The caller owns it: use it as `async with`.
+    """
+    get_async_engine()
+    return AsyncSessionLocal()
+
+
+async def dispose_async_engine():
+    """Dispose the async engine if it was created."""
+    global _async_engine
+
+    if _async_engine is not None:
+        await _async_engine.dispose()
+        _async_engine = None
+        logger.info("Async database engine disposed.")
+
+
 def create_tables():
     """Create all tables in the database."""
     try:
@@ -8,8 +8,12 @@ import os
 import logging
 from typing import Optional
 import redis
+import redis.asyncio as aioredis
 from redis.connection import ConnectionPool
 
+from config.constants import CircuitBreakerConfig
+from utils.circuit_breaker import CircuitBreaker
+
 logger = logging.getLogger(__name__)
 
 
@@ -24,6 +28,11 @@ class RedisConfig:
     _instance: Optional['RedisConfig'] = None
     _client: Optional[redis.Redis] = None
     _pool: Optional[ConnectionPool] = None
+    _async_client: Optional[aioredis.Redis] = None
+    _async_pool: Optional[aioredis.ConnectionPool] = None
+    # Binary-safe clients (decode_responses=False) for codec-encoded cache values
+    _binary_client: Optional[redis.Redis] = None
+    _async_binary_client: Optional[aioredis.Redis] = None
 
     def __new__(cls):
         if cls._instance is None:
@@ -34,27 +43,30 @@ class RedisConfig:
         if self._client is None:
             self._initialize_client()
 
+    def _connection_kwargs(self, decode_responses: bool = True) -> dict:
+        """Connection settings shared by the sync and asyncio pools"""
+        return {
+            'host': os.getenv('REDIS_HOST', 'localhost'),
+            'port': int(os.getenv('REDIS_PORT', '6379')),
+            'db': int(os.getenv('REDIS_DB', '0')),
+            'password': os.getenv('REDIS_PASSWORD', None),
+            'max_connections': int(os.getenv('REDIS_MAX_CONNECTIONS', '50')),
+            'decode_responses': decode_responses,  # Auto-decode bytes to str
+            'socket_timeout': float(os.getenv('REDIS_SOCKET_TIMEOUT', '5')),
+            'socket_connect_timeout': float(os.getenv('REDIS_SOCKET_CONNECT_TIMEOUT', '5')),
+            'retry_on_timeout': True,
+        }
+
     def _initialize_client(self):
         """Initialize Redis client with connection pool"""
-        redis_host = os.getenv('REDIS_HOST', 'localhost')
-        redis_port = int(os.getenv('REDIS_PORT', '6379'))
-        redis_db = int(os.getenv('REDIS_DB', '0'))
-        redis_password = os.getenv('REDIS_PASSWORD', None)
-        max_connections = int(os.getenv('REDIS_MAX_CONNECTIONS', '50'))
+        connection_kwargs = self._connection_kwargs()
+        redis_host = connection_kwargs['host']
+        redis_port = connection_kwargs['port']
+        redis_db = connection_kwargs['db']
 
         try:
             # Create connection pool
-            self._pool = ConnectionPool(
-                host=redis_host,
-                port=redis_port,
-                db=redis_db,
-                password=redis_password,
-                max_connections=max_connections,
-                decode_responses=True,  # Auto-decode bytes to str
-                socket_timeout=5,
-                socket_connect_timeout=5,
-                retry_on_timeout=True
-            )
+            self._pool = ConnectionPool(**connection_kwargs)
 
             # Create Redis client
             self._client = redis.Redis(connection_pool=self._pool)
@@ -80,6 +92,55 @@ class RedisConfig:
         """
         return self._client
 
+    def get_async_client(self) -> Optional[aioredis.Redis]:
+        """
+        Get asyncio Redis client instance (redis.asyncio)
+
+        The asyncio pool is created lazily on first use and only when the
+        startup connectivity check succeeded, mirroring get_client().
+
+        Returns:
+            Async Redis client or None if Redis is unavailable
+        """
+        if self._client is None:
+            return None
+
+        if self._async_client is None:
+            self._async_pool = aioredis.ConnectionPool(**self._connection_kwargs())
+            self._async_client = aioredis.Redis(connection_pool=self._async_pool)
+            logger.info("✅ Async Redis connection pool created")
+
+        return self._async_client
+
+    def get_binary_client(self) -> Optional[redis.Redis]:
+        """
+        Get a Redis client that returns raw bytes (decode_responses=False)
+
+        Used for cache values written by a binary codec (orjson, msgpack,
+        compressed payloads). Created lazily, only when Redis is available.
+        """
+        if self._client is None:
+            return None
+
+        if self._binary_client is None:
+            self._binary_client = redis.Redis(
+                connection_pool=ConnectionPool(**self._connection_kwargs(decode_responses=False))
+            )
+
+        return self._binary_client
+
+    def get_async_binary_client(self) -> Optional[aioredis.Redis]:
+        """asyncio flavour of get_binary_client()"""
+        if self._client is None:
+            return None
+
+        if self._async_binary_client is None:
+            self._async_binary_client = aioredis.Redis(
+                connection_pool=aioredis.ConnectionPool(**self._connection_kwargs(decode_responses=False))
+            )
+
+        return self._async_binary_client
+
     def is_available(self) -> bool:
         """
         Check if Redis is available
@@ -106,10 +167,44 @@ class RedisConfig:
             self._pool.disconnect()
             logger.info("Redis connection pool disconnected")
 
+        if self._binary_client:
+            self._binary_client.connection_pool.disconnect()
+            self._binary_client = None
+
+    async def aclose(self):
+        """Close asyncio Redis client and pool"""
+        if self._async_client:
+            await self._async_client.close()
+            self._async_client = None
+
+        if self._async_pool:
+            await self._async_pool.disconnect()
+            self._async_pool = None
+            logger.info("Async Redis connection pool disconnected")
+
+        if self._async_binary_client:
+            await self._async_binary_client.connection_pool.disconnect()
+            self._async_binary_client = None
+
 
 # Global Redis instance
 redis_config = RedisConfig()
 
+# Shared by CacheService and the rate limiters: while open, Redis is skipped
+# (cache -> direct DB, rate limiting -> fail open) instead of timing out
+redis_breaker = CircuitBreaker(
+    "redis",
+    window_size=CircuitBreakerConfig.WINDOW_SIZE,
+    min_calls=CircuitBreakerConfig.MIN_CALLS,
+    failure_rate=CircuitBreakerConfig.FAILURE_RATE,
+    slow_call_seconds=CircuitBreakerConfig.SLOW_CALL_SECONDS,
+    slow_call_rate=CircuitBreakerConfig.SLOW_CALL_RATE,
+    open_seconds=CircuitBreakerConfig.OPEN_SECONDS,
+    half_open_probes=CircuitBreakerConfig.HALF_OPEN_PROBES,
+    failure_exceptions=(redis.RedisError, OSError),
+    enabled=CircuitBreakerConfig.ENABLED,
+)
+
 
 def get_redis_client() -> Optional[redis.Redis]:
     """
@@ -121,6 +216,26 @@ def get_redis_client() -> Optional[redis.Redis]:
     return redis_config.get_client()
 
 
+def get_async_redis_client() -> Optional[aioredis.Redis]:
+    """
+    Dependency injection function for async code paths
+
+    Returns:
+        Async Redis client instance or None
+    """
+    return redis_config.get_async_client()
+
+
+def get_binary_redis_client() -> Optional[redis.Redis]:
+    """Redis client returning raw bytes (for codec-encoded cache values)"""
+    return redis_config.get_binary_client()
+
+
+def get_async_binary_redis_client() -> Optional[aioredis.Redis]:
+    """Async Redis client returning raw bytes (for codec-encoded cache values)"""
+    return redis_config.get_async_binary_client()
+
+
 def check_redis_connection() -> bool:
     """
     Check if Redis is available
@@ -1,8 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException
+import inspect
+from fastapi import APIRouter, Depends, Header, HTTPException, Response
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
-from config.database import get_db
+from config.constants import CacheConfig, PaginationConfig
+from config.database import DB_ASYNC_ENABLED, get_async_db, get_db
+from controllers.response_cache import ResponseCache
 from repositories.base_repository_impl import InstanceNotFoundError
-from typing import Type, Callable, Optional
+from typing import Any, Callable, Dict, List, Optional, Type
+from utils.cursor_pagination import ID_ASC, NEXT_CURSOR_HEADER, InvalidCursorError, SortKey, next_cursor
+from utils.service_executor import is_threadpool_dispatch, service_executor
 
 
 class BaseControllerImpl:
@@ -12,6 +18,12 @@ class BaseControllerImpl:
     - schema → respuesta
     - create_schema → POST
     - update_schema → PUT
+    - async_service_factory → servicio sobre AsyncSession (si DB_ASYNC_ENABLED)
+    - cache_responses → GET por ID / lista servidos desde ResponseCache, con
+      ETag / If-None-Match → 304 (el servicio debe exponer item_cache_key / list_cache_key)
+
+    Las listas aceptan `cursor` (paginación keyset) además de skip/limit y
+    devuelven el cursor de la página siguiente en el header X-Next-Cursor.
     """
 
     def __init__(
@@ -20,24 +32,75 @@ class BaseControllerImpl:
         service_factory: Callable,
         create_schema: Optional[Type] = None,
         update_schema: Optional[Type] = None,
-        tags=None
+        tags=None,
+        async_service_factory: Optional[Callable] = None,
+        cache_responses: bool = False
     ):
         self.schema = schema
         self.create_schema = create_schema or schema
         self.update_schema = update_schema or schema
-        self.service_factory = service_factory
         self.tags = tags or []
+        # Route group used for per-group concurrency caps in the service executor
+        self.route_group = self.tags[0] if self.tags else type(self).__name__
+
+        # Async DB layer is opt-in per deployment (DB_ASYNC_ENABLED) and per controller
+        self.use_async_db = DB_ASYNC_ENABLED and async_service_factory is not None
+        self.service_factory = async_service_factory if self.use_async_db else service_factory
+        self.db_dependency = get_async_db if self.use_async_db else get_db
+
+        # Serialized GET responses (opt-in per controller, global kill switch)
+        self.response_cache = ResponseCache() if cache_responses and CacheConfig.RESPONSE_CACHE_ENABLED else None
+        self.item_adapter = TypeAdapter(self.schema)
+        self.list_adapter = TypeAdapter(list[self.schema])
+
         self.router = APIRouter(tags=self.tags)
         self._register_routes()
 
+    async def _call_service(self, method: Callable, *args, **kwargs) -> Any:
+        """
+        Invoke a service method from a route handler.
+
+        - Async services (AsyncSession) are awaited directly.
+        - Sync services run in the bounded service executor when
+          SERVICE_DISPATCH_MODE=threadpool, or inline otherwise.
+        """
+        if inspect.iscoroutinefunction(method):
+            return await method(*args, **kwargs)
+
+        if is_threadpool_dispatch():
+            return await service_executor.run(self.route_group, method, *args, **kwargs)
+
+        result = method(*args, **kwargs)
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+
+    @staticmethod
+    def page_headers(items: List[Any], key: SortKey, limit: int) -> Dict[str, str]:
+        """X-Next-Cursor header for a page of results (none on the last page)"""
+        token = next_cursor(items, key, min(limit, PaginationConfig.MAX_LIMIT))
+        return {NEXT_CURSOR_HEADER: token} if token else {}
+
     def _register_routes(self):
         # GET por ID
         @self.router.get("/id/{id_key}", response_model=self.schema)
-        async def get_by_id(id_key: int, db: Session = Depends(get_db)):
+        async def get_by_id(
+            id_key: int,
+            db: Session = Depends(self.db_dependency),
+            if_none_match: Optional[str] = Header(None)
+        ):
             try:
                 service = self.service_factory(db)
+                if self.response_cache is not None:
+                    return await self.response_cache.get_or_render(
+                        service.item_cache_key(id_key),
+                        lambda: self._call_service(service.get_one, id_key),
+                        self.item_adapter,
+                        getattr(service, "cache_ttl", None),
+                        if_none_match
+                    )
                 # ✅ CORRECCIÓN: Usamos .get_one() (el nombre correcto en tus servicios)
-                return service.get_one(id_key) 
+                return await self._call_service(service.get_one, id_key)
             except InstanceNotFoundError:
                 raise HTTPException(404, f"Entidad con ID {id_key} no encontrada")
             except Exception as e:
@@ -45,28 +108,52 @@ class BaseControllerImpl:
 
         # GET lista
         @self.router.get("/", response_model=list[self.schema])
-        async def get_all(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+        async def get_all(
+            response: Response,
+            skip: int = 0,
+            limit: int = 100,
+            cursor: Optional[str] = None,
+            db: Session = Depends(self.db_dependency),
+            if_none_match: Optional[str] = Header(None)
+        ):
             try:
                 service = self.service_factory(db)
-                return service.get_all(skip=skip, limit=limit)
+                # Servicios sin soporte de cursor siguen funcionando con skip/limit
+                page = {"cursor": cursor} if cursor else {}
+                produce = lambda: self._call_service(service.get_all, skip=skip, limit=limit, **page)
+                page_headers = lambda items: self.page_headers(items, ID_ASC, limit)
+                if self.response_cache is not None:
+                    return await self.response_cache.get_or_render(
+                        service.list_cache_key(skip, limit, **page),
+                        produce,
+                        self.list_adapter,
+                        getattr(service, "cache_ttl", None),
+                        if_none_match,
+                        headers=page_headers
+                    )
+                items = await produce()
+                response.headers.update(page_headers(items))
+                return items
+            except InvalidCursorError as e:
+                raise HTTPException(400, str(e))
             except Exception as e:
                 raise HTTPException(500, f"Error al obtener entidades: {str(e)}")
 
         # POST crear
         @self.router.post("/", response_model=self.schema)
-        async def create(entity: self.create_schema, db: Session = Depends(get_db)):
+        async def create(entity: self.create_schema, db: Session = Depends(self.db_dependency)):
             try:
                 service = self.service_factory(db)
-                return service.save(entity)
+                return await self._call_service(service.save, entity)
             except Exception as e:
                 raise HTTPException(400, f"Error al crear: {str(e)}")
 
         # PUT actualizar
         @self.router.put("/id/{id_key}", response_model=self.schema)
-        async def update(id_key: int, entity: self.update_schema, db: Session = Depends(get_db)):
+        async def update(id_key: int, entity: self.update_schema, db: Session = Depends(self.db_dependency)):
             try:
                 service = self.service_factory(db)
-                return service.update(id_key, entity)
+                return await self._call_service(service.update, id_key, entity)
             except InstanceNotFoundError:
                 raise HTTPException(404, f"Entidad con ID {id_key} no encontrada")
             except Exception as e:
@@ -74,12 +161,12 @@ class BaseControllerImpl:
 
         # DELETE eliminar
         @self.router.delete("/id/{id_key}")
-        async def delete(id_key: int, db: Session = Depends(get_db)):
+        async def delete(id_key: int, db: Session = Depends(self.db_dependency)):
             try:
                 service = self.service_factory(db)
-                service.delete(id_key)
+                await self._call_service(service.delete, id_key)
                 return {"deleted": True}
             except InstanceNotFoundError:
                 raise HTTPException(404, f"Entidad con ID {id_key} no encontrada")
             except Exception as e:
-                raise HTTPException(400, f"Error al eliminar: {str(e)}")
\ No newline at end of file
+                raise HTTPException(400, f"Error al eliminar: {str(e)}")
@@ -1,7 +1,7 @@
 """Category controller with proper dependency injection."""
 from controllers.base_controller_impl import BaseControllerImpl
 from schemas.category_schema import CategorySchema
-from services.category_service import CategoryService
+from services.category_service import AsyncCategoryService, CategoryService
 
 
 class CategoryController(BaseControllerImpl):
@@ -11,5 +11,7 @@ class CategoryController(BaseControllerImpl):
         super().__init__(
             schema=CategorySchema,
             service_factory=lambda db: CategoryService(db),
-            tags=["Categories"]
+            async_service_factory=lambda db: AsyncCategoryService(db),
+            tags=["Categories"],
+            cache_responses=True
         )
\ No newline at end of file
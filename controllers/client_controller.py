@@ -33,7 +33,7 @@ class ClientController(BaseControllerImpl):
         @self.router.post("/login", response_model=LoginResponse)
         async def login(request: LoginRequest, db: Session = Depends(get_db)):
             service = self.service_factory(db)
-            client = service.authenticate(request.email, request.password)
+            client = await self._call_service(service.authenticate, request.email, request.password)
             
             if not client:
                 raise HTTPException(status_code=401, detail="Invalid credentials")
@@ -7,12 +7,17 @@ connection pool status, and threshold-based warnings.
 Thresholds:
 - DB Pool Utilization: Warning at 70%, Critical at 90%
 - DB Latency: Warning at 100ms, Critical at 500ms
-- Redis: Binary (up/down)
+- Redis: Binary (up/down); degraded while the Redis circuit breaker is open
 """
 import time
 from fastapi import APIRouter
 from config.database import check_connection, engine
-from config.redis_config import check_redis_connection
+from config.redis_config import check_redis_connection, redis_breaker
+from repositories.query_cache import query_cache
+from services.cache_service import cache_service
+from services.cache_warmer import cache_warmer
+from services.db_change_listener import db_change_listener
+from utils.service_executor import service_executor
 from datetime import datetime
 
 router = APIRouter()
@@ -60,6 +65,7 @@ def health_check():
     - Database connection (with latency thresholds)
     - Redis cache
     - Database connection pool metrics (with utilization thresholds)
+    - Service executor queue metrics (per route group)
     - System timestamp
     - Overall health level (healthy/warning/degraded/critical)
 
@@ -100,14 +106,20 @@ def health_check():
         }
     }
 
-    # Redis health check
-    redis_status = check_redis_connection()
+    # Redis health check (no ping while the circuit is open: it would just time out)
+    breaker_open = redis_breaker.is_open()
+    redis_status = False if breaker_open else check_redis_connection()
     redis_health = "healthy" if redis_status else "degraded"
     component_statuses.append(redis_health)
 
     checks["redis"] = {
-        "status": "up" if redis_status else "down",
-        "health": redis_health
+        "status": "circuit_open" if breaker_open else ("up" if redis_status else "down"),
+        "health": redis_health,
+        "circuit_breaker": redis_breaker.stats(),
+        "cache_tiers": cache_service.stats(),
+        "cache_warmer": cache_warmer.stats(),
+        "db_change_listener": db_change_listener.stats(),
+        "query_cache": query_cache.stats()
     }
 
     # Database connection pool metrics with utilization thresholds
@@ -149,6 +161,9 @@ def health_check():
         }
         component_statuses.append("critical")
 
+    # Service executor (bounded thread pool) queue metrics - informational
+    checks["service_executor"] = service_executor.metrics()
+
     # Overall status based on all components
     overall_status = evaluate_health_level(*component_statuses)
 
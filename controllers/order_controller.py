@@ -47,7 +47,9 @@ class OrderController(BaseControllerImpl):
                 # Usamos el repositorio directamente para actualizar.
                 # service.repository.update(id, cambios) se encarga de buscar, 
                 # actualizar el modelo, hacer commit y devolver el schema actualizado.
-                updated_order = service.repository.update(id, {"status": new_status})
+                updated_order = await self._call_service(
+                    service.repository.update, id, {"status": new_status}
+                )
                 
                 return updated_order
 
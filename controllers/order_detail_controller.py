@@ -46,4 +46,4 @@ class OrderDetailController(BaseControllerImpl):
             to prevent order spam and abuse.
             """
             service = self.service_factory(db)
-            return service.save(schema_in)
\ No newline at end of file
+            return await self._call_service(service.save, schema_in)
\ No newline at end of file
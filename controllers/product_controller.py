@@ -2,13 +2,24 @@ import shutil
 import os
 import uuid
 from typing import List, Optional
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
-from fastapi import Depends, Query, UploadFile, File, HTTPException
+from fastapi import Depends, Header, Query, Response, UploadFile, File, HTTPException
+from config.constants import CacheConfig, PaginationConfig
+from config.database import get_db
 from controllers.base_controller_impl import BaseControllerImpl
+from repositories.base_repository_impl import InstanceNotFoundError
+from repositories.product_repository import product_sort_key
+from repositories.review_repository import NEWEST_REVIEWS
 # Importamos los esquemas específicos
-from schemas.product_schema import ProductSchema, ProductCreateSchema, ProductUpdateSchema
-from services.product_service import ProductService
-from config.database import get_db
+from schemas.product_schema import (
+    ProductSchema, ProductCreateSchema, ProductUpdateSchema, ProductListSchema, ProductSuggestionSchema,
+    ProductSummarySchema
+)
+from schemas.review_schema import ReviewSchema
+from services.product_service import AsyncProductService, ProductService
+from services.review_service import ReviewService
+from utils.cursor_pagination import ID_ASC, InvalidCursorError
 
 class ProductController(BaseControllerImpl):
     def __init__(self):
@@ -17,7 +28,9 @@ class ProductController(BaseControllerImpl):
             create_schema=ProductCreateSchema, # Para CREAR (POST) ✅
             update_schema=ProductUpdateSchema, # Para EDITAR (PUT) ✅
             service_factory=lambda db: ProductService(db),
-            tags=["Products"]
+            async_service_factory=lambda db: AsyncProductService(db),
+            tags=["Products"],
+            cache_responses=True
         )
         
         # ⚠️ CORRECCIÓN CLAVE:
@@ -27,25 +40,81 @@ class ProductController(BaseControllerImpl):
             if not (r.path == "/" and "GET" in r.methods)
         ]
 
+        # Listados con agregados de rating, sin la lista de reviews (solo en el detalle)
+        self.list_adapter = TypeAdapter(list[ProductSummarySchema])
+        self.grid_adapter = TypeAdapter(list[ProductListSchema])
+
         self._register_filter_route()
+        self._register_suggest_route()
+        self._register_grid_route()
+        self._register_reviews_route()
+        self._register_batch_route()
         self._register_upload_route()
         self._register_custom_get_all() # Ahora sí, registramos la nuestra
 
     # ✅ GET Personalizado para soportar el parámetro include_inactive
     def _register_custom_get_all(self):
-        @self.router.get("/", response_model=List[ProductSchema])
+        @self.router.get("/", response_model=List[ProductSummarySchema])
         async def get_all(
+            response: Response,
             skip: int = 0, 
             limit: int = 100, 
             include_inactive: bool = False, # Nuevo parámetro
-            db: Session = Depends(get_db)
+            cursor: Optional[str] = None, # Paginación keyset (X-Next-Cursor de la página anterior)
+            db: Session = Depends(self.db_dependency),
+            if_none_match: Optional[str] = Header(None)
         ):
             service = self.service_factory(db)
-            return service.get_all(skip=skip, limit=limit, include_inactive=include_inactive)
+            produce = lambda: self._call_service(
+                service.get_all, skip=skip, limit=limit, include_inactive=include_inactive, cursor=cursor
+            )
+            page_headers = lambda items: self.page_headers(items, ID_ASC, limit)
+            try:
+                if self.response_cache is None:
+                    items = await produce()
+                    response.headers.update(page_headers(items))
+                    return items
+                return await self.response_cache.get_or_render(
+                    service.list_cache_key(skip, limit, include_inactive, cursor), produce, self.list_adapter,
+                    if_none_match=if_none_match, headers=page_headers
+                )
+            except InvalidCursorError as e:
+                raise HTTPException(400, detail=str(e))
+
+    # ✅ Listado liviano para grillas: columnas planas vía Core, sin category ni reviews
+    def _register_grid_route(self):
+        @self.router.get("/grid", response_model=List[ProductListSchema])
+        async def get_grid(
+            response: Response,
+            skip: int = 0,
+            limit: int = 100,
+            include_inactive: bool = False,
+            cursor: Optional[str] = None,
+            db: Session = Depends(self.db_dependency),
+            if_none_match: Optional[str] = Header(None)
+        ):
+            service = self.service_factory(db)
+            produce = lambda: self._call_service(
+                service.get_all, skip=skip, limit=limit, include_inactive=include_inactive,
+                cursor=cursor, lean=True
+            )
+            page_headers = lambda items: self.page_headers(items, ID_ASC, limit)
+            try:
+                if self.response_cache is None:
+                    items = await produce()
+                    response.headers.update(page_headers(items))
+                    return items
+                return await self.response_cache.get_or_render(
+                    service.list_cache_key(skip, limit, include_inactive, cursor, lean=True), produce,
+                    self.grid_adapter, if_none_match=if_none_match, headers=page_headers
+                )
+            except InvalidCursorError as e:
+                raise HTTPException(400, detail=str(e))
 
     def _register_filter_route(self):
-        @self.router.get("/filter", response_model=List[ProductSchema])
+        @self.router.get("/filter", response_model=List[ProductSummarySchema])
         async def filter_products(
+            response: Response,
             search: Optional[str] = None,
             category_id: Optional[int] = None,
             min_price: Optional[float] = None,
@@ -55,10 +124,13 @@ class ProductController(BaseControllerImpl):
             sort_by: Optional[str] = None,
             skip: int = 0,
             limit: int = 100,
-            db: Session = Depends(get_db)
+            cursor: Optional[str] = None,
+            db: Session = Depends(self.db_dependency),
+            if_none_match: Optional[str] = Header(None)
         ):
             service = self.service_factory(db)
-            return service.filter_products(
+            produce = lambda: self._call_service(
+                service.filter_products,
                 search=search,
                 category_id=category_id,
                 min_price=min_price,
@@ -67,8 +139,72 @@ class ProductController(BaseControllerImpl):
                 active=active,
                 sort_by=sort_by,
                 skip=skip,
-                limit=limit
+                limit=limit,
+                cursor=cursor
             )
+            page_headers = lambda items: self.page_headers(items, product_sort_key(sort_by, search), limit)
+            try:
+                if self.response_cache is None:
+                    items = await produce()
+                    response.headers.update(page_headers(items))
+                    return items
+                return await self.response_cache.get_or_render(
+                    service.filter_cache_key(
+                        search, category_id, min_price, max_price,
+                        in_stock_only, active, sort_by, skip, limit, cursor
+                    ),
+                    produce,
+                    self.list_adapter,
+                    if_none_match=if_none_match,
+                    headers=page_headers
+                )
+            except InvalidCursorError as e:
+                raise HTTPException(400, detail=str(e))
+
+    # ✅ Typeahead del buscador: solo id/nombre/precio/imagen, cacheado por prefijo
+    def _register_suggest_route(self):
+        @self.router.get("/suggest", response_model=List[ProductSuggestionSchema])
+        async def suggest(
+            q: str = Query(..., min_length=1, max_length=100),
+            limit: int = Query(CacheConfig.SUGGEST_DEFAULT_LIMIT, ge=1, le=CacheConfig.SUGGEST_MAX_LIMIT),
+            db: Session = Depends(self.db_dependency)
+        ):
+            service = self.service_factory(db)
+            return await self._call_service(service.suggest, q, limit)
+
+    # ✅ Reviews de un producto, paginadas (más nuevas primero)
+    def _register_reviews_route(self):
+        @self.router.get("/id/{id_key}/reviews", response_model=List[ReviewSchema])
+        async def get_reviews(
+            id_key: int,
+            response: Response,
+            skip: int = 0,
+            limit: int = Query(20, ge=1, le=PaginationConfig.MAX_LIMIT),
+            cursor: Optional[str] = None,
+            # ReviewService solo existe sobre Session síncrona
+            db: Session = Depends(get_db)
+        ):
+            service = ReviewService(db)
+            try:
+                reviews = await self._call_service(service.get_by_product, id_key, skip, limit, cursor)
+            except InstanceNotFoundError:
+                raise HTTPException(404, detail=f"Producto con ID {id_key} no encontrado")
+            except InvalidCursorError as e:
+                raise HTTPException(400, detail=str(e))
+            response.headers.update(self.page_headers(reviews, NEWEST_REVIEWS, limit))
+            return reviews
+
+    # ✅ GET por lote de IDs (hidratación de carrito / historial de pedidos)
+    def _register_batch_route(self):
+        @self.router.get("/batch", response_model=List[ProductSchema])
+        async def get_many(
+            ids: List[int] = Query(..., description="IDs de producto (?ids=1&ids=2)"),
+            db: Session = Depends(self.db_dependency)
+        ):
+            if len(ids) > PaginationConfig.MAX_LIMIT:
+                raise HTTPException(400, detail=f"Máximo {PaginationConfig.MAX_LIMIT} IDs por lote")
+            service = self.service_factory(db)
+            return await self._call_service(service.get_many, ids)
 
     def _register_upload_route(self):
         @self.router.post("/upload_image")
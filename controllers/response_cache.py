@@ -0,0 +1,140 @@
+"""
+Response Cache Module
+
+Route-level cache for GET endpoints that stores the final JSON bytes of a
+response (plus its ETag), so a hit is answered without json.loads, Pydantic
+re-validation or response_model re-serialization.
+
+Entries are stored next to the service data cache entry they were rendered
+from (see CacheService.build_response_key), so every existing invalidation
+path (namespace generations, item deletes, L1 bus) also drops the response.
+
+Conditional GETs: the strong ETag (hash of the body) is also stored alone
+under CacheService.build_etag_key, so a matching If-None-Match is answered
+with an empty 304 after reading only that small key - no DB access and no
+body read or decoding. Responses carry Cache-Control / Vary for nginx and
+browsers, plus any per-result headers (e.g. X-Next-Cursor) stored with the body.
+"""
+import hashlib
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+from config.constants import CacheConfig
+from services.cache_service import CacheService, cache_service
+from utils.logging_utils import get_sanitized_logger
+
+logger = get_sanitized_logger(__name__)
+
+JSON_MEDIA_TYPE = "application/json"
+
+
+class ResponseCache:
+    """
+    Stores pre-serialized responses in the cache
+
+    Usage:
+        response = await response_cache.get_or_render(
+            cache_key, lambda: self._call_service(service.get_all), adapter
+        )
+    """
+
+    def __init__(self, cache: CacheService = cache_service, max_age: int = CacheConfig.HTTP_MAX_AGE):
+        self.cache = cache
+        self.max_age = max_age
+
+    @staticmethod
+    def compute_etag(body: bytes) -> str:
+        return f'"{hashlib.sha1(body).hexdigest()}"'
+
+    @staticmethod
+    def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+        """If-None-Match check (weak comparison, as RFC 9110 requires for it)"""
+        if not if_none_match:
+            return False
+        if if_none_match.strip() == "*":
+            return True
+        return etag in {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+
+    def cache_headers(self, etag: str) -> dict:
+        return {
+            "ETag": etag,
+            "Cache-Control": f"public, max-age={self.max_age}, must-revalidate",
+            "Vary": "Accept-Encoding",
+        }
+
+    def build_response(self, body: bytes, etag: str, media_type: str = JSON_MEDIA_TYPE,
+                       headers: Optional[Dict[str, str]] = None) -> Response:
+        return Response(content=body, media_type=media_type, headers={**(headers or {}), **self.cache_headers(etag)})
+
+    def not_modified(self, etag: str) -> Response:
+        return Response(status_code=304, headers=self.cache_headers(etag))
+
+    async def get(self, data_key: str) -> Optional[Response]:
+        """Cached response for a data key, or None on miss"""
+        entry = await self.cache.aget(self.cache.build_response_key(data_key))
+        if not isinstance(entry, dict) or "body" not in entry:
+            return None
+
+        logger.debug(f"Response cache HIT: {data_key}")
+        return self.build_response(
+            entry["body"].encode("utf-8"),
+            entry["etag"],
+            entry.get("media_type", JSON_MEDIA_TYPE),
+            entry.get("headers")
+        )
+
+    async def set(self, data_key: str, body: bytes, ttl: Optional[int] = None,
+                  headers: Optional[Dict[str, str]] = None) -> Response:
+        """Store serialized bytes (and extra headers) and return the response to send"""
+        etag = self.compute_etag(body)
+        entry = {"etag": etag, "media_type": JSON_MEDIA_TYPE, "body": body.decode("utf-8")}
+        if headers:
+            entry["headers"] = headers
+        await self.cache.aset_many({
+            self.cache.build_response_key(data_key): entry,
+            self.cache.build_etag_key(data_key): {"etag": etag},
+        }, ttl)
+        return self.build_response(body, etag, headers=headers)
+
+    async def get_etag(self, data_key: str) -> Optional[str]:
+        """ETag of the cached response, without reading the body"""
+        entry = await self.cache.aget(self.cache.build_etag_key(data_key))
+        return entry.get("etag") if isinstance(entry, dict) else None
+
+    async def get_or_render(
+        self,
+        data_key: str,
+        producer: Callable[[], Awaitable[Any]],
+        adapter: TypeAdapter,
+        ttl: Optional[int] = None,
+        if_none_match: Optional[str] = None,
+        headers: Optional[Callable[[Any], Dict[str, str]]] = None
+    ) -> Response:
+        """
+        Return the cached response or build it from the producer's result
+
+        Args:
+            data_key: Service data cache key the response is derived from
+            producer: Coroutine factory returning the route result (schemas)
+            adapter: TypeAdapter of the route's response_model
+            ttl: Same TTL as the data cache entry
+            if_none_match: Request's If-None-Match header; a match gives a 304
+            headers: headers(result) -> extra response headers, cached with the body
+        """
+        if if_none_match:
+            etag = await self.get_etag(data_key)
+            if etag is not None and self.etag_matches(if_none_match, etag):
+                logger.debug(f"Conditional GET 304: {data_key}")
+                return self.not_modified(etag)
+
+        response = await self.get(data_key)
+        if response is None:
+            result = await producer()
+            response = await self.set(data_key, adapter.dump_json(result), ttl, headers(result) if headers else None)
+
+        # The ETag key may have expired or been evicted alone: still answer 304
+        if self.etag_matches(if_none_match, response.headers["ETag"]):
+            return self.not_modified(response.headers["ETag"])
+        return response
@@ -30,9 +30,16 @@ from controllers.health_check import router as health_check_controller
 from controllers.cart_controller import CartController
 
 # ---- CONFIG ----
-from config.database import create_tables, engine
+from config.database import create_tables, dispose_async_engine, engine
 from config.redis_config import redis_config, check_redis_connection
 
+from services.cache_service import cache_service
+from services.cache_warmer import cache_warmer
+from services.db_change_listener import db_change_listener
+from config.constants import CacheConfig
+from utils.cursor_pagination import NEXT_CURSOR_HEADER
+from utils.service_executor import service_executor
+
 # ---- MIDDLEWARE ----
 from middleware.rate_limiter import RateLimiterMiddleware
 from middleware.request_id_middleware import RequestIDMiddleware
@@ -97,6 +104,8 @@ def create_fastapi_app() -> FastAPI:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        # Infinite scroll reads the next page cursor from this header
+        expose_headers=[NEXT_CURSOR_HEADER],
     )
     logger.info("✅ CORS enabled")
 
@@ -113,6 +122,14 @@ def create_fastapi_app() -> FastAPI:
         create_tables()
         if check_redis_connection():
             logger.info("✅ Redis cache available")
+            # Evict L1 entries when other workers invalidate (no-op if L1 is off)
+            cache_service.start_invalidation_listener()
+            # Repopulate hot catalog keys now and after every invalidation
+            if CacheConfig.WARM_ENABLED:
+                cache_warmer.start()
+            # Evict on writes made outside the app (NOTIFY triggers, PostgreSQL only)
+            if CacheConfig.DB_NOTIFY_ENABLED and engine.dialect.name == "postgresql":
+                db_change_listener.start()
         else:
             logger.warning("⚠️ Redis NOT available")
 
@@ -121,12 +138,22 @@ def create_fastapi_app() -> FastAPI:
         logger.info("👋 Shutting down API...")
 
         try:
+            cache_warmer.stop()
+            db_change_listener.stop()
+            cache_service.stop_invalidation_listener()
             redis_config.close()
+            await redis_config.aclose()
         except Exception as e:
             logger.error(f"❌ Error closing Redis: {e}")
 
+        try:
+            service_executor.shutdown(wait=False)
+        except Exception as e:
+            logger.error(f"❌ Error shutting down service executor: {e}")
+
         try:
             engine.dispose()
+            await dispose_async_engine()
         except Exception as e:
             logger.error(f"❌ Error disposing DB engine: {e}")
 
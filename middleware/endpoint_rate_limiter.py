@@ -9,7 +9,7 @@ import logging
 import functools
 from typing import Callable
 from fastapi import Request, HTTPException, status
-from config.redis_config import get_redis_client
+from config.redis_config import get_async_redis_client, redis_breaker
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +25,7 @@ class EndpointRateLimiter:
             ...
 
     This allows 10 order creations per 60 seconds per IP address.
+    Fails open while Redis is unavailable or its circuit breaker is open.
     """
 
     def __init__(self, calls: int, period: int):
@@ -37,7 +38,8 @@ class EndpointRateLimiter:
         """
         self.calls = calls
         self.period = period
-        self.redis_client = get_redis_client()
+        self.redis_client = get_async_redis_client()
+        self.breaker = redis_breaker
 
     def __call__(self, func: Callable) -> Callable:
         """
@@ -63,23 +65,30 @@ class EndpointRateLimiter:
                 logger.warning("Redis not available - endpoint rate limiting disabled")
                 return await func(request, *args, **kwargs)
 
+            # Circuit open: skip the check instead of waiting on a failing Redis
+            if not self.breaker.allow():
+                return await func(request, *args, **kwargs)
+
             try:
                 # Get current request count
-                current = self.redis_client.get(key)
+                with self.breaker.track():
+                    current = await self.redis_client.get(key)
 
                 if current is None:
                     # First request in this period
                     pipe = self.redis_client.pipeline()
                     pipe.set(key, 1)
                     pipe.expire(key, self.period)
-                    pipe.execute()
+                    with self.breaker.track():
+                        await pipe.execute()
                     remaining = self.calls - 1
                 else:
                     current = int(current)
 
                     if current >= self.calls:
                         # Rate limit exceeded
-                        ttl = self.redis_client.ttl(key)
+                        with self.breaker.track():
+                            ttl = await self.redis_client.ttl(key)
                         logger.warning(
                             f"Endpoint rate limit exceeded for {client_ip} "
                             f"on {endpoint_path}: {current}/{self.calls}"
@@ -98,7 +107,8 @@ class EndpointRateLimiter:
                         )
 
                     # Increment counter
-                    self.redis_client.incr(key)
+                    with self.breaker.track():
+                        await self.redis_client.incr(key)
                     remaining = self.calls - current - 1
 
                 # Execute the endpoint
@@ -6,37 +6,42 @@ per client IP address using Redis.
 """
 import os
 import logging
-from typing import Callable
 from fastapi import Request, HTTPException, status
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-from config.redis_config import get_redis_client
+from config.redis_config import get_async_redis_client, redis_breaker
 
 logger = logging.getLogger(__name__)
 
 
-class RateLimiterMiddleware(BaseHTTPMiddleware):
+class RateLimiterMiddleware:
     """
     Rate limiting middleware using Redis
 
     Limits requests per IP address within a time window.
+    Uses the redis.asyncio client so rate-limit checks never block the event loop,
+    and is implemented as a pure ASGI middleware (no BaseHTTPMiddleware overhead).
+    While the shared Redis circuit breaker is open, requests pass unchecked
+    (fail open) instead of waiting on Redis.
     """
 
-    def __init__(self, app, calls: int = 100, period: int = 60):
+    def __init__(self, app: ASGIApp, calls: int = 100, period: int = 60):
         """
         Initialize rate limiter
 
         Args:
-            app: FastAPI application
+            app: ASGI application
             calls: Maximum number of requests allowed
             period: Time window in seconds
         """
-        super().__init__(app)
+        self.app = app
         self.calls = int(os.getenv('RATE_LIMIT_CALLS', str(calls)))
         self.period = int(os.getenv('RATE_LIMIT_PERIOD', str(period)))
         self.enabled = os.getenv('RATE_LIMIT_ENABLED', 'true').lower() == 'true'
-        self.redis_client = get_redis_client()
+        self.redis_client = get_async_redis_client()
+        self.breaker = redis_breaker
 
         if self.enabled and self.redis_client:
             logger.info(
@@ -46,32 +51,37 @@ class RateLimiterMiddleware(BaseHTTPMiddleware):
         else:
             logger.warning("⚠️  Rate limiting disabled (Redis not available)")
 
-    async def dispatch(self, request: Request, call_next: Callable):
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Process request with rate limiting
 
         Args:
-            request: Incoming HTTP request
-            call_next: Next middleware/handler
-
-        Returns:
-            HTTP response
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel (wrapped to add X-RateLimit-* headers)
         """
-        # Skip if disabled or Redis unavailable
-        if not self.enabled or not self.redis_client:
-            return await call_next(request)
+        # Skip non-HTTP traffic, disabled limiter or Redis unavailable
+        if scope["type"] != "http" or not self.enabled or not self.redis_client:
+            await self.app(scope, receive, send)
+            return
 
         # Skip rate limiting for health check endpoint
-        if request.url.path == "/health_check":
-            return await call_next(request)
+        if scope["path"] == "/health_check":
+            await self.app(scope, receive, send)
+            return
+
+        # Circuit open: Redis is failing or slow, fail open right away
+        if not self.breaker.allow():
+            await self.app(scope, receive, send)
+            return
 
         # Get client IP
-        client_ip = self._get_client_ip(request)
+        client_ip = self._get_client_ip(scope)
 
         # Check rate limit
-        if not self._is_allowed(client_ip):
+        if not await self._is_allowed(client_ip):
             logger.warning(f"⚠️  Rate limit exceeded for IP: {client_ip}")
-            return JSONResponse(
+            response = JSONResponse(
                 status_code=status.HTTP_429_TOO_MANY_REQUESTS,
                 content={
                     "detail": f"Rate limit exceeded. Maximum {self.calls} requests "
@@ -85,42 +95,50 @@ class RateLimiterMiddleware(BaseHTTPMiddleware):
                     "X-RateLimit-Reset": str(self.period)
                 }
             )
+            await response(scope, receive, send)
+            return
 
-        # Process request
-        response = await call_next(request)
+        async def send_with_rate_limit_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Add rate limit headers to response
+                remaining = await self._get_remaining(client_ip)
+                headers = MutableHeaders(scope=message)
+                headers["X-RateLimit-Limit"] = str(self.calls)
+                headers["X-RateLimit-Remaining"] = str(remaining)
+                headers["X-RateLimit-Reset"] = str(self.period)
 
-        # Add rate limit headers to response
-        remaining = self._get_remaining(client_ip)
-        response.headers["X-RateLimit-Limit"] = str(self.calls)
-        response.headers["X-RateLimit-Remaining"] = str(remaining)
-        response.headers["X-RateLimit-Reset"] = str(self.period)
+            await send(message)
 
-        return response
+        # Process request
+        await self.app(scope, receive, send_with_rate_limit_headers)
 
-    def _get_client_ip(self, request: Request) -> str:
+    def _get_client_ip(self, scope: Scope) -> str:
         """
-        Extract client IP from request
+        Extract client IP from the ASGI scope
 
         Args:
-            request: HTTP request
+            scope: ASGI connection scope
 
         Returns:
             Client IP address
         """
+        headers = Headers(scope=scope)
+
         # Check X-Forwarded-For header (from reverse proxy)
-        forwarded = request.headers.get("X-Forwarded-For")
+        forwarded = headers.get("x-forwarded-for")
         if forwarded:
             return forwarded.split(",")[0].strip()
 
         # Check X-Real-IP header
-        real_ip = request.headers.get("X-Real-IP")
+        real_ip = headers.get("x-real-ip")
         if real_ip:
             return real_ip
 
         # Fallback to direct client
-        return request.client.host if request.client else "unknown"
+        client = scope.get("client")
+        return client[0] if client else "unknown"
 
-    def _is_allowed(self, client_ip: str) -> bool:
+    async def _is_allowed(self, client_ip: str) -> bool:
         """
         Check if client is allowed to make request with atomic Redis operations
 
@@ -137,7 +155,8 @@ class RateLimiterMiddleware(BaseHTTPMiddleware):
             pipe = self.redis_client.pipeline()
             pipe.incr(key)
             pipe.expire(key, self.period)
-            results = pipe.execute()
+            with self.breaker.track():
+                results = await pipe.execute()
 
             # ✅ Verify both operations succeeded
             if len(results) < 2:
@@ -157,12 +176,12 @@ class RateLimiterMiddleware(BaseHTTPMiddleware):
                     f"forcing expiration"
                 )
                 try:
-                    self.redis_client.expire(key, self.period)
+                    await self.redis_client.expire(key, self.period)
                 except Exception as exp_error:
                     logger.error(f"Failed to force expiration for {key}: {exp_error}")
                     # Delete key to prevent permanent block
                     try:
-                        self.redis_client.delete(key)
+                        await self.redis_client.delete(key)
                     except Exception:
                         pass
 
@@ -174,7 +193,7 @@ class RateLimiterMiddleware(BaseHTTPMiddleware):
             # On error, allow request (fail open)
             return True
 
-    def _get_remaining(self, client_ip: str) -> int:
+    async def _get_remaining(self, client_ip: str) -> int:
         """
         Get remaining requests for client
 
@@ -186,7 +205,8 @@ class RateLimiterMiddleware(BaseHTTPMiddleware):
         """
         try:
             key = f"rate_limit:{client_ip}"
-            current = self.redis_client.get(key)
+            with self.breaker.track():
+                current = await self.redis_client.get(key)
 
             if current is None:
                 return self.calls
@@ -216,7 +236,7 @@ class EndpointRateLimiter:
     def __init__(self, calls: int = 10, period: int = 60):
         self.calls = calls
         self.period = period
-        self.redis_client = get_redis_client()
+        self.redis_client = get_async_redis_client()
 
     def __call__(self, func):
         async def wrapper(*args, **kwargs):
@@ -225,7 +245,7 @@ class EndpointRateLimiter:
                 (arg for arg in args if isinstance(arg, Request)), None
             )
 
-            if not request or not self.redis_client:
+            if not request or not self.redis_client or not redis_breaker.allow():
                 return await func(*args, **kwargs)
 
             client_ip = self._get_client_ip(request)
@@ -235,7 +255,12 @@ class EndpointRateLimiter:
             pipe = self.redis_client.pipeline()
             pipe.incr(key)
             pipe.expire(key, self.period)
-            results = pipe.execute()
+            try:
+                with redis_breaker.track():
+                    results = await pipe.execute()
+            except Exception as e:
+                logger.error(f"Endpoint rate limiting error for {client_ip}: {e}")
+                return await func(*args, **kwargs)  # Fail open
             current = results[0]
 
             if current > self.calls:
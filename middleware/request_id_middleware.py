@@ -7,18 +7,20 @@ Each request gets a unique identifier that can be tracked across all logs.
 import uuid
 import logging
 import time
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import Headers, MutableHeaders
 from starlette.requests import Request
-from starlette.responses import Response
-from typing import Callable
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 logger = logging.getLogger(__name__)
 
 
-class RequestIDMiddleware(BaseHTTPMiddleware):
+class RequestIDMiddleware:
     """
     Middleware that adds a unique request ID to every HTTP request.
 
+    Implemented as a pure ASGI middleware (no BaseHTTPMiddleware), so it adds
+    no extra task or response stream wrapping and keeps streaming responses intact.
+
     The request ID can be:
     1. Provided by client via X-Request-ID header
     2. Auto-generated if not provided
@@ -38,60 +40,66 @@ class RequestIDMiddleware(BaseHTTPMiddleware):
         [abc123] Query executed: SELECT * FROM products LIMIT 10
     """
 
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: Callable
-    ) -> Response:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Process request and inject request ID
 
         Args:
-            request: The incoming HTTP request
-            call_next: The next middleware or route handler
-
-        Returns:
-            HTTP response with X-Request-ID header
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel (wrapped to add X-Request-ID / X-Response-Time)
         """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         # Get request ID from header or generate new one
-        request_id = request.headers.get('X-Request-ID') or str(uuid.uuid4())
+        request_id = Headers(scope=scope).get('x-request-id') or str(uuid.uuid4())
+
+        # Store in request state for access in route handlers (request.state.request_id)
+        scope.setdefault("state", {})["request_id"] = request_id
 
-        # Store in request state for access in route handlers
-        request.state.request_id = request_id
+        method = scope["method"]
+        path = scope["path"]
+        client = scope.get("client")
 
         # Log request start
         start_time = time.time()
         logger.info(
-            f"[{request_id}] → {request.method} {request.url.path} "
-            f"(client: {request.client.host if request.client else 'unknown'})"
+            f"[{request_id}] → {method} {path} "
+            f"(client: {client[0] if client else 'unknown'})"
         )
 
-        try:
-            # Process request
-            response = await call_next(request)
+        async def send_with_request_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Calculate request duration (time to first byte)
+                duration_ms = round((time.time() - start_time) * 1000, 2)
 
-            # Calculate request duration
-            duration_ms = round((time.time() - start_time) * 1000, 2)
+                # Log request completion
+                logger.info(
+                    f"[{request_id}] ← {method} {path} "
+                    f"- {message['status']} ({duration_ms}ms)"
+                )
 
-            # Log request completion
-            logger.info(
-                f"[{request_id}] ← {request.method} {request.url.path} "
-                f"- {response.status_code} ({duration_ms}ms)"
-            )
+                headers = MutableHeaders(scope=message)
+                # Add request ID to response headers
+                headers['X-Request-ID'] = request_id
+                # Add timing header for performance monitoring
+                headers['X-Response-Time'] = f"{duration_ms}ms"
 
-            # Add request ID to response headers
-            response.headers['X-Request-ID'] = request_id
+            await send(message)
 
-            # Add timing header for performance monitoring
-            response.headers['X-Response-Time'] = f"{duration_ms}ms"
-
-            return response
+        try:
+            await self.app(scope, receive, send_with_request_id)
 
         except Exception as e:
             # Log errors with request ID
             duration_ms = round((time.time() - start_time) * 1000, 2)
             logger.error(
-                f"[{request_id}] ✗ {request.method} {request.url.path} "
+                f"[{request_id}] ✗ {method} {path} "
                 f"- ERROR: {str(e)} ({duration_ms}ms)"
             )
             raise
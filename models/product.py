@@ -1,7 +1,12 @@
-from sqlalchemy import Column, Integer, String, Float, ForeignKey, Boolean
-from sqlalchemy.orm import relationship
+from sqlalchemy import DDL, Column, Integer, String, Float, ForeignKey, Boolean, Index, Text, event
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import deferred, relationship
 from models.base_model import BaseModel
 
+# Text search configuration of products.search_vector (alembic revision 7c2e9d4b1a06).
+# 'simple' = no stemming: brand and model names match as typed, in any language
+PRODUCT_SEARCH_CONFIG = "simple"
+
 class ProductModel(BaseModel):
     __tablename__ = "products"
 
@@ -13,6 +18,82 @@ class ProductModel(BaseModel):
 
     category_id = Column(Integer, ForeignKey("categories.id_key"))
     category = relationship("CategoryModel", back_populates="products")
-    
+
     reviews = relationship("ReviewModel", back_populates="product", cascade="all, delete-orphan")
-    order_details = relationship("OrderDetailModel", back_populates="product")
\ No newline at end of file
+    # Agregados de reviews, mantenidos por ReviewService en la misma transacción:
+    # los listados los muestran sin cargar las reviews
+    rating_avg = Column(Float, nullable=True)
+    rating_count = Column(Integer, nullable=False, default=0, server_default="0")
+    order_details = relationship("OrderDetailModel", back_populates="product")
+
+    # Full-text search document (name + category name), maintained by triggers
+    # on PostgreSQL; never loaded with the row. Unused on SQLite (ilike search)
+    search_vector = deferred(Column(TSVECTOR().with_variant(Text(), "sqlite"), nullable=True))
+
+    __table_args__ = (
+        Index("ix_products_search_vector", "search_vector", postgresql_using="gin"),
+        # Trigram index for the typeahead ILIKE '%term%' (/products/suggest)
+        Index(
+            "ix_products_name_trgm", "name",
+            postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}
+        ).ddl_if(dialect="postgresql"),
+    )
+
+
+# Same extension and triggers as the migrations, for databases created with create_all()
+event.listen(
+    ProductModel.__table__, "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql")
+)
+
+
+def search_vector_sql(name: str, category: str) -> str:
+    """tsvector expression of a product: name (weight A) + category name (weight B)"""
+    return (
+        f"setweight(to_tsvector('{PRODUCT_SEARCH_CONFIG}', coalesce({name}, '')), 'A') || "
+        f"setweight(to_tsvector('{PRODUCT_SEARCH_CONFIG}', coalesce({category}, '')), 'B')"
+    )
+
+
+# Trigger functions and triggers keeping products.search_vector up to date.
+# Single source for create_all() (below) and alembic revision 7c2e9d4b1a06
+PRODUCT_SEARCH_TRIGGERS = (
+    f"""
+    CREATE OR REPLACE FUNCTION products_search_vector_update() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        NEW.search_vector := {search_vector_sql(
+            "NEW.name", "(SELECT name FROM categories WHERE id_key = NEW.category_id)"
+        )};
+        RETURN NEW;
+    END;
+    $$
+    """,
+    """
+    CREATE TRIGGER products_search_vector
+    BEFORE INSERT OR UPDATE OF name, category_id ON products
+    FOR EACH ROW EXECUTE FUNCTION products_search_vector_update()
+    """,
+    f"""
+    CREATE OR REPLACE FUNCTION categories_search_vector_update() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        UPDATE products SET search_vector = {search_vector_sql("name", "NEW.name")}
+        WHERE category_id = NEW.id_key;
+        RETURN NULL;
+    END;
+    $$
+    """,
+    """
+    CREATE TRIGGER categories_search_vector
+    AFTER UPDATE OF name ON categories
+    FOR EACH ROW WHEN (OLD.name IS DISTINCT FROM NEW.name)
+    EXECUTE FUNCTION categories_search_vector_update()
+    """,
+)
+
+for _statement in PRODUCT_SEARCH_TRIGGERS:
+    event.listen(
+        ProductModel.__table__, "after_create",
+        DDL(_statement).execute_if(dialect="postgresql")
+    )
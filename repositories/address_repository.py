@@ -1,6 +1,7 @@
 """Address repository for database operations."""
 from sqlalchemy.orm import Session
 
+from config.constants import CacheConfig
 from models.address import AddressModel
 from repositories.base_repository_impl import BaseRepositoryImpl
 from schemas.address_schema import AddressSchema
@@ -9,5 +10,7 @@ from schemas.address_schema import AddressSchema
 class AddressRepository(BaseRepositoryImpl):
     """Repository for Address entity database operations."""
 
+    query_cache_ttl = CacheConfig.QUERY_CACHE_TTL
+
     def __init__(self, db: Session):
         super().__init__(AddressModel, AddressSchema, db)
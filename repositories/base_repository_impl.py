@@ -2,16 +2,30 @@
 BaseRepository implementation with best practices and sanitized logging
 """
 import logging
-from typing import Type, List, Optional
+from typing import Any, Type, List, Optional, Tuple, Union
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from sqlalchemy import select
 
+from config.constants import PaginationConfig
 from models.base_model import BaseModel
 from repositories.base_repository import BaseRepository
+from repositories.query_cache import query_cache
 from schemas.base_schema import BaseSchema
+from services.cache_invalidation import PENDING_INFO_KEY, cache_invalidation
+from utils.cursor_pagination import ID_ASC, apply_page
 from utils.logging_utils import log_repository_error, create_user_safe_error, get_sanitized_logger
 
 
+# Protected attributes that should never be updated
+PROTECTED_ATTRIBUTES = {
+    'id_key',  # Primary key
+    '_sa_instance_state',  # SQLAlchemy internal
+    '__class__',  # Python magic attribute
+    '__dict__',  # Python magic attribute
+}
+
+
 class InstanceNotFoundError(Exception):
     """
     InstanceNotFoundError is raised when a record is not found
@@ -24,6 +38,10 @@ class BaseRepositoryImpl(BaseRepository):
     Base Repository Implementation with proper error handling and SQLAlchemy 2.0 patterns
     """
 
+    # Seconds find() / find_all() results are kept in the query cache
+    # (repositories.query_cache). None = not cached; subclasses opt in
+    query_cache_ttl: Optional[int] = None
+
     def __init__(self, model: Type[BaseModel], schema: Type[BaseSchema], db: Session):
         self._model = model
         self._schema = schema
@@ -45,6 +63,125 @@ class BaseRepositoryImpl(BaseRepository):
         """Get the Pydantic schema class"""
         return self._schema
 
+    def _validate_pagination(self, skip: int, limit: int) -> int:
+        """
+        Validate pagination parameters to prevent DoS attacks
+        and ensure reasonable query performance.
+
+        Args:
+            skip: Number of records to skip (must be >= 0)
+            limit: Maximum number of records to return
+
+        Returns:
+            The effective limit (capped at PaginationConfig.MAX_LIMIT)
+
+        Raises:
+            ValueError: If pagination parameters are invalid
+        """
+        # Validate skip parameter
+        if skip < 0:
+            raise ValueError("skip parameter must be >= 0")
+
+        # Validate limit parameter
+        if limit < PaginationConfig.MIN_LIMIT:
+            raise ValueError(
+                f"limit parameter must be >= {PaginationConfig.MIN_LIMIT}"
+            )
+
+        # Cap limit at maximum to prevent excessive queries
+        if limit > PaginationConfig.MAX_LIMIT:
+            self.logger.warning(
+                f"Limit {limit} exceeds maximum {PaginationConfig.MAX_LIMIT}, "
+                f"capping to maximum"
+            )
+            limit = PaginationConfig.MAX_LIMIT
+
+        return limit
+
+    def _query_cacheable(self) -> bool:
+        """
+        Whether reads may use the query cache
+
+        Not while the session holds uncommitted changes: results that
+        include them must not be shared (the transaction may roll back).
+        """
+        session = self.session
+        return (
+            self.query_cache_ttl is not None
+            and not (session.new or session.dirty or session.deleted)
+            and PENDING_INFO_KEY not in session.info
+        )
+
+    @staticmethod
+    def _dump(result: Union[BaseSchema, List[BaseSchema]]) -> Any:
+        if isinstance(result, list):
+            return [item.model_dump(mode="json") for item in result]
+        return result.model_dump(mode="json")
+
+    def _query_cache_lookup(self, stmt) -> Tuple[Optional[str], Optional[Any]]:
+        """(key, cached value) of a statement, see QueryCache.lookup()"""
+        if not self._query_cacheable():
+            return None, None
+        return query_cache.lookup(stmt, self.model, self.schema)
+
+    def _query_cache_store(self, key: Optional[str], result: Union[BaseSchema, List[BaseSchema]]) -> None:
+        query_cache.store(key, self._dump(result), self.query_cache_ttl)
+
+    def _apply_changes(self, instance: BaseModel, changes: dict) -> None:
+        """
+        Apply changes to an instance with security validation
+
+        Validates field names against the model's columns to prevent
+        unauthorized updates to protected attributes or SQLAlchemy internals.
+
+        Raises:
+            ValueError: If trying to update invalid or protected fields
+        """
+        # Get allowed columns from model
+        allowed_columns = {col.name for col in self.model.__table__.columns}
+
+        # Validate and update only allowed fields
+        for key, value in changes.items():
+            # Skip None values
+            if value is None:
+                continue
+
+            # Check if key starts with underscore (internal attribute)
+            if key.startswith('_'):
+                self.logger.warning(
+                    f"Attempt to update protected attribute '{key}' blocked"
+                )
+                raise ValueError(
+                    f"Cannot update protected attribute: {key}"
+                )
+
+            # Check against protected list
+            if key in PROTECTED_ATTRIBUTES:
+                self.logger.warning(
+                    f"Attempt to update protected attribute '{key}' blocked"
+                )
+                raise ValueError(
+                    f"Cannot update protected attribute: {key}"
+                )
+
+            # Validate field exists in model
+            if key not in allowed_columns:
+                self.logger.warning(
+                    f"Attempt to update non-existent field '{key}' blocked"
+                )
+                raise ValueError(
+                    f"Invalid field for {self.model.__name__}: {key}"
+                )
+
+            # Validate attribute exists on instance
+            if not hasattr(instance, key):
+                raise ValueError(
+                    f"Field {key} not found in {self.model.__name__}"
+                )
+
+            # All validations passed - safe to update
+            setattr(instance, key, value)
+
     def find(self, id_key: int) -> BaseSchema:
         """
         Find a single record by ID
@@ -61,6 +198,10 @@ class BaseRepositoryImpl(BaseRepository):
         try:
             # Use SQLAlchemy 2.0 style query
             stmt = select(self.model).where(self.model.id_key == id_key)
+            key, cached = self._query_cache_lookup(stmt)
+            if cached is not None:
+                return self.schema.model_validate(cached)
+
             model = self.session.scalars(stmt).first()
 
             if model is None:
@@ -68,14 +209,16 @@ class BaseRepositoryImpl(BaseRepository):
                     f"{self.model.__name__} with id {id_key} not found"
                 )
 
-            return self.schema.model_validate(model)
+            result = self.schema.model_validate(model)
+            self._query_cache_store(key, result)
+            return result
         except InstanceNotFoundError:
             raise
         except Exception as e:
             self.logger.error(f"Error finding {self.model.__name__} with id {id_key}: {e}")
             raise
 
-    def find_all(self, skip: int = 0, limit: int = 100) -> List[BaseSchema]:
+    def find_all(self, skip: int = 0, limit: int = 100, cursor: Optional[str] = None) -> List[BaseSchema]:
         """
         Find all records with pagination and input validation
 
@@ -85,37 +228,27 @@ class BaseRepositoryImpl(BaseRepository):
         Args:
             skip: Number of records to skip (must be >= 0)
             limit: Maximum number of records to return (must be 1-1000)
+            cursor: Keyset cursor of the previous page (utils.cursor_pagination);
+                    when given, skip is ignored
 
         Returns:
-            List of schema instances
+            List of schema instances ordered by id_key
 
         Raises:
-            ValueError: If pagination parameters are invalid
+            ValueError: If pagination parameters or the cursor are invalid
         """
-        from config.constants import PaginationConfig, ErrorMessages
-
         try:
-            # Validate skip parameter
-            if skip < 0:
-                raise ValueError("skip parameter must be >= 0")
+            limit = self._validate_pagination(skip, limit)
 
-            # Validate limit parameter
-            if limit < PaginationConfig.MIN_LIMIT:
-                raise ValueError(
-                    f"limit parameter must be >= {PaginationConfig.MIN_LIMIT}"
-                )
+            stmt = apply_page(select(self.model), self.model, ID_ASC, cursor, skip, limit)
+            key, cached = self._query_cache_lookup(stmt)
+            if cached is not None:
+                return [self.schema.model_validate(item) for item in cached]
 
-            # Cap limit at maximum to prevent excessive queries
-            if limit > PaginationConfig.MAX_LIMIT:
-                self.logger.warning(
-                    f"Limit {limit} exceeds maximum {PaginationConfig.MAX_LIMIT}, "
-                    f"capping to maximum"
-                )
-                limit = PaginationConfig.MAX_LIMIT
-
-            stmt = select(self.model).offset(skip).limit(limit)
             models = self.session.scalars(stmt).all()
-            return [self.schema.model_validate(model) for model in models]
+            results = [self.schema.model_validate(model) for model in models]
+            self._query_cache_store(key, results)
+            return results
 
         except ValueError:
             raise
@@ -161,14 +294,6 @@ class BaseRepositoryImpl(BaseRepository):
             InstanceNotFoundError: If the record is not found
             ValueError: If trying to update invalid or protected fields
         """
-        # Protected attributes that should never be updated
-        PROTECTED_ATTRIBUTES = {
-            'id_key',  # Primary key
-            '_sa_instance_state',  # SQLAlchemy internal
-            '__class__',  # Python magic attribute
-            '__dict__',  # Python magic attribute
-        }
-
         try:
             stmt = select(self.model).where(self.model.id_key == id_key)
             instance = self.session.scalars(stmt).first()
@@ -178,50 +303,7 @@ class BaseRepositoryImpl(BaseRepository):
                     f"{self.model.__name__} with id {id_key} not found"
                 )
 
-            # Get allowed columns from model
-            allowed_columns = {col.name for col in self.model.__table__.columns}
-
-            # Validate and update only allowed fields
-            for key, value in changes.items():
-                # Skip None values
-                if value is None:
-                    continue
-
-                # Check if key starts with underscore (internal attribute)
-                if key.startswith('_'):
-                    self.logger.warning(
-                        f"Attempt to update protected attribute '{key}' blocked"
-                    )
-                    raise ValueError(
-                        f"Cannot update protected attribute: {key}"
-                    )
-
-                # Check against protected list
-                if key in PROTECTED_ATTRIBUTES:
-                    self.logger.warning(
-                        f"Attempt to update protected attribute '{key}' blocked"
-                    )
-                    raise ValueError(
-                        f"Cannot update protected attribute: {key}"
-                    )
-
-                # Validate field exists in model
-                if key not in allowed_columns:
-                    self.logger.warning(
-                        f"Attempt to update non-existent field '{key}' blocked"
-                    )
-                    raise ValueError(
-                        f"Invalid field for {self.model.__name__}: {key}"
-                    )
-
-                # Validate attribute exists on instance
-                if not hasattr(instance, key):
-                    raise ValueError(
-                        f"Field {key} not found in {self.model.__name__}"
-                    )
-
-                # All validations passed - safe to update
-                setattr(instance, key, value)
+            self._apply_changes(instance, changes)
 
             self.session.commit()
             self.session.refresh(instance)
@@ -287,4 +369,185 @@ class BaseRepositoryImpl(BaseRepository):
         except Exception as e:
             self.session.rollback()
             self.logger.error(f"Error saving multiple {self.model.__name__}: {e}")
-            raise
\ No newline at end of file
+            raise
+
+class AsyncBaseRepositoryImpl(BaseRepositoryImpl):
+    """
+    Async Base Repository Implementation on top of AsyncSession (asyncpg)
+
+    Mirrors BaseRepositoryImpl method by method so services can switch between
+    both stacks without changing their call sites (other than awaiting).
+    Schema conversion runs through AsyncSession.run_sync so relationships that
+    are not eagerly loaded can still be resolved without raising MissingGreenlet.
+    """
+
+    def __init__(self, model: Type[BaseModel], schema: Type[BaseSchema], db: AsyncSession):
+        super().__init__(model, schema, db)
+
+    @property
+    def session(self) -> AsyncSession:
+        """Get the async database session"""
+        return self._session
+
+    async def _to_schema(self, model: BaseModel) -> BaseSchema:
+        """Convert a model to its schema, allowing lazy loads"""
+        return await self.session.run_sync(lambda _: self.schema.model_validate(model))
+
+    async def _to_schemas(self, models: List[BaseModel]) -> List[BaseSchema]:
+        """Convert several models to schemas, allowing lazy loads"""
+        return await self.session.run_sync(
+            lambda _: [self.schema.model_validate(model) for model in models]
+        )
+
+    async def _aquery_cache_lookup(self, stmt) -> Tuple[Optional[str], Optional[Any]]:
+        """Async version of _query_cache_lookup()"""
+        if not self._query_cacheable():
+            return None, None
+        return await query_cache.alookup(stmt, self.model, self.schema)
+
+    async def _aquery_cache_store(self, key: Optional[str], result: Union[BaseSchema, List[BaseSchema]]) -> None:
+        await query_cache.astore(key, self._dump(result), self.query_cache_ttl)
+
+    async def find(self, id_key: int) -> BaseSchema:
+        """
+        Find a single record by ID
+
+        Raises:
+            InstanceNotFoundError: If the record is not found
+        """
+        try:
+            stmt = select(self.model).where(self.model.id_key == id_key)
+            key, cached = await self._aquery_cache_lookup(stmt)
+            if cached is not None:
+                return self.schema.model_validate(cached)
+
+            model = (await self.session.scalars(stmt)).first()
+
+            if model is None:
+                raise InstanceNotFoundError(
+                    f"{self.model.__name__} with id {id_key} not found"
+                )
+
+            result = await self._to_schema(model)
+            await self._aquery_cache_store(key, result)
+            return result
+        except InstanceNotFoundError:
+            raise
+        except Exception as e:
+            self.logger.error(f"Error finding {self.model.__name__} with id {id_key}: {e}")
+            raise
+
+    async def find_all(self, skip: int = 0, limit: int = 100, cursor: Optional[str] = None) -> List[BaseSchema]:
+        """
+        Find all records with pagination and input validation
+
+        Raises:
+            ValueError: If pagination parameters or the cursor are invalid
+        """
+        try:
+            limit = self._validate_pagination(skip, limit)
+
+            stmt = apply_page(select(self.model), self.model, ID_ASC, cursor, skip, limit)
+            key, cached = await self._aquery_cache_lookup(stmt)
+            if cached is not None:
+                return [self.schema.model_validate(item) for item in cached]
+
+            models = (await self.session.scalars(stmt)).all()
+            results = await self._to_schemas(models)
+            await self._aquery_cache_store(key, results)
+            return results
+
+        except ValueError:
+            raise
+        except Exception as e:
+            self.logger.error(f"Error finding all {self.model.__name__}: {e}")
+            raise
+
+    async def save(self, model: BaseModel) -> BaseSchema:
+        """Save a new record to the database"""
+        try:
+            self.session.add(model)
+            await self.session.commit()
+            await cache_invalidation.settle(self.session)
+            await self.session.refresh(model)
+            return await self._to_schema(model)
+        except Exception as e:
+            await self.session.rollback()
+            self.logger.error(f"Error saving {self.model.__name__}: {e}")
+            raise
+
+    async def update(self, id_key: int, changes: dict) -> BaseSchema:
+        """
+        Update an existing record with security validation
+
+        Raises:
+            InstanceNotFoundError: If the record is not found
+            ValueError: If trying to update invalid or protected fields
+        """
+        try:
+            stmt = select(self.model).where(self.model.id_key == id_key)
+            instance = (await self.session.scalars(stmt)).first()
+
+            if instance is None:
+                raise InstanceNotFoundError(
+                    f"{self.model.__name__} with id {id_key} not found"
+                )
+
+            self._apply_changes(instance, changes)
+
+            await self.session.commit()
+            await cache_invalidation.settle(self.session)
+            await self.session.refresh(instance)
+            return await self._to_schema(instance)
+
+        except InstanceNotFoundError:
+            raise
+        except ValueError:
+            await self.session.rollback()
+            raise
+        except Exception as e:
+            await self.session.rollback()
+            self.logger.error(f"Error updating {self.model.__name__} with id {id_key}: {e}")
+            raise
+
+    async def remove(self, id_key: int) -> None:
+        """
+        Delete a record from the database
+
+        Raises:
+            InstanceNotFoundError: If the record is not found
+        """
+        try:
+            stmt = select(self.model).where(self.model.id_key == id_key)
+            model = (await self.session.scalars(stmt)).first()
+
+            if model is None:
+                raise InstanceNotFoundError(
+                    f"{self.model.__name__} with id {id_key} not found"
+                )
+
+            await self.session.delete(model)
+            await self.session.commit()
+            await cache_invalidation.settle(self.session)
+        except InstanceNotFoundError:
+            raise
+        except Exception as e:
+            await self.session.rollback()
+            self.logger.error(f"Error deleting {self.model.__name__} with id {id_key}: {e}")
+            raise
+
+    async def save_all(self, models: List[BaseModel]) -> List[BaseSchema]:
+        """Save multiple records in a single transaction"""
+        try:
+            self.session.add_all(models)
+            await self.session.commit()
+            await cache_invalidation.settle(self.session)
+
+            for model in models:
+                await self.session.refresh(model)
+
+            return await self._to_schemas(models)
+        except Exception as e:
+            await self.session.rollback()
+            self.logger.error(f"Error saving multiple {self.model.__name__}: {e}")
+            raise
@@ -1,6 +1,7 @@
 """Bill repository for database operations."""
 from sqlalchemy.orm import Session
 
+from config.constants import CacheConfig
 from models.bill import BillModel
 from repositories.base_repository_impl import BaseRepositoryImpl
 from schemas.bill_schema import BillSchema
@@ -9,5 +10,7 @@ from schemas.bill_schema import BillSchema
 class BillRepository(BaseRepositoryImpl):
     """Repository for Bill entity database operations."""
 
+    query_cache_ttl = CacheConfig.QUERY_CACHE_TTL
+
     def __init__(self, db: Session):
         super().__init__(BillModel, BillSchema, db)
\ No newline at end of file
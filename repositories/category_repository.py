@@ -1,9 +1,12 @@
 """Category repository with controlled relationship loading."""
-from typing import List
+from typing import List, Optional
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session, selectinload
 from models.category import CategoryModel
-from repositories.base_repository_impl import BaseRepositoryImpl
+from repositories.base_repository_impl import AsyncBaseRepositoryImpl, BaseRepositoryImpl, InstanceNotFoundError
 from schemas.category_schema import CategorySchema
+from utils.cursor_pagination import ID_ASC, apply_page
 
 
 class CategoryRepository(BaseRepositoryImpl):
@@ -12,21 +15,17 @@ class CategoryRepository(BaseRepositoryImpl):
     def __init__(self, db: Session):
         super().__init__(CategoryModel, CategorySchema, db)
 
-    def find_all(self, skip: int = 0, limit: int = 100) -> List[CategorySchema]:
+    def find_all(self, skip: int = 0, limit: int = 100, cursor: Optional[str] = None) -> List[CategorySchema]:
         """
         Get all categories with products but WITHOUT nested order_details.
         This prevents the cyclic reference issue.
+        Ordered by id_key; `cursor` (keyset) replaces skip for deep pages.
         """
-        categories = (
-            self.session.query(CategoryModel)
-            .options(
-                # ✅ Carga products pero NO sus order_details
-                selectinload(CategoryModel.products).lazyload('*')
-            )
-            .offset(skip)
-            .limit(limit)
-            .all()
+        query = self.session.query(CategoryModel).options(
+            # ✅ Carga products pero NO sus order_details
+            selectinload(CategoryModel.products).lazyload('*')
         )
+        categories = apply_page(query, CategoryModel, ID_ASC, cursor, skip, limit).all()
         
         # ✅ Convertir a schema usando model_validate
         return [CategorySchema.model_validate(category) for category in categories]
@@ -48,4 +47,36 @@ class CategoryRepository(BaseRepositoryImpl):
                 f"Category with id {id_key} not found"
             )
         
-        return CategorySchema.model_validate(category)
\ No newline at end of file
+        return CategorySchema.model_validate(category)
+
+
+class AsyncCategoryRepository(AsyncBaseRepositoryImpl):
+    """Async repository for Category entity with the same loading strategy as CategoryRepository."""
+
+    def __init__(self, db: AsyncSession):
+        super().__init__(CategoryModel, CategorySchema, db)
+
+    async def find_all(self, skip: int = 0, limit: int = 100, cursor: Optional[str] = None) -> List[CategorySchema]:
+        """Get all categories with products but WITHOUT nested order_details."""
+        stmt = apply_page(
+            select(CategoryModel).options(selectinload(CategoryModel.products).lazyload('*')),
+            CategoryModel, ID_ASC, cursor, skip, limit
+        )
+        categories = (await self.session.scalars(stmt)).all()
+        return await self._to_schemas(categories)
+
+    async def find(self, id_key: int) -> CategorySchema:
+        """Get single category with products but without nested relations."""
+        stmt = (
+            select(CategoryModel)
+            .options(selectinload(CategoryModel.products).lazyload('*'))
+            .where(CategoryModel.id_key == id_key)
+        )
+        category = (await self.session.scalars(stmt)).first()
+
+        if not category:
+            raise InstanceNotFoundError(
+                f"Category with id {id_key} not found"
+            )
+
+        return await self._to_schema(category)
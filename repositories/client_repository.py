@@ -2,6 +2,7 @@
 from sqlalchemy.orm import Session
 from typing import Optional
 
+from config.constants import CacheConfig
 from models.client import ClientModel
 from repositories.base_repository_impl import BaseRepositoryImpl
 from schemas.client_schema import ClientSchema
@@ -10,6 +11,8 @@ from schemas.client_schema import ClientSchema
 class ClientRepository(BaseRepositoryImpl):
     """Repository for Client entity database operations."""
 
+    query_cache_ttl = CacheConfig.QUERY_CACHE_TTL
+
     def __init__(self, db: Session):
         super().__init__(ClientModel, ClientSchema, db)
 
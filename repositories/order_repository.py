@@ -1,6 +1,7 @@
 """Order repository for database operations."""
 from sqlalchemy.orm import Session
 
+from config.constants import CacheConfig
 from models.order import OrderModel
 from repositories.base_repository_impl import BaseRepositoryImpl
 from schemas.order_schema import OrderSchema
@@ -9,5 +10,7 @@ from schemas.order_schema import OrderSchema
 class OrderRepository(BaseRepositoryImpl):
     """Repository for Order entity database operations."""
 
+    query_cache_ttl = CacheConfig.QUERY_CACHE_TTL
+
     def __init__(self, db: Session):
         super().__init__(OrderModel, OrderSchema, db)
\ No newline at end of file
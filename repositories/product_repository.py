@@ -1,10 +1,110 @@
 """Product repository with controlled relationship loading."""
-from typing import List, Optional
+import re
+from typing import Any, List, Optional, Tuple
+from sqlalchemy.dialects.postgresql import REGCONFIG
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session, selectinload, joinedload
-from sqlalchemy import or_, and_
-from models.product import ProductModel
-from repositories.base_repository_impl import BaseRepositoryImpl
-from schemas.product_schema import ProductSchema
+from sqlalchemy import and_, case, cast, func, select
+from models.product import PRODUCT_SEARCH_CONFIG, ProductModel
+from repositories.base_repository_impl import AsyncBaseRepositoryImpl, BaseRepositoryImpl, InstanceNotFoundError
+from schemas.product_schema import ProductListSchema, ProductSchema, ProductSuggestionSchema, ProductSummarySchema
+from utils.cursor_pagination import ID_ASC, SortKey, apply_page
+
+# sort_by modes of filter_products as keyset sort keys (id_key breaks ties)
+PRODUCT_SORT_KEYS = {
+    "price_asc": SortKey("price_asc", ("price", "id_key")),
+    "price_desc": SortKey("price_desc", ("price", "id_key"), descending=True),
+    "name": SortKey("name", ("name", "id_key")),
+}
+DEFAULT_PRODUCT_SORT = SortKey("id_desc", ("id_key",), descending=True)
+# Searches without sort_by are ordered by relevance (ts_rank): OFFSET pages
+# only, the rank is not a column a cursor could seek on
+RELEVANCE_SORT = SortKey("relevance", ())
+
+
+def product_sort_key(sort_by: Optional[str], search: Optional[str] = None) -> SortKey:
+    if sort_by in PRODUCT_SORT_KEYS:
+        return PRODUCT_SORT_KEYS[sort_by]
+    return RELEVANCE_SORT if search else DEFAULT_PRODUCT_SORT
+
+
+def search_tsquery(search: str) -> Optional[str]:
+    """Prefix tsquery of the words of a search ("gaming lap" -> "gaming:* & lap:*")"""
+    words = re.findall(r"\w+", search.lower())
+    return " & ".join(f"{word}:*" for word in words) or None
+
+
+def apply_search(query: Any, search: str, dialect_name: str) -> Tuple[Any, Optional[Any]]:
+    """
+    Filter a Query / Select by a search term
+
+    PostgreSQL: full-text match on products.search_vector (GIN index), also
+    returns the ts_rank expression to order by. Other databases (SQLite in
+    tests): ILIKE on the name, no rank.
+    """
+    tsquery = search_tsquery(search) if dialect_name == "postgresql" else None
+    if tsquery is None:
+        return query.filter(ProductModel.name.ilike(f"%{search}%")), None
+
+    ts_query = func.to_tsquery(cast(PRODUCT_SEARCH_CONFIG, REGCONFIG), tsquery)
+    return (
+        query.filter(ProductModel.search_vector.op("@@")(ts_query)),
+        func.ts_rank(ProductModel.search_vector, ts_query)
+    )
+
+
+def order_by_relevance(query: Any, rank: Optional[Any]) -> Any:
+    """Best matches first (newest first without a rank)"""
+    if rank is not None:
+        return query.order_by(rank.desc(), ProductModel.id_key.desc())
+    return query.order_by(ProductModel.id_key.desc())
+
+
+# Columns of ProductListSchema, selected as plain Core rows
+LIST_COLUMNS = (
+    ProductModel.id_key, ProductModel.name, ProductModel.price, ProductModel.stock,
+    ProductModel.image_url, ProductModel.category_id, ProductModel.active,
+    ProductModel.rating_avg, ProductModel.rating_count,
+)
+
+
+def lean_list_statement(skip: int, limit: int, include_inactive: bool, cursor: Optional[str]):
+    """
+    find_all page selecting only LIST_COLUMNS: no category join, and rows
+    never enter the session identity map
+    """
+    stmt = select(*LIST_COLUMNS)
+    if not include_inactive:
+        stmt = stmt.where(ProductModel.active == True)
+    return apply_page(stmt, ProductModel, ID_ASC, cursor, skip, limit)
+
+
+def to_list_schemas(rows) -> List[ProductListSchema]:
+    # Rows come straight from typed columns: no validation needed
+    return [ProductListSchema.model_construct(**row) for row in rows]
+
+
+def suggest_statement(term: str, limit: int, dialect_name: str):
+    """
+    Typeahead query: the suggestion columns of active products whose name
+    contains the term, no relationships loaded
+
+    Names starting with the term come first, then (PostgreSQL) by trigram
+    similarity; the ILIKE is answered by ix_products_name_trgm.
+    """
+    pattern = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    name = ProductModel.name
+    order = [case((name.ilike(f"{pattern}%", escape="\\"), 0), else_=1)]
+    if dialect_name == "postgresql":
+        order.append(func.similarity(name, term).desc())
+    order.append(name)
+
+    return (
+        select(ProductModel.id_key, name, ProductModel.price, ProductModel.image_url)
+        .where(ProductModel.active.is_(True), name.ilike(f"%{pattern}%", escape="\\"))
+        .order_by(*order)
+        .limit(limit)
+    )
 
 
 class ProductRepository(BaseRepositoryImpl):
@@ -13,27 +113,34 @@ class ProductRepository(BaseRepositoryImpl):
     def __init__(self, db: Session):
         super().__init__(ProductModel, ProductSchema, db)
 
-    def find_all(self, skip: int = 0, limit: int = 100, include_inactive: bool = False) -> List[ProductSchema]:
+    def find_all(self, skip: int = 0, limit: int = 100, include_inactive: bool = False,
+                 cursor: Optional[str] = None) -> List[ProductSummarySchema]:
         """
         Get all products WITHOUT nested order_details.product circular reference.
         Default: Active only (unless include_inactive=True).
+        Ordered by id_key; `cursor` (keyset) replaces skip for deep pages.
+        Reviews are summarized by rating_avg / rating_count (not loaded).
         """
         query = self.session.query(ProductModel).options(
             # ✅ Carga category sin problemas
             joinedload(ProductModel.category),
-            # ✅ Carga reviews sin problemas
-            selectinload(ProductModel.reviews),
-            # ❌ NO carga order_details para evitar ciclo
+            # ❌ NO carga reviews (agregados en rating_avg / rating_count) ni order_details
         )
 
         # ✅ NUEVO: Filtro de activos por defecto
         if not include_inactive:
             query = query.filter(ProductModel.active == True)
 
-        products = query.offset(skip).limit(limit).all()
+        products = apply_page(query, ProductModel, ID_ASC, cursor, skip, limit).all()
         
         # ✅ Convertir a schema usando model_validate
-        return [ProductSchema.model_validate(product) for product in products]
+        return [ProductSummarySchema.model_validate(product) for product in products]
+
+    def find_all_lean(self, skip: int = 0, limit: int = 100, include_inactive: bool = False,
+                      cursor: Optional[str] = None) -> List[ProductListSchema]:
+        """Same page as find_all as flat ProductListSchema rows (grid views)."""
+        stmt = lean_list_statement(skip, limit, include_inactive, cursor)
+        return to_list_schemas(self.session.execute(stmt).mappings())
 
     def find(self, id_key: int) -> ProductSchema:
         """
@@ -61,6 +168,25 @@ class ProductRepository(BaseRepositoryImpl):
         
         return ProductSchema.model_validate(product)
 
+    def find_by_ids(self, ids: List[int]) -> List[ProductSchema]:
+        """
+        Get several products in one IN query (same loading as listados).
+        Missing IDs are simply absent from the result.
+        """
+        if not ids:
+            return []
+
+        products = (
+            self.session.query(ProductModel)
+            .options(
+                joinedload(ProductModel.category),
+                selectinload(ProductModel.reviews),
+            )
+            .filter(ProductModel.id_key.in_(ids))
+            .all()
+        )
+        return [ProductSchema.model_validate(product) for product in products]
+
     def filter_products(
         self,
         search: Optional[str] = None,
@@ -71,24 +197,20 @@ class ProductRepository(BaseRepositoryImpl):
         active: Optional[bool] = True, # ✅ NUEVO PARAMETRO
         sort_by: Optional[str] = None,
         skip: int = 0,
-        limit: int = 100
-    ) -> List[ProductSchema]:
-        """Filter products with optimized loading."""
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> List[ProductSummarySchema]:
+        """Filter products with optimized loading (keyset `cursor` or legacy skip)."""
         
         query = self.session.query(ProductModel).options(
             joinedload(ProductModel.category),
-            selectinload(ProductModel.reviews),
-            # Sin order_details para listados
+            # Sin reviews ni order_details para listados
         )
 
         # Apply filters
+        rank = None
         if search:
-            search_pattern = f"%{search}%"
-            query = query.filter(
-                or_(
-                    ProductModel.name.ilike(search_pattern),
-                )
-            )
+            query, rank = apply_search(query, search, self.session.get_bind().dialect.name)
 
         if category_id:
             query = query.filter(ProductModel.category_id == category_id)
@@ -106,15 +228,130 @@ class ProductRepository(BaseRepositoryImpl):
         if active is not None:
             query = query.filter(ProductModel.active == active)
 
-        # Sorting
-        if sort_by == "price_asc":
-            query = query.order_by(ProductModel.price.asc())
-        elif sort_by == "price_desc":
-            query = query.order_by(ProductModel.price.desc())
-        elif sort_by == "name":
-            query = query.order_by(ProductModel.name.asc())
-        else:
-            query = query.order_by(ProductModel.id_key.desc())
-
-        products = query.offset(skip).limit(limit).all()
-        return [ProductSchema.model_validate(product) for product in products]
\ No newline at end of file
+        # Sorting + page (price / name / id_key, with id_key as tiebreaker, or relevance)
+        sort_key = product_sort_key(sort_by, search)
+        if sort_key is RELEVANCE_SORT:
+            query = order_by_relevance(query, rank)
+        products = apply_page(query, ProductModel, sort_key, cursor, skip, limit).all()
+        return [ProductSummarySchema.model_validate(product) for product in products]
+
+    def suggest(self, term: str, limit: int = 8) -> List[ProductSuggestionSchema]:
+        """Typeahead matches for a (normalized) search term."""
+        stmt = suggest_statement(term, limit, self.session.get_bind().dialect.name)
+        rows = self.session.execute(stmt).mappings().all()
+        return [ProductSuggestionSchema.model_validate(row) for row in rows]
+
+
+class AsyncProductRepository(AsyncBaseRepositoryImpl):
+    """Async repository for Product entity with the same loading strategy as ProductRepository."""
+
+    def __init__(self, db: AsyncSession):
+        super().__init__(ProductModel, ProductSchema, db)
+
+    async def find_all(self, skip: int = 0, limit: int = 100, include_inactive: bool = False,
+                       cursor: Optional[str] = None) -> List[ProductSummarySchema]:
+        """Get all products (active only unless include_inactive=True) without reviews or order_details."""
+        stmt = select(ProductModel).options(
+            joinedload(ProductModel.category),
+        )
+
+        if not include_inactive:
+            stmt = stmt.where(ProductModel.active == True)
+
+        stmt = apply_page(stmt, ProductModel, ID_ASC, cursor, skip, limit)
+        products = (await self.session.scalars(stmt)).unique().all()
+        return [ProductSummarySchema.model_validate(product) for product in products]
+
+    async def find_all_lean(self, skip: int = 0, limit: int = 100, include_inactive: bool = False,
+                            cursor: Optional[str] = None) -> List[ProductListSchema]:
+        """Same page as find_all as flat ProductListSchema rows (grid views)."""
+        stmt = lean_list_statement(skip, limit, include_inactive, cursor)
+        return to_list_schemas((await self.session.execute(stmt)).mappings())
+
+    async def find(self, id_key: int) -> ProductSchema:
+        """Get single product with order_details but without the nested product."""
+        from models.order_detail import OrderDetailModel
+
+        stmt = (
+            select(ProductModel)
+            .options(
+                joinedload(ProductModel.category),
+                selectinload(ProductModel.reviews),
+                selectinload(ProductModel.order_details).lazyload(OrderDetailModel.product)
+            )
+            .where(ProductModel.id_key == id_key)
+        )
+        product = (await self.session.scalars(stmt)).unique().first()
+
+        if not product:
+            raise InstanceNotFoundError(
+                f"Product with id {id_key} not found"
+            )
+
+        return await self._to_schema(product)
+
+    async def find_by_ids(self, ids: List[int]) -> List[ProductSchema]:
+        """Get several products in one IN query; missing IDs are absent from the result."""
+        if not ids:
+            return []
+
+        stmt = (
+            select(ProductModel)
+            .options(
+                joinedload(ProductModel.category),
+                selectinload(ProductModel.reviews),
+            )
+            .where(ProductModel.id_key.in_(ids))
+        )
+        products = (await self.session.scalars(stmt)).unique().all()
+        return await self._to_schemas(products)
+
+    async def filter_products(
+        self,
+        search: Optional[str] = None,
+        category_id: Optional[int] = None,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+        in_stock_only: bool = False,
+        active: Optional[bool] = True,
+        sort_by: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> List[ProductSummarySchema]:
+        """Filter products with optimized loading (keyset `cursor` or legacy skip)."""
+        stmt = select(ProductModel).options(
+            joinedload(ProductModel.category),
+        )
+
+        rank = None
+        if search:
+            stmt, rank = apply_search(stmt, search, self.session.get_bind().dialect.name)
+
+        if category_id:
+            stmt = stmt.where(ProductModel.category_id == category_id)
+
+        if min_price is not None:
+            stmt = stmt.where(ProductModel.price >= min_price)
+
+        if max_price is not None:
+            stmt = stmt.where(ProductModel.price <= max_price)
+
+        if in_stock_only:
+            stmt = stmt.where(ProductModel.stock > 0)
+
+        if active is not None:
+            stmt = stmt.where(ProductModel.active == active)
+
+        sort_key = product_sort_key(sort_by, search)
+        if sort_key is RELEVANCE_SORT:
+            stmt = order_by_relevance(stmt, rank)
+        stmt = apply_page(stmt, ProductModel, sort_key, cursor, skip, limit)
+        products = (await self.session.scalars(stmt)).unique().all()
+        return [ProductSummarySchema.model_validate(product) for product in products]
+
+    async def suggest(self, term: str, limit: int = 8) -> List[ProductSuggestionSchema]:
+        """Typeahead matches for a (normalized) search term."""
+        stmt = suggest_statement(term, limit, self.session.get_bind().dialect.name)
+        rows = (await self.session.execute(stmt)).mappings().all()
+        return [ProductSuggestionSchema.model_validate(row) for row in rows]
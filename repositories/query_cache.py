@@ -0,0 +1,159 @@
+"""
+Repository Query Cache
+
+Caches the find() / find_all() results of repositories that opt in with
+`query_cache_ttl`, keyed on the compiled SQL statement and its parameters,
+so every repository gets read caching without bespoke service code.
+
+Invalidation uses per-table version counters instead of tracking keys:
+- each table has a version: the generation of the "query:{table}" namespace
+  (Redis key gen:query:{table}, see CacheService.generations());
+- a cache key embeds the current version of every table its result depends
+  on: the tables of the statement plus the tables of the relationships the
+  schema serializes (ProductSchema nests category and reviews, so a new
+  review changes the products results too);
+- every commit that changes rows of a table bumps its version in the same
+  pipeline as the other invalidations (services.cache_invalidation), so
+  results read before the write become unreachable and expire by TTL.
+
+A cached read costs two Redis round trips (MGET of the versions, GET of the
+result) whatever the query.
+"""
+import hashlib
+import logging
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple, Type, get_args
+
+from pydantic import BaseModel as PydanticModel
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.sql import Select
+from sqlalchemy.sql.util import find_tables
+
+from config.constants import CacheConfig
+from services.cache_service import CacheService, cache_service
+
+logger = logging.getLogger(__name__)
+
+
+def table_namespace(table: str) -> str:
+    """Namespace whose generation is the version of a table"""
+    return f"query:{table}"
+
+
+def _nested_schema(annotation: Any) -> Optional[Type[PydanticModel]]:
+    """Pydantic model inside an annotation such as Optional[List[ReviewSchema]]"""
+    if isinstance(annotation, type) and issubclass(annotation, PydanticModel):
+        return annotation
+    for arg in get_args(annotation):
+        nested = _nested_schema(arg)
+        if nested is not None:
+            return nested
+    return None
+
+
+def schema_tables(model: Type, schema: Optional[Type[PydanticModel]]) -> Set[str]:
+    """Tables read when serializing instances of model with schema (nested relationships included)"""
+    tables = set()
+    pending = [(model, schema)]
+    seen = set()
+    while pending:
+        model, schema = pending.pop()
+        if (model, schema) in seen:
+            continue
+        seen.add((model, schema))
+
+        mapper = sa_inspect(model)
+        tables.update(table.name for table in mapper.tables)
+        fields = schema.model_fields if schema is not None else {}
+        for relationship in mapper.relationships:
+            field = fields.get(relationship.key)
+            if field is not None:
+                pending.append((relationship.mapper.class_, _nested_schema(field.annotation)))
+    return tables
+
+
+class QueryCache:
+    """Statement-keyed result cache with per-table versions"""
+
+    def __init__(self, cache: CacheService = cache_service, enabled: bool = CacheConfig.QUERY_CACHE_ENABLED):
+        self.cache = cache
+        self.enabled = enabled
+        self._schema_tables: Dict[Tuple[Type, Type], FrozenSet[str]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def tables_for(self, stmt: Select, model: Type, schema: Type[PydanticModel]) -> List[str]:
+        """Tables a result of stmt serialized with schema depends on"""
+        key = (model, schema)
+        if key not in self._schema_tables:
+            self._schema_tables[key] = frozenset(schema_tables(model, schema))
+        statement_tables = {table.name for table in find_tables(stmt, include_joins=True)}
+        return sorted(self._schema_tables[key] | statement_tables)
+
+    @staticmethod
+    def build_key(stmt: Select, label: str, versions: Dict[str, int]) -> str:
+        """Cache key of a statement at the given table versions"""
+        compiled = stmt.compile()
+        raw = f"{compiled}|{sorted(compiled.params.items())!r}|{sorted(versions.items())!r}"
+        return f"query:{label}:{hashlib.sha1(raw.encode()).hexdigest()}"
+
+    def _namespaces(self, stmt: Select, model: Type, schema: Type[PydanticModel]) -> List[str]:
+        return [table_namespace(table) for table in self.tables_for(stmt, model, schema)]
+
+    def _record(self, value: Any):
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+
+    def lookup(self, stmt: Select, model: Type, schema: Type[PydanticModel]) -> Tuple[Optional[str], Optional[Any]]:
+        """
+        Cached result of a statement
+
+        Returns:
+            (key, value): value is None on a miss; key is None when caching
+            is off or Redis is unavailable (nothing to store either)
+        """
+        if not self.enabled:
+            return None, None
+        versions = self.cache.generations(self._namespaces(stmt, model, schema))
+        if versions is None:
+            return None, None
+        key = self.build_key(stmt, f"{model.__tablename__}:{schema.__name__}", versions)
+        value = self.cache.get(key)
+        self._record(value)
+        return key, value
+
+    async def alookup(self, stmt: Select, model: Type, schema: Type[PydanticModel]) -> Tuple[Optional[str], Optional[Any]]:
+        """Async version of lookup()"""
+        if not self.enabled:
+            return None, None
+        versions = await self.cache.agenerations(self._namespaces(stmt, model, schema))
+        if versions is None:
+            return None, None
+        key = self.build_key(stmt, f"{model.__tablename__}:{schema.__name__}", versions)
+        value = await self.cache.aget(key)
+        self._record(value)
+        return key, value
+
+    def store(self, key: Optional[str], value: Any, ttl: int):
+        """Store a result under the key returned by lookup() (versions read before the query)"""
+        if key is not None:
+            self.cache.set(key, value, ttl)
+
+    async def astore(self, key: Optional[str], value: Any, ttl: int):
+        """Async version of store()"""
+        if key is not None:
+            await self.cache.aset(key, value, ttl)
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+        }
+
+
+# Global query cache shared by every repository
+query_cache = QueryCache()
@@ -1,12 +1,44 @@
 """Review repository for database operations."""
+from typing import List, Optional
+
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
+from config.constants import CacheConfig
 from models.review import ReviewModel
 from repositories.base_repository_impl import BaseRepositoryImpl
 from schemas.review_schema import ReviewSchema
+from utils.cursor_pagination import SortKey, apply_page
+
+# Reviews of a product, newest first
+NEWEST_REVIEWS = SortKey("newest", ("id_key",), descending=True)
+
 
 class ReviewRepository(BaseRepositoryImpl):
     """Repository for Review entity database operations."""
 
+    query_cache_ttl = CacheConfig.QUERY_CACHE_TTL
+
     def __init__(self, db: Session):
-        super().__init__(ReviewModel, ReviewSchema, db)
\ No newline at end of file
+        super().__init__(ReviewModel, ReviewSchema, db)
+
+    def find_by_product(self, product_id: int, skip: int = 0, limit: int = 20,
+                        cursor: Optional[str] = None) -> List[ReviewSchema]:
+        """
+        One page of a product's reviews, newest first
+
+        Uses the reviews.product_id index; `cursor` (keyset) replaces skip
+        for deep pages. Cached in the query cache until reviews change.
+        """
+        limit = self._validate_pagination(skip, limit)
+        stmt = apply_page(
+            select(ReviewModel).where(ReviewModel.product_id == product_id),
+            ReviewModel, NEWEST_REVIEWS, cursor, skip, limit
+        )
+        key, cached = self._query_cache_lookup(stmt)
+        if cached is not None:
+            return [ReviewSchema.model_validate(item) for item in cached]
+
+        results = [ReviewSchema.model_validate(review) for review in self.session.scalars(stmt)]
+        self._query_cache_store(key, results)
+        return results
@@ -15,14 +15,30 @@ class ProductBaseSchema(BaseSchema):
     category_id: Optional[int] = Field(None)
     active: bool = True # Vital para el borrado lógico
 
-# ✅ ESQUEMA DE LECTURA: Aquí sí incluimos los objetos anidados
-class ProductSchema(ProductBaseSchema):
+# ✅ ESQUEMA DE LISTADO LIVIANO (grilla): columnas planas + agregados de reviews,
+# sin category ni reviews. Se construye directo desde filas Core (find_all_lean)
+class ProductListSchema(ProductBaseSchema):
+    # Solo lectura: los mantiene ReviewService
+    rating_avg: Optional[float] = None
+    rating_count: int = 0
+
+# ✅ ESQUEMA DE LISTADOS (GET / y /filter): con category, sin la lista de reviews
+class ProductSummarySchema(ProductListSchema):
     model_config = ConfigDict(from_attributes=True)
-    
+
+    category: Optional[CategoryBaseSchema] = None
+
+# ✅ ESQUEMA DE LECTURA (detalle): Aquí sí incluimos los objetos anidados
+class ProductSchema(ProductSummarySchema):
     # Estos campos son solo para mostrar datos, no para guardar
-    category: Optional[CategoryBaseSchema] = None 
     reviews: Optional[List['ReviewSchema']] = []
 
+# ✅ ESQUEMA DE SUGERENCIAS (typeahead): solo lo que muestra el buscador
+class ProductSuggestionSchema(BaseSchema):
+    name: str
+    price: float
+    image_url: Optional[str] = None
+
 # ✅ ESQUEMAS DE ESCRITURA: Limpios (heredan de Base)
 class ProductCreateSchema(ProductBaseSchema):
     pass
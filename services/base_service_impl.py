@@ -1,8 +1,10 @@
 """
 Module for Base Service Implementation
 """
-from typing import List, Type
+from typing import Any, Awaitable, Callable, List, Optional, Type
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from config.database import SessionLocal, new_async_session
 from models.base_model import BaseModel
 from services.base_service import BaseService
 from repositories.base_repository import BaseRepository
@@ -36,9 +38,9 @@ class BaseServiceImpl(BaseService):
         """SQLAlchemy Model"""
         return self._model
 
-    def get_all(self, skip: int = 0, limit: int = 100) -> List[BaseSchema]:
-        """Get all data with pagination"""
-        return self.repository.find_all(skip=skip, limit=limit)
+    def get_all(self, skip: int = 0, limit: int = 100, cursor: Optional[str] = None) -> List[BaseSchema]:
+        """Get all data with pagination (keyset `cursor` or legacy skip)"""
+        return self.repository.find_all(skip=skip, limit=limit, cursor=cursor)
 
     def get_one(self, id_key: int) -> BaseSchema:
         """Get one data"""
@@ -56,8 +58,61 @@ class BaseServiceImpl(BaseService):
         """Delete data"""
         self.repository.remove(id_key)
 
+    def _run_in_new_session(self, func: Callable[[BaseRepository], Any]) -> Any:
+        """
+        Run func(repository) on a fresh DB session
+
+        For work that may outlive the request session (background cache
+        refreshes), which must not touch the request-scoped repository.
+        """
+        db = SessionLocal()
+        try:
+            return func(self._repository_class(db))
+        finally:
+            db.close()
+
+    async def _arun_in_new_session(self, func: Callable[[BaseRepository], Awaitable[Any]]) -> Any:
+        """Async version of _run_in_new_session() for async repositories"""
+        async with new_async_session() as db:
+            return await func(self._repository_class(db))
+
     def to_model(self, schema: BaseSchema) -> BaseModel:
         """Convert schema to model"""
         model_class = type(self.model) if not callable(self.model) else self.model
         model_instance = model_class(**schema.model_dump(exclude_unset=True))
         return model_instance
+
+
+class AsyncBaseServiceImpl(BaseServiceImpl):
+    """
+    Async Base Service Implementation
+
+    Same contract as BaseServiceImpl but backed by an async repository
+    (AsyncBaseRepositoryImpl), so every operation must be awaited.
+    """
+
+    def __init__(self, repository_class: Type[BaseRepository],
+                 model: Type[BaseModel],
+                 schema: Type[BaseSchema],
+                 db: AsyncSession):
+        super().__init__(repository_class, model, schema, db)
+
+    async def get_all(self, skip: int = 0, limit: int = 100, cursor: Optional[str] = None) -> List[BaseSchema]:
+        """Get all data with pagination (keyset `cursor` or legacy skip)"""
+        return await self.repository.find_all(skip=skip, limit=limit, cursor=cursor)
+
+    async def get_one(self, id_key: int) -> BaseSchema:
+        """Get one data"""
+        return await self.repository.find(id_key)
+
+    async def save(self, schema: BaseSchema) -> BaseSchema:
+        """Save data"""
+        return await self.repository.save(self.to_model(schema))
+
+    async def update(self, id_key: int, schema: BaseSchema) -> BaseSchema:
+        """Update data"""
+        return await self.repository.update(id_key, schema.model_dump(exclude_unset=True))
+
+    async def delete(self, id_key: int) -> None:
+        """Delete data"""
+        await self.repository.remove(id_key)
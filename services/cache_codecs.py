@@ -0,0 +1,167 @@
+"""
+Cache Codecs Module
+
+Binary serialization for cache values: a serializer (json, orjson, msgpack)
+optionally followed by compression (zlib, lz4) once the payload is larger
+than a threshold.
+
+Encoded values start with a two-byte header (b"\\x00" + format byte) so they
+can be told apart from the plain JSON text written by the legacy path; a value
+without the header is decoded as JSON, which keeps old entries readable
+after a codec is enabled for their prefix.
+
+orjson, msgpack and lz4 are optional: when one is missing the codec falls
+back to stdlib json / zlib and logs a warning.
+"""
+import datetime
+import decimal
+import json
+import logging
+import zlib
+from typing import Any, Dict
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional dependency
+    msgpack = None
+
+try:
+    import lz4.frame as lz4_frame
+except ImportError:  # pragma: no cover - optional dependency
+    lz4_frame = None
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"\x00"
+
+SERIALIZERS = {"json": 1, "orjson": 2, "msgpack": 3}
+COMPRESSORS = {"none": 0, "zlib": 1, "lz4": 2}
+
+
+def _default(value: Any) -> Any:
+    """Fallback for types the serializers do not know (same as FastAPI's encoder)"""
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, decimal.Decimal):
+        return float(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not serializable")
+
+
+def _dumps(serializer: str, value: Any) -> bytes:
+    if serializer == "orjson":
+        return orjson.dumps(value, default=_default)
+    if serializer == "msgpack":
+        return msgpack.packb(value, default=_default, use_bin_type=True)
+    return json.dumps(value, default=_default, separators=(",", ":")).encode("utf-8")
+
+
+def _loads(serializer: str, data: bytes) -> Any:
+    if serializer == "orjson":
+        return orjson.loads(data)
+    if serializer == "msgpack":
+        return msgpack.unpackb(data, raw=False)
+    return json.loads(data)
+
+
+def _compress(compressor: str, data: bytes) -> bytes:
+    if compressor == "lz4":
+        return lz4_frame.compress(data)
+    return zlib.compress(data, 1)
+
+
+def _decompress(compressor: str, data: bytes) -> bytes:
+    if compressor == "lz4":
+        return lz4_frame.decompress(data)
+    return zlib.decompress(data)
+
+
+class CacheCodec:
+    """
+    Serializer + optional compression, described by a spec string
+
+    Specs: "json", "orjson", "msgpack", optionally suffixed with "+zlib" or
+    "+lz4", e.g. "orjson+lz4".
+    """
+
+    def __init__(self, spec: str, compression_threshold: int = 1024):
+        serializer, _, compressor = spec.strip().lower().partition("+")
+        compressor = compressor or "none"
+
+        if serializer not in SERIALIZERS:
+            raise ValueError(f"Unknown cache serializer: {serializer}")
+        if compressor not in COMPRESSORS:
+            raise ValueError(f"Unknown cache compressor: {compressor}")
+
+        if serializer == "orjson" and orjson is None:
+            logger.warning("⚠️  orjson not installed, cache codec falls back to json")
+            serializer = "json"
+        if serializer == "msgpack" and msgpack is None:
+            logger.warning("⚠️  msgpack not installed, cache codec falls back to json")
+            serializer = "json"
+        if compressor == "lz4" and lz4_frame is None:
+            logger.warning("⚠️  lz4 not installed, cache codec falls back to zlib")
+            compressor = "zlib"
+
+        self.serializer = serializer
+        self.compressor = compressor
+        self.compression_threshold = compression_threshold
+        self.spec = serializer if compressor == "none" else f"{serializer}+{compressor}"
+
+    def encode(self, value: Any) -> bytes:
+        """Serialize (and compress above the threshold) with a format header"""
+        payload = _dumps(self.serializer, value)
+        compressor = "none"
+        if self.compressor != "none" and len(payload) >= self.compression_threshold:
+            payload = _compress(self.compressor, payload)
+            compressor = self.compressor
+
+        header = (SERIALIZERS[self.serializer] << 4) | COMPRESSORS[compressor]
+        return MAGIC + bytes([header]) + payload
+
+    @staticmethod
+    def decode(data: Any) -> Any:
+        """
+        Decode any value written by encode() (whatever its codec) or by the
+        legacy text path
+        """
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+
+        if not data.startswith(MAGIC) or len(data) < 2:
+            # Legacy text value: same rules as CacheService._deserialize
+            try:
+                return json.loads(data)
+            except ValueError:
+                return data.decode("utf-8")
+
+        header = data[1]
+        serializer = _name_of(SERIALIZERS, header >> 4)
+        compressor = _name_of(COMPRESSORS, header & 0x0F)
+        payload = data[2:]
+
+        if compressor != "none":
+            payload = _decompress(compressor, payload)
+        return _loads(serializer, payload)
+
+    def __repr__(self) -> str:
+        return f"CacheCodec({self.spec!r})"
+
+
+def _name_of(table: Dict[str, int], code: int) -> str:
+    for name, value in table.items():
+        if value == code:
+            return name
+    raise ValueError(f"Unknown cache codec code: {code}")
+
+
+def build_codecs(policies: Dict[str, str], compression_threshold: int = 1024) -> Dict[str, CacheCodec]:
+    """Instantiate one CacheCodec per key prefix policy"""
+    return {
+        prefix: CacheCodec(spec, compression_threshold)
+        for prefix, spec in policies.items()
+    }
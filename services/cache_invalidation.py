@@ -0,0 +1,227 @@
+"""
+Model-driven Cache Invalidation
+
+Maps ORM models to the cache entries derived from them and evicts those
+entries whenever a transaction that changed such a row commits, no matter
+which service (or controller) made the change. For example, OrderDetailService
+decrementing ProductModel.stock evicts the product like a product edit would.
+
+- after_flush collects, for every new / modified / deleted instance of a
+  registered model, its keys and namespaces into session.info. Flushes of
+  one transaction accumulate.
+- after_commit applies them all with a single CacheService.invalidate()
+  call (one pipelined round trip), so the cache never changes before the
+  data is committed. Sync sessions always invalidate synchronously, so
+  the next read of the same request sees the new data. Commits of an
+  AsyncSession schedule ainvalidate() as a task instead of blocking the
+  loop; the async repositories await settle(session) right after commit.
+- after_rollback drops them: nothing was committed.
+
+Every changed table also gets its query cache version bumped (namespace
+"query:{table}", see repositories.query_cache), in the same pipeline.
+
+The listeners are installed on the Session class, so they cover the sync
+sessions and the sync sessions behind AsyncSession alike.
+
+Services register their models at import time:
+
+    cache_invalidation.register(
+        ProductModel,
+        namespaces=("products:list", "products:filter"),
+        keys=lambda product: product_cache_keys(product.id_key),
+    )
+"""
+import asyncio
+import logging
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Set, Tuple, Type
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_session
+from sqlalchemy.orm import Session, object_mapper
+
+from config.constants import CacheConfig
+from repositories.query_cache import table_namespace
+from services.cache_service import CacheService, cache_service
+
+logger = logging.getLogger(__name__)
+
+PENDING_INFO_KEY = "cache_invalidations"
+TASKS_INFO_KEY = "cache_invalidation_tasks"
+
+
+class InvalidationRule(NamedTuple):
+    namespaces: Tuple[str, ...]
+    keys: Callable[[Any], Iterable[str]]
+
+
+class CacheInvalidationRegistry:
+    """Registry of model -> cache entries, applied on transaction commit"""
+
+    def __init__(self, cache: CacheService = cache_service, table_versions: bool = CacheConfig.QUERY_CACHE_ENABLED):
+        """
+        Args:
+            cache: Cache to invalidate
+            table_versions: Also bump the query cache version of every changed table
+        """
+        self.cache = cache
+        self.table_versions = table_versions
+        self._rules: Dict[Type, List[InvalidationRule]] = {}
+        self._installed = False
+        # Strong references to the scheduled async invalidations (the loop keeps only weak ones)
+        self._tasks: Set[asyncio.Future] = set()
+        self.commits = 0
+        self.errors = 0
+
+    def register(
+        self,
+        model: Type,
+        namespaces: Iterable[str] = (),
+        keys: Callable[[Any], Iterable[str]] = lambda instance: ()
+    ):
+        """
+        Declare the cache entries derived from a model
+
+        Args:
+            model: ORM model class (subclasses are covered too)
+            namespaces: Namespaces invalidated whenever any row changes
+            keys: keys(instance) -> cache keys of that row
+        """
+        self._rules.setdefault(model, []).append(InvalidationRule(tuple(namespaces), keys))
+
+    def _rules_for(self, instance: Any) -> List[InvalidationRule]:
+        rules = []
+        for cls in type(instance).__mro__:
+            rules.extend(self._rules.get(cls, ()))
+        return rules
+
+    def collect(self, session: Session) -> Tuple[Set[str], Set[str]]:
+        """Keys and namespaces affected by the instances about to be flushed"""
+        keys, namespaces = set(), set()
+        for instance in list(session.new) + list(session.dirty) + list(session.deleted):
+            rules = self._rules_for(instance)
+            if not (rules or self.table_versions):
+                continue
+            if instance in session.dirty and not session.is_modified(instance, include_collections=False):
+                continue
+            if self.table_versions:
+                namespaces.update(table_namespace(table.name) for table in object_mapper(instance).tables)
+            for rule in rules:
+                namespaces.update(rule.namespaces)
+                keys.update(key for key in rule.keys(instance) if key)
+        return keys, namespaces
+
+    def collect_rows(self, table: str, rows: Iterable[Dict[str, Any]]) -> Tuple[Set[str], Set[str]]:
+        """
+        Keys and namespaces affected by raw row changes of a table
+
+        For changes seen outside the ORM (DB NOTIFY). Each row holds the
+        columns the key functions read (primary and foreign keys); with no
+        rows (e.g. TRUNCATE) only the namespaces are returned.
+        """
+        rows = list(rows)
+        keys, namespaces = set(), set()
+        if self.table_versions:
+            namespaces.add(table_namespace(table))
+        for model, rules in self._rules.items():
+            if getattr(model, "__tablename__", None) != table:
+                continue
+            for rule in rules:
+                namespaces.update(rule.namespaces)
+                for row in rows:
+                    keys.update(key for key in rule.keys(SimpleNamespace(**row)) if key)
+        return keys, namespaces
+
+    def namespaces(self) -> List[str]:
+        """Every registered namespace"""
+        return sorted({namespace for rules in self._rules.values() for rule in rules for namespace in rule.namespaces})
+
+    # ------------------------------------------------------------------
+    # Session events
+    # ------------------------------------------------------------------
+
+    def _after_flush(self, session: Session, flush_context):
+        try:
+            keys, namespaces = self.collect(session)
+        except Exception as e:
+            # Never break a flush because of the cache
+            self.errors += 1
+            logger.error(f"Error collecting cache invalidations: {e}")
+            return
+        if keys or namespaces:
+            pending_keys, pending_namespaces = session.info.setdefault(PENDING_INFO_KEY, (set(), set()))
+            pending_keys.update(keys)
+            pending_namespaces.update(namespaces)
+
+    def _after_commit(self, session: Session):
+        pending = session.info.pop(PENDING_INFO_KEY, None)
+        if pending is None:
+            return
+        keys, namespaces = pending
+        self.commits += 1
+        logger.debug(f"Invalidating {len(keys)} keys and {sorted(namespaces)} after commit")
+        if async_session(session) is None:
+            # Sync session (threadpool or inline dispatch, scripts): nothing
+            # would await a task, so invalidate before commit() returns
+            self.cache.invalidate(sorted(keys), sorted(namespaces))
+            return
+
+        # Sync session behind an AsyncSession: runs on the event loop.
+        # ainvalidate() / invalidate() each claim the breaker themselves
+        loop = asyncio.get_running_loop()
+        if self.cache.async_redis_client is not None:
+            task = loop.create_task(self.cache.ainvalidate(sorted(keys), sorted(namespaces)))
+        else:
+            task = loop.run_in_executor(None, self.cache.invalidate, sorted(keys), sorted(namespaces))
+        self._tasks.add(task)
+        task.add_done_callback(self._task_done)
+        session.info.setdefault(TASKS_INFO_KEY, set()).add(task)
+
+    def _task_done(self, task: asyncio.Future):
+        self._tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            self.errors += 1
+            logger.error(f"Error invalidating cache after commit: {task.exception()}")
+
+    async def settle(self, session: Any):
+        """
+        Wait for the invalidations scheduled by the commits of a session
+
+        Async repositories call it right after commit, so a read that
+        follows a write in the same request never sees the old entry.
+        """
+        tasks = session.info.pop(TASKS_INFO_KEY, None)
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _after_rollback(self, session: Session):
+        session.info.pop(PENDING_INFO_KEY, None)
+
+    def install(self, session_class: Type = Session):
+        """Listen to the session events (idempotent)"""
+        if self._installed:
+            return
+        event.listen(session_class, "after_flush", self._after_flush)
+        event.listen(session_class, "after_commit", self._after_commit)
+        event.listen(session_class, "after_rollback", self._after_rollback)
+        self._installed = True
+
+    def uninstall(self, session_class: Type = Session):
+        if not self._installed:
+            return
+        event.remove(session_class, "after_flush", self._after_flush)
+        event.remove(session_class, "after_commit", self._after_commit)
+        event.remove(session_class, "after_rollback", self._after_rollback)
+        self._installed = False
+
+    def stats(self) -> dict:
+        return {
+            "models": sorted(model.__name__ for model in self._rules),
+            "commits": self.commits,
+            "errors": self.errors,
+        }
+
+
+# Global registry, listening on every Session of the process
+cache_invalidation = CacheInvalidationRegistry()
+cache_invalidation.install()
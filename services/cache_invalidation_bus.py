@@ -0,0 +1,264 @@
+"""
+Cache Invalidation Bus
+
+Keeps the per-worker L1 caches coherent across uvicorn workers.
+
+Every invalidation a worker applies to Redis (delete, delete_pattern,
+clear_all) is also published on a Redis pub/sub channel. Each worker runs a
+background subscriber thread that applies the messages it receives from the
+other workers to its own L1 tier.
+
+Pub/sub is fire-and-forget, so every message carries a per-origin sequence
+number. Sequence numbers are taken before the publish (single publishes and
+pipelines run concurrently), so messages of one origin may arrive slightly
+out of order: a missing number only counts as lost if it has not arrived
+within the reorder window. A lost message (or a lost subscriber connection)
+means some invalidation may have been missed, and the whole local tier is
+flushed. Publishes that fail give their sequence number back when possible.
+"""
+import json
+import logging
+import os
+import socket
+import threading
+import time
+import uuid
+from typing import Callable, Dict, Iterable, Optional
+
+from services.local_cache import LocalCache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHANNEL = "cache:invalidation"
+# Jumps larger than this are treated as lost messages right away
+MAX_PENDING_GAP = 100
+
+
+class CacheInvalidationBus:
+    """
+    Publishes L1 invalidations and applies the ones published by other workers
+
+    Message format (JSON):
+        {"origin": "<host>:<pid>:<id>", "seq": 42, "op": "key" | "pattern" | "flush", "target": "products:*"}
+    """
+
+    def __init__(
+        self,
+        local_cache: LocalCache,
+        client_factory: Callable,
+        channel: str = DEFAULT_CHANNEL,
+        reconnect_delay: float = 1.0,
+        reorder_window: float = 1.0
+    ):
+        """
+        Args:
+            local_cache: L1 tier of this worker
+            client_factory: Returns the sync Redis client (or None when Redis is down)
+            channel: Pub/sub channel shared by all workers
+            reconnect_delay: Seconds to wait before re-subscribing after an error
+            reorder_window: Seconds a missing sequence number may arrive late
+                before it is treated as lost
+        """
+        self.local_cache = local_cache
+        self.client_factory = client_factory
+        self.channel = channel
+        self.reconnect_delay = reconnect_delay
+        self.reorder_window = reorder_window
+        self.origin = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+        self._last_seq = 0
+        self._sequence_lock = threading.Lock()
+        # Per origin: next expected seq, and missing seqs -> deadline
+        self._expected: Dict[str, int] = {}
+        self._missing: Dict[str, Dict[int, float]] = {}
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self.published = 0
+        self.applied = 0
+        self.gap_flushes = 0
+
+    # ------------------------------------------------------------------
+    # Publishing
+    # ------------------------------------------------------------------
+
+    def build_message(self, op: str, target: str = "") -> str:
+        """Serialize an invalidation with the next sequence number of this worker"""
+        with self._sequence_lock:
+            self._last_seq += 1
+            seq = self._last_seq
+        return json.dumps({"origin": self.origin, "seq": seq, "op": op, "target": target})
+
+    def release(self, messages: Iterable[str]) -> None:
+        """
+        Give back the sequence numbers of messages that were never published
+
+        Only possible while they are still the newest numbers issued; if a
+        later message was built meanwhile the gap stays, and subscribers
+        flush once it outlives the reorder window.
+        """
+        seqs = sorted(json.loads(message)["seq"] for message in messages)
+        if not seqs:
+            return
+        with self._sequence_lock:
+            if seqs == list(range(self._last_seq - len(seqs) + 1, self._last_seq + 1)):
+                self._last_seq -= len(seqs)
+
+    def publish(self, op: str, target: str = "") -> bool:
+        """Publish an invalidation using the sync Redis client"""
+        client = self.client_factory()
+        if client is None:
+            return False
+        message = self.build_message(op, target)
+        try:
+            client.publish(self.channel, message)
+            self.published += 1
+            return True
+        except Exception as e:
+            self.release([message])
+            logger.error(f"Cache invalidation publish error ({op} {target}): {e}")
+            return False
+
+    async def apublish(self, async_client, op: str, target: str = "") -> bool:
+        """Publish an invalidation using the redis.asyncio client"""
+        if async_client is None:
+            return False
+        message = self.build_message(op, target)
+        try:
+            await async_client.publish(self.channel, message)
+            self.published += 1
+            return True
+        except Exception as e:
+            self.release([message])
+            logger.error(f"Cache invalidation publish error ({op} {target}): {e}")
+            return False
+
+    # ------------------------------------------------------------------
+    # Subscribing
+    # ------------------------------------------------------------------
+
+    def handle_message(self, raw: str) -> None:
+        """Apply one message received from the channel to the local tier"""
+        try:
+            message = json.loads(raw)
+            origin = message["origin"]
+            seq = int(message["seq"])
+            op = message["op"]
+            target = message.get("target", "")
+        except (ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring malformed cache invalidation message: {e}")
+            return
+
+        if origin == self.origin:
+            return
+
+        now = time.monotonic()
+        expected = self._expected.get(origin)
+        if expected is None or seq >= expected:
+            self._expected[origin] = seq + 1
+            if expected is not None and seq - expected > MAX_PENDING_GAP:
+                self._flush_gap(f"{origin} jumped from {expected - 1} to {seq}")
+                return
+            if expected is not None and seq > expected:
+                # Possibly just reordered: wait for the missing ones a little
+                missing = self._missing.setdefault(origin, {})
+                for lost in range(expected, seq):
+                    missing[lost] = now + self.reorder_window
+        else:
+            # Late arrival of a missing seq (or a duplicate): still applied
+            missing = self._missing.get(origin, {})
+            missing.pop(seq, None)
+            if not missing:
+                self._missing.pop(origin, None)
+
+        self._apply(op, target)
+        self.expire_gaps(now)
+
+    def expire_gaps(self, now: Optional[float] = None) -> bool:
+        """Flush the local tier if a missing seq outlived the reorder window"""
+        now = time.monotonic() if now is None else now
+        for origin, missing in self._missing.items():
+            lost = [seq for seq, deadline in missing.items() if deadline <= now]
+            if lost:
+                self._flush_gap(f"{origin} never delivered seq {min(lost)}")
+                return True
+        return False
+
+    def _flush_gap(self, reason: str) -> None:
+        # Missed messages: the only safe option is to drop everything held
+        # locally. Older missing seqs are covered by the flush too
+        logger.warning(f"Cache invalidation gap ({reason}), flushing local cache")
+        self.gap_flushes += 1
+        self.local_cache.clear()
+        self._missing.clear()
+
+    def _apply(self, op: str, target: str) -> None:
+        if op == "key":
+            self.local_cache.delete(target)
+        elif op == "pattern":
+            self.local_cache.delete_pattern(target)
+        elif op == "flush":
+            self.local_cache.clear()
+        else:
+            logger.warning(f"Unknown cache invalidation op: {op}")
+            return
+        self.applied += 1
+
+    def _listen(self):
+        while not self._stop_event.is_set():
+            client = self.client_factory()
+            if client is None:
+                self._stop_event.wait(self.reconnect_delay)
+                continue
+
+            pubsub = client.pubsub(ignore_subscribe_messages=True)
+            try:
+                pubsub.subscribe(self.channel)
+                # Anything published while we were not subscribed is lost
+                self.local_cache.clear()
+                self._expected.clear()
+                self._missing.clear()
+                logger.info(f"✅ Cache invalidation subscriber listening on '{self.channel}'")
+
+                while not self._stop_event.is_set():
+                    message = pubsub.get_message(timeout=1.0)
+                    if message and message.get("type") == "message":
+                        self.handle_message(message["data"])
+                    else:
+                        self.expire_gaps()
+
+            except Exception as e:
+                logger.error(f"Cache invalidation subscriber error: {e}")
+                self.local_cache.clear()
+                self._stop_event.wait(self.reconnect_delay)
+
+            finally:
+                try:
+                    pubsub.close()
+                except Exception:
+                    pass
+
+    def start(self) -> None:
+        """Start the background subscriber thread (idempotent)"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._listen, name="cache-invalidation-bus", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 2.0) -> None:
+        """Stop the subscriber thread"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def stats(self) -> dict:
+        return {
+            "channel": self.channel,
+            "origin": self.origin,
+            "running": self._thread is not None and self._thread.is_alive(),
+            "published": self.published,
+            "applied": self.applied,
+            "gap_flushes": self.gap_flushes,
+        }
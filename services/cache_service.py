@@ -4,18 +4,60 @@ Cache Service Module
 Provides high-level caching operations using Redis with automatic
 serialization, TTL management, error handling, and distributed cache stampede protection.
 """
+import asyncio
+import contextlib
+import inspect
 import json
 import logging
+import math
+import random
+import threading
 import time
-from typing import Optional, Any, List, Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, Any, Iterable, List, Callable, Tuple
 from datetime import timedelta
 import os
 
-from config.redis_config import get_redis_client
+from config.constants import CacheConfig
+from config.redis_config import (
+    get_async_binary_redis_client,
+    get_async_redis_client,
+    get_binary_redis_client,
+    get_redis_client,
+    redis_breaker,
+)
+from services.cache_codecs import CacheCodec, build_codecs
+from services.cache_invalidation_bus import CacheInvalidationBus
+from services.local_cache import LocalCache
+from services.redis_lock import RedisLock
 from utils.logging_utils import get_sanitized_logger
 
 logger = get_sanitized_logger(__name__)
 
+# Marks entries written by get_or_set(stale_ttl=... / beta=...):
+# {SWR_MARKER: soft_expiry, "delta": compute_seconds, "value": ...}
+SWR_MARKER = "__swr__"
+
+
+class CacheUnavailableError(Exception):
+    """Redis call refused by the circuit breaker"""
+
+
+def should_refresh(expiry: float, delta: float, beta: Optional[float] = None,
+                   now: Optional[float] = None) -> bool:
+    """
+    Whether a cache hit should refresh an entry
+
+    True once the soft expiry has passed. With beta (XFetch, Vattani et al.)
+    it may also be True before, with a probability that grows as expiry
+    approaches and with the recompute time `delta`.
+    """
+    now = time.time() if now is None else now
+    if beta:
+        # 1 - random() is in (0, 1], so the log is <= 0 and moves `now` forward
+        now -= delta * beta * math.log(1.0 - random.random())
+    return now >= expiry
+
 
 class CacheService:
     """
@@ -26,17 +68,516 @@ class CacheService:
 
     Uses distributed Redis locks for cache stampede protection,
     making it safe for multi-worker/multi-process deployments.
+
+    Every core operation has an asyncio counterpart prefixed with "a"
+    (aget, aset, adelete, adelete_pattern, aget_or_set) that uses the
+    redis.asyncio pool and never blocks the event loop.
+
+    When CACHE_L1_ENABLED=true, reads consult a bounded in-process LRU (L1)
+    before Redis (L2). Only key prefixes listed in CacheConfig.L1_TTL_POLICIES
+    are kept in L1, each with its own short TTL. Deletes are broadcast to the
+    other workers through CacheInvalidationBus so their L1 copies are evicted.
+
+    Keys under a versioned namespace (CacheConfig.VERSIONED_NAMESPACES) embed
+    the namespace generation in their Redis name, e.g.
+    "products:list:skip:0" -> "products:list:g7:skip:0". invalidate_namespace()
+    bumps the generation with a single INCR and the old entries simply expire.
+
+    Prefixes listed in CacheConfig.CODEC_POLICIES are stored with a binary
+    codec (orjson/msgpack, optionally compressed) through a bytes-returning
+    Redis connection; everything else keeps the plain JSON text format.
+
+    Redis calls go through the shared redis_breaker: while it is open,
+    is_available() is False and every method takes its no-cache path
+    (get_or_set computes straight from the DB) without touching Redis.
+    Each logical operation claims the breaker once (allow()); its later
+    round trips (locks, re-reads, stores) pass that decision down through
+    _guarded(), so a half-open probe is not spent per round trip.
     """
 
-    def __init__(self):
+    SCAN_BATCH_SIZE = 500
+    # Longest single BLPOP while waiting for a lock holder; waiters normally
+    # wake on release, this only matters if the holder dies (below socket_timeout)
+    LOCK_WAIT_SLICE = 1.0
+    # Longest total wait of a sync get_or_set called on the event loop thread
+    # (inline service dispatch): every waiting second stalls the whole worker
+    LOOP_LOCK_WAIT = 0.3
+
+    def __init__(
+        self,
+        l1_enabled: bool = CacheConfig.L1_ENABLED,
+        l1_max_entries: int = CacheConfig.L1_MAX_ENTRIES,
+        l1_policies: Optional[Dict[str, int]] = None,
+        versioned_namespaces: Optional[Tuple[str, ...]] = None,
+        codec_policies: Optional[Dict[str, str]] = None
+    ):
         self.redis_client = get_redis_client()
+        self.async_redis_client = get_async_redis_client()
+        # decode_responses=False connections for codec-encoded values
+        self.binary_redis_client = get_binary_redis_client()
+        self.async_binary_redis_client = get_async_binary_redis_client()
         self.enabled = os.getenv('REDIS_ENABLED', 'true').lower() == 'true'
         self.default_ttl = int(os.getenv('REDIS_CACHE_TTL', '300'))  # 5 minutes
         self.lock_timeout = 10  # Lock auto-expire after 10 seconds
+        self.breaker = redis_breaker
+        self.versioned_namespaces = tuple(
+            CacheConfig.VERSIONED_NAMESPACES if versioned_namespaces is None else versioned_namespaces
+        )
+        self.codecs: Dict[str, CacheCodec] = build_codecs(
+            CacheConfig.CODEC_POLICIES if codec_policies is None else codec_policies,
+            CacheConfig.COMPRESSION_THRESHOLD
+        )
+
+        # L1: per-worker LRU in front of Redis
+        self.local_cache = LocalCache(l1_max_entries) if l1_enabled else None
+        self.l1_policies = dict(CacheConfig.L1_TTL_POLICIES if l1_policies is None else l1_policies)
+        self._l2_hits = 0
+        self._l2_misses = 0
+        self._stats_lock = threading.Lock()
+
+        # Stale-while-revalidate background refreshes
+        self._refresh_executor: Optional[ThreadPoolExecutor] = None
+        self._refresh_tasks = set()
+        self._stale_refreshes = 0
+        self._early_recomputes = 0
+
+        self._invalidation_listeners: List[Callable[[str], None]] = []
+        self.invalidation_bus = (
+            CacheInvalidationBus(self.local_cache, lambda: self.redis_client, CacheConfig.INVALIDATION_CHANNEL)
+            if self.local_cache is not None else None
+        )
 
     def is_available(self) -> bool:
-        """Check if cache is available"""
-        return self.enabled and self.redis_client is not None
+        """Check if cache is available (configured, connected and circuit not open)"""
+        return self.enabled and self.redis_client is not None and self.breaker.allow()
+
+    def is_async_available(self) -> bool:
+        """Check if the asyncio cache client is available (and circuit not open)"""
+        return self.enabled and self.async_redis_client is not None and self.breaker.allow()
+
+    @contextlib.contextmanager
+    def _guarded(self, admitted: bool = False, timed: bool = True):
+        """
+        One Redis round trip through the circuit breaker
+
+        Args:
+            admitted: The operation already claimed the breaker (allow());
+                the call is then only refused if the breaker opened meanwhile
+            timed: Record the latency (False for blocking waits such as BLPOP,
+                whose duration says nothing about Redis health)
+
+        Raises:
+            CacheUnavailableError: If the breaker refuses the call
+        """
+        allowed = not self.breaker.is_open() if admitted else self.breaker.allow()
+        if not allowed:
+            raise CacheUnavailableError(f"circuit '{self.breaker.name}' is open")
+        if timed:
+            with self.breaker.track():
+                yield
+            return
+        try:
+            yield
+        except self.breaker.failure_exceptions:
+            self.breaker.record_failure()
+            raise
+        else:
+            self.breaker.record_success()
+
+    @staticmethod
+    def _longest_prefix(key: str, prefixes) -> Optional[str]:
+        """Longest of the given key prefixes the key falls under, if any"""
+        best_prefix = None
+        for prefix in prefixes:
+            if (key == prefix or key.startswith(prefix + ":")) and (
+                best_prefix is None or len(prefix) > len(best_prefix)
+            ):
+                best_prefix = prefix
+        return best_prefix
+
+    # ------------------------------------------------------------------
+    # L1 helpers
+    # ------------------------------------------------------------------
+
+    def _l1_ttl(self, key: str) -> Optional[int]:
+        """L1 TTL for a key (longest matching prefix), or None if not cached locally"""
+        if self.local_cache is None:
+            return None
+
+        best_prefix = self._longest_prefix(key, self.l1_policies)
+        return self.l1_policies[best_prefix] if best_prefix is not None else None
+
+    def _l1_get(self, key: str) -> Optional[Any]:
+        if self._l1_ttl(key) is None:
+            return None
+        return self.local_cache.get(key)
+
+    def _l1_set(self, key: str, value: Any, ttl: Optional[int] = None):
+        l1_ttl = self._l1_ttl(key)
+        if l1_ttl is not None:
+            # Never outlive the Redis copy
+            self.local_cache.set(key, value, min(l1_ttl, ttl or self.default_ttl))
+
+    def _l1_delete(self, key: str):
+        if self.local_cache is not None:
+            self.local_cache.delete(key)
+            self.invalidation_bus.publish("key", key)
+
+    def _l1_delete_pattern(self, pattern: str):
+        if self.local_cache is not None:
+            self.local_cache.delete_pattern(pattern)
+            self.invalidation_bus.publish("pattern", pattern)
+
+    async def _al1_delete(self, key: str):
+        if self.local_cache is not None:
+            self.local_cache.delete(key)
+            await self.invalidation_bus.apublish(self.async_redis_client, "key", key)
+
+    async def _al1_delete_pattern(self, pattern: str):
+        if self.local_cache is not None:
+            self.local_cache.delete_pattern(pattern)
+            await self.invalidation_bus.apublish(self.async_redis_client, "pattern", pattern)
+
+    def start_invalidation_listener(self):
+        """Start applying other workers' invalidations to L1 (no-op without L1)"""
+        if self.invalidation_bus is not None and self.is_available():
+            self.invalidation_bus.start()
+
+    def stop_invalidation_listener(self):
+        if self.invalidation_bus is not None:
+            self.invalidation_bus.stop()
+
+    def _record_l2(self, hit: bool):
+        with self._stats_lock:
+            if hit:
+                self._l2_hits += 1
+            else:
+                self._l2_misses += 1
+
+    def stats(self) -> dict:
+        """Hit/miss counters per cache tier"""
+        stats = {
+            "l1": self.local_cache.stats() if self.local_cache is not None else {"enabled": False},
+            "l2": {"hits": self._l2_hits, "misses": self._l2_misses},
+            "stale_refreshes": self._stale_refreshes,
+            "early_recomputes": self._early_recomputes,
+        }
+        if self.invalidation_bus is not None:
+            stats["invalidation_bus"] = self.invalidation_bus.stats()
+        return stats
+
+    # ------------------------------------------------------------------
+    # Namespace generations
+    # ------------------------------------------------------------------
+
+    def _namespace_of(self, key: str) -> Optional[str]:
+        """Longest versioned namespace the key belongs to, if any"""
+        return self._longest_prefix(key, self.versioned_namespaces)
+
+    @staticmethod
+    def _generation_key(namespace: str) -> str:
+        return f"gen:{namespace}"
+
+    @staticmethod
+    def _apply_generation(key: str, namespace: str, generation: Any) -> str:
+        return f"{namespace}:g{int(generation or 0)}{key[len(namespace):]}"
+
+    def _redis_key(self, key: str) -> str:
+        """Physical Redis key for a logical cache key"""
+        namespace = self._namespace_of(key)
+        if namespace is None:
+            return key
+        return self._apply_generation(key, namespace, self.redis_client.get(self._generation_key(namespace)))
+
+    def _redis_keys(self, keys: List[str]) -> Dict[str, str]:
+        """Physical Redis keys for many logical keys (one MGET for all generations)"""
+        namespaces = {key: self._namespace_of(key) for key in keys}
+        distinct = sorted({namespace for namespace in namespaces.values() if namespace})
+        generations = {}
+        if distinct:
+            values = self.redis_client.mget([self._generation_key(namespace) for namespace in distinct])
+            generations = dict(zip(distinct, values))
+        return self._apply_generations(namespaces, generations)
+
+    async def _aredis_keys(self, keys: List[str]) -> Dict[str, str]:
+        """Async version of _redis_keys()"""
+        namespaces = {key: self._namespace_of(key) for key in keys}
+        distinct = sorted({namespace for namespace in namespaces.values() if namespace})
+        generations = {}
+        if distinct:
+            values = await self.async_redis_client.mget([self._generation_key(namespace) for namespace in distinct])
+            generations = dict(zip(distinct, values))
+        return self._apply_generations(namespaces, generations)
+
+    def _apply_generations(self, namespaces: Dict[str, Optional[str]], generations: Dict[str, Any]) -> Dict[str, str]:
+        return {
+            key: key if namespace is None else self._apply_generation(key, namespace, generations[namespace])
+            for key, namespace in namespaces.items()
+        }
+
+    async def _aredis_key(self, key: str) -> str:
+        """Async version of _redis_key()"""
+        namespace = self._namespace_of(key)
+        if namespace is None:
+            return key
+        generation = await self.async_redis_client.get(self._generation_key(namespace))
+        return self._apply_generation(key, namespace, generation)
+
+    def invalidate_namespace(self, namespace: str) -> Optional[int]:
+        """
+        Invalidate every key of a versioned namespace in O(1)
+
+        Bumps the namespace generation so new reads and writes use fresh
+        Redis keys; entries of older generations are left to expire.
+
+        Args:
+            namespace: One of CacheConfig.VERSIONED_NAMESPACES (e.g. "products:list")
+
+        Returns:
+            New generation, or None if cache unavailable
+        """
+        if not self.is_available():
+            return None
+
+        self._l1_delete_pattern(f"{namespace}:*")
+        try:
+            with self.breaker.track():
+                generation = self.redis_client.incr(self._generation_key(namespace))
+        except Exception as e:
+            logger.error(f"Cache INVALIDATE NAMESPACE error for '{namespace}': {e}")
+            return None
+        self._notify_invalidation(namespace)
+        return generation
+
+    async def ainvalidate_namespace(self, namespace: str) -> Optional[int]:
+        """Async version of invalidate_namespace()"""
+        if not self.is_async_available():
+            return None
+
+        await self._al1_delete_pattern(f"{namespace}:*")
+        try:
+            with self.breaker.track():
+                generation = await self.async_redis_client.incr(self._generation_key(namespace))
+        except Exception as e:
+            logger.error(f"Cache INVALIDATE NAMESPACE error for '{namespace}': {e}")
+            return None
+        self._notify_invalidation(namespace)
+        return generation
+
+    def generations(self, namespaces: List[str]) -> Optional[Dict[str, int]]:
+        """
+        Current generation of several namespaces (one MGET)
+
+        Returns:
+            namespace -> generation, or None if cache unavailable
+        """
+        if not self.is_available():
+            return None
+        try:
+            with self.breaker.track():
+                values = self.redis_client.mget([self._generation_key(namespace) for namespace in namespaces])
+        except Exception as e:
+            logger.error(f"Cache GENERATIONS error for {namespaces}: {e}")
+            return None
+        return {namespace: int(value or 0) for namespace, value in zip(namespaces, values)}
+
+    async def agenerations(self, namespaces: List[str]) -> Optional[Dict[str, int]]:
+        """Async version of generations()"""
+        if not self.is_async_available():
+            return None
+        try:
+            with self.breaker.track():
+                values = await self.async_redis_client.mget(
+                    [self._generation_key(namespace) for namespace in namespaces]
+                )
+        except Exception as e:
+            logger.error(f"Cache GENERATIONS error for {namespaces}: {e}")
+            return None
+        return {namespace: int(value or 0) for namespace, value in zip(namespaces, values)}
+
+    def _split_invalidation(self, keys: Iterable[str], namespaces: Iterable[str]) -> Tuple[List[str], List[str]]:
+        """Deduplicate, dropping keys already covered by a namespace bump"""
+        namespaces = list(dict.fromkeys(namespaces))
+        keys = [
+            key for key in dict.fromkeys(keys)
+            if self._longest_prefix(key, namespaces) is None
+        ]
+        return keys, namespaces
+
+    def _invalidation_l1(self, keys: List[str], namespaces: List[str]) -> List[str]:
+        """Evict from L1 and return the bus messages for the other workers"""
+        if self.local_cache is None:
+            return []
+        messages = []
+        for key in keys:
+            self.local_cache.delete(key)
+            messages.append(self.invalidation_bus.build_message("key", key))
+        for namespace in namespaces:
+            self.local_cache.delete_pattern(f"{namespace}:*")
+            messages.append(self.invalidation_bus.build_message("pattern", f"{namespace}:*"))
+        return messages
+
+    def _queue_invalidation(self, pipe, redis_keys: List[str], namespaces: List[str], messages: List[str]):
+        if redis_keys:
+            pipe.delete(*redis_keys)
+        for namespace in namespaces:
+            pipe.incr(self._generation_key(namespace))
+        for message in messages:
+            pipe.publish(self.invalidation_bus.channel, message)
+
+    def invalidate(self, keys: Iterable[str] = (), namespaces: Iterable[str] = ()) -> bool:
+        """
+        Delete keys and bump namespace generations in one pipelined round trip
+
+        Used to apply every invalidation of a DB transaction at once (see
+        services.cache_invalidation). Keys under one of the namespaces are
+        skipped: the generation bump already hides them. L1 bus messages ride
+        in the same pipeline.
+
+        Args:
+            keys: Logical cache keys to delete
+            namespaces: Namespaces to invalidate (versioned: generation bump)
+
+        Returns:
+            True if applied, False if cache unavailable or Redis failed
+        """
+        keys, namespaces = self._split_invalidation(keys, namespaces)
+        if not (keys or namespaces) or not self.is_available():
+            return False
+
+        messages = self._invalidation_l1(keys, namespaces)
+        try:
+            with self.breaker.track():
+                redis_keys = list(self._redis_keys(keys).values())
+                pipe = self.redis_client.pipeline(transaction=False)
+                self._queue_invalidation(pipe, redis_keys, namespaces, messages)
+                pipe.execute()
+        except Exception as e:
+            if self.invalidation_bus is not None:
+                self.invalidation_bus.release(messages)
+            logger.error(f"Cache INVALIDATE error for {len(keys)} keys / {namespaces}: {e}")
+            return False
+
+        if self.invalidation_bus is not None:
+            self.invalidation_bus.published += len(messages)
+        for namespace in namespaces:
+            self._notify_invalidation(namespace)
+        return True
+
+    async def ainvalidate(self, keys: Iterable[str] = (), namespaces: Iterable[str] = ()) -> bool:
+        """Async version of invalidate()"""
+        keys, namespaces = self._split_invalidation(keys, namespaces)
+        if not (keys or namespaces) or not self.is_async_available():
+            return False
+
+        messages = self._invalidation_l1(keys, namespaces)
+        try:
+            with self.breaker.track():
+                redis_keys = list((await self._aredis_keys(keys)).values())
+                pipe = self.async_redis_client.pipeline(transaction=False)
+                self._queue_invalidation(pipe, redis_keys, namespaces, messages)
+                await pipe.execute()
+        except Exception as e:
+            if self.invalidation_bus is not None:
+                self.invalidation_bus.release(messages)
+            logger.error(f"Cache INVALIDATE error for {len(keys)} keys / {namespaces}: {e}")
+            return False
+
+        if self.invalidation_bus is not None:
+            self.invalidation_bus.published += len(messages)
+        for namespace in namespaces:
+            self._notify_invalidation(namespace)
+        return True
+
+    def add_invalidation_listener(self, listener: Callable[[str], None]):
+        """
+        Call listener(namespace) after every namespace invalidation of this
+        worker (e.g. the cache warmer). Listeners must not block.
+        """
+        self._invalidation_listeners.append(listener)
+
+    def remove_invalidation_listener(self, listener: Callable[[str], None]):
+        if listener in self._invalidation_listeners:
+            self._invalidation_listeners.remove(listener)
+
+    def _notify_invalidation(self, namespace: str):
+        for listener in self._invalidation_listeners:
+            try:
+                listener(namespace)
+            except Exception as e:
+                logger.error(f"Invalidation listener failed for '{namespace}': {e}")
+
+    # ------------------------------------------------------------------
+    # Codecs
+    # ------------------------------------------------------------------
+
+    def _codec_for(self, key: str) -> Optional[CacheCodec]:
+        """Binary codec configured for the key's prefix (None = JSON text)"""
+        prefix = self._longest_prefix(key, self.codecs)
+        return self.codecs[prefix] if prefix is not None else None
+
+    def _is_binary(self, key: str, binary_client: Any) -> bool:
+        """True when the key is codec-encoded and a bytes connection exists"""
+        return binary_client is not None and self._codec_for(key) is not None
+
+    def _read(self, key: str, redis_key: str) -> Optional[Any]:
+        """GET + decode using the connection matching the key's format"""
+        binary = self._is_binary(key, self.binary_redis_client)
+        client = self.binary_redis_client if binary else self.redis_client
+        raw = client.get(redis_key)
+        return None if raw is None else self._decode_for(key, raw, binary)
+
+    def _write(self, key: str, redis_key: str, value: Any, ttl: int):
+        """Encode + SETEX using the connection matching the key's format"""
+        binary = self._is_binary(key, self.binary_redis_client)
+        client = self.binary_redis_client if binary else self.redis_client
+        client.setex(redis_key, ttl, self._encode_for(key, value, binary))
+
+    async def _aread(self, key: str, redis_key: str) -> Optional[Any]:
+        """Async version of _read()"""
+        binary = self._is_binary(key, self.async_binary_redis_client)
+        client = self.async_binary_redis_client if binary else self.async_redis_client
+        raw = await client.get(redis_key)
+        return None if raw is None else self._decode_for(key, raw, binary)
+
+    async def _awrite(self, key: str, redis_key: str, value: Any, ttl: int):
+        """Async version of _write()"""
+        binary = self._is_binary(key, self.async_binary_redis_client)
+        client = self.async_binary_redis_client if binary else self.async_redis_client
+        await client.setex(redis_key, ttl, self._encode_for(key, value, binary))
+
+    def _split_by_format(self, keys: List[str], binary_client: Any) -> Dict[bool, List[str]]:
+        """Group keys into codec-encoded (True) and JSON text (False)"""
+        groups: Dict[bool, List[str]] = {True: [], False: []}
+        for key in keys:
+            groups[self._is_binary(key, binary_client)].append(key)
+        return groups
+
+    def _encode_for(self, key: str, value: Any, binary: bool) -> Any:
+        if not binary:
+            return self._serialize(value)
+        if isinstance(value, str):
+            # Strings are pre-serialized JSON on the text path; keep get() symmetric
+            value = self._deserialize(value)
+        return self._codec_for(key).encode(value)
+
+    def _decode_for(self, key: str, raw: Any, binary: bool) -> Any:
+        return self._codec_for(key).decode(raw) if binary else self._deserialize(raw)
+
+    @staticmethod
+    def _serialize(value: Any) -> str:
+        """Serialize to JSON if not a string"""
+        if not isinstance(value, str):
+            value = json.dumps(value)
+        return value
+
+    @staticmethod
+    def _deserialize(value: Any) -> Any:
+        """Try to deserialize JSON, returning the raw value otherwise"""
+        try:
+            return json.loads(value)
+        except (json.JSONDecodeError, TypeError):
+            return value
 
     def get(self, key: str) -> Optional[Any]:
         """
@@ -50,17 +591,22 @@ class CacheService:
         """
         if not self.is_available():
             return None
+        return self._get(key)
+
+    def _get(self, key: str) -> Optional[Any]:
+        """get() for an operation that already claimed the breaker"""
+        local_value = self._l1_get(key)
+        if local_value is not None:
+            return local_value
 
         try:
-            value = self.redis_client.get(key)
-            if value is None:
-                return None
+            with self._guarded(admitted=True):
+                value = self._read(key, self._redis_key(key))
+                self._record_l2(value is not None)
+                if value is None:
+                    return None
 
-            # Try to deserialize JSON
-            try:
-                return json.loads(value)
-            except (json.JSONDecodeError, TypeError):
-                # Return raw value if not JSON
+                self._l1_set(key, value)
                 return value
 
         except Exception as e:
@@ -86,15 +632,16 @@ class CacheService:
         """
         if not self.is_available():
             return False
+        return self._set(key, value, ttl)
 
+    def _set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
+        """set() for an operation that already claimed the breaker"""
         try:
-            # Serialize to JSON if not a string
-            if not isinstance(value, str):
-                value = json.dumps(value)
-
-            ttl = ttl or self.default_ttl
-            self.redis_client.setex(key, ttl, value)
-            return True
+            with self._guarded(admitted=True):
+                ttl = ttl or self.default_ttl
+                self._write(key, self._redis_key(key), value, ttl)
+                self._l1_set(key, self._deserialize(value) if isinstance(value, str) else value, ttl)
+                return True
 
         except Exception as e:
             logger.error(f"Cache SET error for key '{key}': {e}")
@@ -113,9 +660,11 @@ class CacheService:
         if not self.is_available():
             return False
 
+        self._l1_delete(key)
         try:
-            self.redis_client.delete(key)
-            return True
+            with self.breaker.track():
+                self.redis_client.delete(self._redis_key(key))
+                return True
         except Exception as e:
             logger.error(f"Cache DELETE error for key '{key}': {e}")
             return False
@@ -124,6 +673,10 @@ class CacheService:
         """
         Delete all keys matching pattern
 
+        Uses incremental SCAN instead of KEYS so Redis is never blocked for
+        the whole keyspace. Prefer invalidate_namespace() for versioned
+        namespaces: it is O(1).
+
         Args:
             pattern: Redis pattern (e.g., "products:*")
 
@@ -133,15 +686,133 @@ class CacheService:
         if not self.is_available():
             return 0
 
+        self._l1_delete_pattern(pattern)
         try:
-            keys = self.redis_client.keys(pattern)
-            if keys:
-                return self.redis_client.delete(*keys)
-            return 0
+            deleted = 0
+            batch = []
+            for key in self.redis_client.scan_iter(match=pattern, count=self.SCAN_BATCH_SIZE):
+                batch.append(key)
+                if len(batch) >= self.SCAN_BATCH_SIZE:
+                    deleted += self.redis_client.delete(*batch)
+                    batch = []
+            if batch:
+                deleted += self.redis_client.delete(*batch)
+            return deleted
         except Exception as e:
             logger.error(f"Cache DELETE PATTERN error for '{pattern}': {e}")
             return 0
 
+    # ------------------------------------------------------------------
+    # Batch API (MGET / pipelines): one round trip per connection
+    # ------------------------------------------------------------------
+
+    def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """
+        Get several values at once
+
+        L1 is consulted first; the remaining keys are read with a single MGET
+        per connection (text / binary codec), plus one MGET for namespace
+        generations when versioned keys are involved.
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Dict of key -> value for the keys found (misses are omitted)
+        """
+        if not keys or not self.is_available():
+            return {}
+
+        results = {}
+        missing = []
+        for key in dict.fromkeys(keys):
+            local_value = self._l1_get(key)
+            if local_value is not None:
+                results[key] = local_value
+            else:
+                missing.append(key)
+
+        if not missing:
+            return results
+
+        try:
+            with self.breaker.track():
+                redis_keys = self._redis_keys(missing)
+                groups = self._split_by_format(missing, self.binary_redis_client)
+                for binary, group in groups.items():
+                    if not group:
+                        continue
+                    client = self.binary_redis_client if binary else self.redis_client
+                    raw_values = client.mget([redis_keys[key] for key in group])
+                    for key, raw in zip(group, raw_values):
+                        self._record_l2(raw is not None)
+                        if raw is None:
+                            continue
+                        value = self._decode_for(key, raw, binary)
+                        self._l1_set(key, value)
+                        results[key] = value
+
+        except Exception as e:
+            logger.error(f"Cache GET MANY error for {len(missing)} keys: {e}")
+
+        return results
+
+    def set_many(self, mapping: Dict[str, Any], ttl: Optional[int] = None) -> bool:
+        """
+        Set several values with the same TTL in one pipelined round trip
+
+        Args:
+            mapping: Dict of key -> value
+            ttl: Time to live in seconds (default: REDIS_CACHE_TTL)
+
+        Returns:
+            True if successful, False otherwise
+        """
+        if not mapping or not self.is_available():
+            return False
+
+        try:
+            with self.breaker.track():
+                ttl = ttl or self.default_ttl
+                redis_keys = self._redis_keys(list(mapping))
+                groups = self._split_by_format(list(mapping), self.binary_redis_client)
+                for binary, group in groups.items():
+                    if not group:
+                        continue
+                    client = self.binary_redis_client if binary else self.redis_client
+                    pipe = client.pipeline(transaction=False)
+                    for key in group:
+                        pipe.setex(redis_keys[key], ttl, self._encode_for(key, mapping[key], binary))
+                    pipe.execute()
+
+                for key, value in mapping.items():
+                    self._l1_set(key, self._deserialize(value) if isinstance(value, str) else value, ttl)
+                return True
+
+        except Exception as e:
+            logger.error(f"Cache SET MANY error for {len(mapping)} keys: {e}")
+            return False
+
+    def delete_many(self, keys: List[str]) -> int:
+        """
+        Delete several keys with a single DEL
+
+        Returns:
+            Number of keys deleted
+        """
+        if not keys or not self.is_available():
+            return 0
+
+        for key in keys:
+            self._l1_delete(key)
+        try:
+            with self.breaker.track():
+                redis_keys = self._redis_keys(list(keys))
+                return self.redis_client.delete(*redis_keys.values())
+        except Exception as e:
+            logger.error(f"Cache DELETE MANY error for {len(keys)} keys: {e}")
+            return 0
+
     def clear_all(self) -> bool:
         """
         Clear all cache (use with caution!)
@@ -152,6 +823,9 @@ class CacheService:
         if not self.is_available():
             return False
 
+        if self.local_cache is not None:
+            self.local_cache.clear()
+            self.invalidation_bus.publish("flush")
         try:
             self.redis_client.flushdb()
             logger.warning("⚠️  All cache cleared!")
@@ -160,13 +834,183 @@ class CacheService:
             logger.error(f"Cache CLEAR ALL error: {e}")
             return False
 
+    # ------------------------------------------------------------------
+    # Soft-expiry helpers (stale-while-revalidate and XFetch early recompute)
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _wrap_entry(value: Any, soft_ttl: int, delta: float = 0.0) -> dict:
+        return {SWR_MARKER: time.time() + soft_ttl, "delta": delta, "value": value}
+
+    @staticmethod
+    def _unwrap_entry(cached: Any) -> Tuple[Any, Optional[float], float]:
+        """(value, soft_expiry, compute_seconds) of an entry written by get_or_set"""
+        if isinstance(cached, dict) and SWR_MARKER in cached:
+            return cached["value"], cached[SWR_MARKER], cached.get("delta", 0.0)
+        return cached, None, 0.0
+
+    @staticmethod
+    def _timed_call(callback: Callable[[], Any]) -> Tuple[Any, float]:
+        started = time.perf_counter()
+        value = callback()
+        return value, time.perf_counter() - started
+
+    @staticmethod
+    async def _atimed_call(callback: Callable[[], Any]) -> Tuple[Any, float]:
+        started = time.perf_counter()
+        value = callback()
+        if inspect.isawaitable(value):
+            value = await value
+        return value, time.perf_counter() - started
+
+    # The helpers below run inside a get_or_set() / refresh that already
+    # claimed the breaker: they go through _guarded(admitted=True)
+
+    def _read_value(self, key: str, enveloped: bool) -> Optional[Any]:
+        value = self._get(key)
+        if enveloped and value is not None:
+            value = self._unwrap_entry(value)[0]
+        return value
+
+    def _store_value(self, key: str, value: Any, ttl: Optional[int], stale_ttl: Optional[int],
+                     enveloped: bool, delta: float = 0.0) -> bool:
+        if not enveloped:
+            return self._set(key, value, ttl)
+        soft_ttl = ttl or self.default_ttl
+        return self._set(key, self._wrap_entry(value, soft_ttl, delta), soft_ttl + (stale_ttl or 0))
+
+    async def _aread_value(self, key: str, enveloped: bool) -> Optional[Any]:
+        value = await self._aget(key)
+        if enveloped and value is not None:
+            value = self._unwrap_entry(value)[0]
+        return value
+
+    async def _astore_value(self, key: str, value: Any, ttl: Optional[int], stale_ttl: Optional[int],
+                            enveloped: bool, delta: float = 0.0) -> bool:
+        if not enveloped:
+            return await self._aset(key, value, ttl)
+        soft_ttl = ttl or self.default_ttl
+        return await self._aset(key, self._wrap_entry(value, soft_ttl, delta), soft_ttl + (stale_ttl or 0))
+
+    def _get_refresh_executor(self) -> ThreadPoolExecutor:
+        with self._stats_lock:
+            if self._refresh_executor is None:
+                self._refresh_executor = ThreadPoolExecutor(
+                    max_workers=CacheConfig.REFRESH_WORKERS,
+                    thread_name_prefix="cache-refresh"
+                )
+            return self._refresh_executor
+
+    def _lock_for(self, key: str) -> RedisLock:
+        """Recompute lock of a cache key (shared by misses and refreshes)"""
+        return RedisLock(f"lock:{key}", self.redis_client, self.async_redis_client, self.lock_timeout)
+
+    def _acquire_refresh_lock(self, key: str) -> Optional[RedisLock]:
+        lock = self._lock_for(key)
+        try:
+            with self._guarded(admitted=True):
+                return lock if lock.acquire() else None
+        except Exception as e:
+            logger.error(f"Error acquiring refresh lock for '{key}': {e}")
+            return None
+
+    async def _aacquire_refresh_lock(self, key: str) -> Optional[RedisLock]:
+        lock = self._lock_for(key)
+        try:
+            with self._guarded(admitted=True):
+                return lock if await lock.aacquire() else None
+        except Exception as e:
+            logger.error(f"Error acquiring refresh lock for '{key}': {e}")
+            return None
+
+    def _try_lock(self, key: str, lock: RedisLock) -> Optional[bool]:
+        """lock.acquire() through the circuit breaker; None when Redis failed or the breaker opened"""
+        try:
+            with self._guarded(admitted=True):
+                return lock.acquire()
+        except Exception as e:
+            logger.error(f"Error acquiring lock for '{key}': {e}")
+            return None
+
+    async def _atry_lock(self, key: str, lock: RedisLock) -> Optional[bool]:
+        try:
+            with self._guarded(admitted=True):
+                return await lock.aacquire()
+        except Exception as e:
+            logger.error(f"Error acquiring lock for '{key}': {e}")
+            return None
+
+    def _refresh(self, key: str, callback: Callable[[], Any], ttl: Optional[int],
+                 stale_ttl: Optional[int], lock: RedisLock, admitted: bool = False) -> Optional[Any]:
+        """
+        Recompute and store an entry while holding its lock (acquired by the
+        caller). Returns the new value, or None if the callback failed: the
+        current entry then stays until its hard TTL and the next hit retries.
+
+        Background refreshes (admitted=False) are an operation of their own
+        and claim the breaker once; if it refuses, the lock simply expires.
+        """
+        if not (admitted or self.breaker.allow()):
+            return None
+        try:
+            logger.info(f"Refreshing cache key ahead of expiry: {key}")
+            with lock.renewing():
+                value, delta = self._timed_call(callback)
+            self._store_value(key, value, ttl, stale_ttl, True, delta)
+            return value
+        except Exception as e:
+            logger.error(f"Cache refresh failed for '{key}': {e}")
+            return None
+        finally:
+            try:
+                with self._guarded(admitted=True):
+                    lock.release()
+            except Exception as e:
+                logger.error(f"Error releasing lock for '{key}': {e}")
+
+    async def _arefresh(self, key: str, callback: Callable[[], Any], ttl: Optional[int],
+                        stale_ttl: Optional[int], lock: RedisLock, admitted: bool = False) -> Optional[Any]:
+        """Async version of _refresh() (the callback may be a coroutine function)"""
+        if not (admitted or self.breaker.allow()):
+            return None
+        try:
+            logger.info(f"Refreshing cache key ahead of expiry: {key}")
+            async with lock.arenewing():
+                value, delta = await self._atimed_call(callback)
+            await self._astore_value(key, value, ttl, stale_ttl, True, delta)
+            return value
+        except Exception as e:
+            logger.error(f"Cache refresh failed for '{key}': {e}")
+            return None
+        finally:
+            try:
+                with self._guarded(admitted=True):
+                    await lock.arelease()
+            except Exception as e:
+                logger.error(f"Error releasing lock for '{key}': {e}")
+
+    def _sync_wait_timeout(self, wait_timeout: Optional[float]) -> float:
+        """
+        Lock wait budget of the blocking get_or_set(). Sync services
+        dispatched inline run on the event loop thread, where BLPOP blocks
+        every request of the worker, so the wait is kept short there.
+        """
+        wait = self.lock_timeout if wait_timeout is None else wait_timeout
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return wait  # worker thread (threadpool dispatch, refreshes, scripts)
+        return min(wait, self.LOOP_LOCK_WAIT)
+
     def get_or_set(
         self,
         key: str,
         callback: Callable[[], Any],
         ttl: Optional[int] = None,
-        max_retries: int = 3,
-        retry_delay: float = 0.1
+        wait_timeout: Optional[float] = None,
+        stale_ttl: Optional[int] = None,
+        refresh_callback: Optional[Callable[[], Any]] = None,
+        beta: Optional[float] = None
     ) -> Any:
         """
         Get value from cache or compute and cache it with distributed stampede protection
@@ -175,12 +1019,31 @@ class CacheService:
         only ONE worker/process/thread recomputes the value while others wait.
         This is safe for multi-worker deployments (unlike threading.Lock).
 
+        The lock (RedisLock) has an owner token, is kept alive while the
+        callback runs and wakes the waiters when it is released, so waiters
+        neither poll nor give up and recompute while the holder is working.
+
         Args:
             key: Cache key
             callback: Function to call if cache miss
             ttl: Time to live in seconds
-            max_retries: Maximum retries to acquire lock
-            retry_delay: Delay between retries in seconds
+            wait_timeout: Longest time to wait for another worker's computation
+                before computing without the lock (defaults to lock_timeout;
+                capped at LOOP_LOCK_WAIT when called on a running event loop)
+            stale_ttl: Enables stale-while-revalidate. `ttl` becomes the soft TTL
+                and the entry is kept for `ttl + stale_ttl` seconds; once past
+                the soft TTL it is still served immediately while exactly one
+                worker (the one winning the lock) refreshes it in the background
+            refresh_callback: Callable used for background refreshes (defaults to
+                callback). It runs after the request finished, so it must not
+                use request-scoped resources such as the request's DB session
+            beta: Enables probabilistic early recomputation (XFetch). The compute
+                time is stored with the value and each hit recomputes early with
+                probability rising as expiry approaches (hit at time t refreshes
+                when t - delta * beta * ln(rand) >= expiry), so refreshes of hot
+                keys spread out instead of piling up on the TTL boundary.
+                1.0 is the usual choice, > 1 favours earlier refreshes. Combined
+                with stale_ttl the early refresh runs in the background
 
         Returns:
             Cached or computed value
@@ -193,7 +1056,7 @@ class CacheService:
             # With distributed lock stampede protection (GOOD):
             # Cache expires at 12:00:00
             # Worker 1 / Request 1 acquires Redis lock, calls callback()
-            # Workers 2-8 / Requests 2-100 wait and retry
+            # Workers 2-8 / Requests 2-100 block until the lock is released
             # All requests get the cached result
         """
         if not self.is_available():
@@ -201,44 +1064,63 @@ class CacheService:
             logger.warning(f"Redis unavailable, computing without cache: {key}")
             return callback()
 
+        # Stale-while-revalidate and XFetch store the value with its soft expiry
+        enveloped = bool(stale_ttl or beta)
+
         # Try to get from cache (fast path)
-        cached_value = self.get(key)
+        # is_available() claimed the breaker: everything below is admitted
+        cached_value = self._get(key)
         if cached_value is not None:
             logger.debug(f"Cache HIT: {key}")
+            if not enveloped:
+                return cached_value
+
+            cached_value, expiry, delta = self._unwrap_entry(cached_value)
+            lock = self._acquire_refresh_lock(key) if expiry is not None and should_refresh(expiry, delta, beta) else None
+            if lock is not None:
+                if stale_ttl:
+                    with self._stats_lock:
+                        self._stale_refreshes += 1
+                    self._get_refresh_executor().submit(
+                        self._refresh, key, refresh_callback or callback, ttl, stale_ttl, lock
+                    )
+                else:
+                    # XFetch without stale serving: this caller recomputes early
+                    with self._stats_lock:
+                        self._early_recomputes += 1
+                    refreshed = self._refresh(key, callback, ttl, stale_ttl, lock, admitted=True)
+                    if refreshed is not None:
+                        return refreshed
             return cached_value
 
         # Cache miss - need to recompute with distributed stampede protection
         logger.debug(f"Cache MISS: {key}")
 
-        # Build lock key
-        lock_key = f"lock:{key}"
-
-        # Try to acquire distributed lock
-        for attempt in range(max_retries):
-            # Try to set lock with NX (only if not exists) and EX (expiration)
-            lock_acquired = self.redis_client.set(
-                lock_key,
-                "1",
-                nx=True,  # Only set if key doesn't exist
-                ex=self.lock_timeout  # Auto-expire after timeout
-            )
+        lock = self._lock_for(key)
+        deadline = time.monotonic() + self._sync_wait_timeout(wait_timeout)
 
-            if lock_acquired:
+        while True:
+            acquired = self._try_lock(key, lock)
+            if acquired is None:
+                # Redis failed mid-request: compute without lock or cache
+                return callback()
+            if acquired:
                 # We got the lock! Compute and cache the value
                 logger.debug(f"Lock acquired for: {key}")
                 try:
                     # Double-check cache (another process may have filled it)
-                    cached_value = self.get(key)
+                    cached_value = self._read_value(key, enveloped)
                     if cached_value is not None:
                         logger.debug(f"Cache HIT after lock: {key}")
                         return cached_value
 
-                    # Compute value
+                    # Compute value, keeping the lock alive if it takes long
                     logger.info(f"Computing value for cache key: {key}")
-                    value = callback()
+                    with lock.renewing():
+                        value, delta = self._timed_call(callback)
 
-                    # Store in cache
-                    self.set(key, value, ttl)
+                    # Store in cache (before the release wakes the waiters)
+                    self._store_value(key, value, ttl, stale_ttl, enveloped, delta)
 
                     return value
 
@@ -247,38 +1129,323 @@ class CacheService:
                     raise
 
                 finally:
-                    # Always release the lock
+                    # Always release the lock (only if still ours)
                     try:
-                        self.redis_client.delete(lock_key)
+                        with self._guarded(admitted=True):
+                            lock.release()
                         logger.debug(f"Lock released for: {key}")
                     except Exception as e:
                         logger.error(f"Error releasing lock for '{key}': {e}")
 
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+
+            # Lock held by another process/worker: block until it is released.
+            # The slice only bounds the wait when the holder dies without releasing
+            logger.debug(f"Lock held by another process for '{key}', waiting for release")
+            try:
+                with self._guarded(admitted=True, timed=False):
+                    lock.wait_for_release(min(remaining, self.LOCK_WAIT_SLICE))
+            except Exception as e:
+                logger.error(f"Error waiting for lock on '{key}', computing without cache: {e}")
+                return callback()
+
+            # Check if cache was filled while waiting
+            cached_value = self._read_value(key, enveloped)
+            if cached_value is not None:
+                logger.debug(f"Cache HIT after waiting: {key}")
+                return cached_value
+
+        # Waited too long for the lock holder
+        # Fallback: compute without lock (better than failing)
+        logger.warning(f"Timed out waiting for lock on '{key}', computing without lock")
+        try:
+            value, delta = self._timed_call(callback)
+            # Try to cache anyway (best effort)
+            self._store_value(key, value, ttl, stale_ttl, enveloped, delta)
+            return value
+        except Exception as e:
+            logger.error(f"Error in fallback computation for '{key}': {e}")
+            raise
+
+    # ------------------------------------------------------------------
+    # Async API (redis.asyncio) - safe to call from async route handlers
+    # ------------------------------------------------------------------
+
+    async def aget(self, key: str) -> Optional[Any]:
+        """Async version of get()"""
+        if not self.is_async_available():
+            return None
+        return await self._aget(key)
+
+    async def _aget(self, key: str) -> Optional[Any]:
+        local_value = self._l1_get(key)
+        if local_value is not None:
+            return local_value
+
+        try:
+            with self._guarded(admitted=True):
+                value = await self._aread(key, await self._aredis_key(key))
+                self._record_l2(value is not None)
+                if value is None:
+                    return None
+
+                self._l1_set(key, value)
+                return value
+
+        except Exception as e:
+            logger.error(f"Cache GET error for key '{key}': {e}")
+            return None
+
+    async def aset(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
+        """Async version of set()"""
+        if not self.is_async_available():
+            return False
+        return await self._aset(key, value, ttl)
+
+    async def _aset(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
+        try:
+            with self._guarded(admitted=True):
+                ttl = ttl or self.default_ttl
+                await self._awrite(key, await self._aredis_key(key), value, ttl)
+                self._l1_set(key, self._deserialize(value) if isinstance(value, str) else value, ttl)
+                return True
+
+        except Exception as e:
+            logger.error(f"Cache SET error for key '{key}': {e}")
+            return False
+
+    async def adelete(self, key: str) -> bool:
+        """Async version of delete()"""
+        if not self.is_async_available():
+            return False
+
+        await self._al1_delete(key)
+        try:
+            with self.breaker.track():
+                await self.async_redis_client.delete(await self._aredis_key(key))
+                return True
+        except Exception as e:
+            logger.error(f"Cache DELETE error for key '{key}': {e}")
+            return False
+
+    async def adelete_pattern(self, pattern: str) -> int:
+        """Async version of delete_pattern()"""
+        if not self.is_async_available():
+            return 0
+
+        await self._al1_delete_pattern(pattern)
+        try:
+            deleted = 0
+            batch = []
+            async for key in self.async_redis_client.scan_iter(match=pattern, count=self.SCAN_BATCH_SIZE):
+                batch.append(key)
+                if len(batch) >= self.SCAN_BATCH_SIZE:
+                    deleted += await self.async_redis_client.delete(*batch)
+                    batch = []
+            if batch:
+                deleted += await self.async_redis_client.delete(*batch)
+            return deleted
+        except Exception as e:
+            logger.error(f"Cache DELETE PATTERN error for '{pattern}': {e}")
+            return 0
+
+    async def aget_many(self, keys: List[str]) -> Dict[str, Any]:
+        """Async version of get_many()"""
+        if not keys or not self.is_async_available():
+            return {}
+
+        results = {}
+        missing = []
+        for key in dict.fromkeys(keys):
+            local_value = self._l1_get(key)
+            if local_value is not None:
+                results[key] = local_value
             else:
-                # Lock already held by another process/worker
-                # Wait a bit and retry to get cached result
-                logger.debug(
-                    f"Lock held by another process for '{key}', "
-                    f"retry {attempt + 1}/{max_retries}"
-                )
-                time.sleep(retry_delay)
+                missing.append(key)
 
-                # Check if cache was filled while waiting
-                cached_value = self.get(key)
-                if cached_value is not None:
-                    logger.debug(f"Cache HIT after waiting: {key}")
-                    return cached_value
+        if not missing:
+            return results
 
-        # Failed to acquire lock after all retries
-        # Fallback: compute without lock (better than failing)
-        logger.warning(
-            f"Failed to acquire lock for '{key}' after {max_retries} retries, "
-            f"computing without lock"
-        )
         try:
+            with self.breaker.track():
+                redis_keys = await self._aredis_keys(missing)
+                groups = self._split_by_format(missing, self.async_binary_redis_client)
+                for binary, group in groups.items():
+                    if not group:
+                        continue
+                    client = self.async_binary_redis_client if binary else self.async_redis_client
+                    raw_values = await client.mget([redis_keys[key] for key in group])
+                    for key, raw in zip(group, raw_values):
+                        self._record_l2(raw is not None)
+                        if raw is None:
+                            continue
+                        value = self._decode_for(key, raw, binary)
+                        self._l1_set(key, value)
+                        results[key] = value
+
+        except Exception as e:
+            logger.error(f"Cache GET MANY error for {len(missing)} keys: {e}")
+
+        return results
+
+    async def aset_many(self, mapping: Dict[str, Any], ttl: Optional[int] = None) -> bool:
+        """Async version of set_many()"""
+        if not mapping or not self.is_async_available():
+            return False
+
+        try:
+            with self.breaker.track():
+                ttl = ttl or self.default_ttl
+                redis_keys = await self._aredis_keys(list(mapping))
+                groups = self._split_by_format(list(mapping), self.async_binary_redis_client)
+                for binary, group in groups.items():
+                    if not group:
+                        continue
+                    client = self.async_binary_redis_client if binary else self.async_redis_client
+                    pipe = client.pipeline(transaction=False)
+                    for key in group:
+                        pipe.setex(redis_keys[key], ttl, self._encode_for(key, mapping[key], binary))
+                    await pipe.execute()
+
+                for key, value in mapping.items():
+                    self._l1_set(key, self._deserialize(value) if isinstance(value, str) else value, ttl)
+                return True
+
+        except Exception as e:
+            logger.error(f"Cache SET MANY error for {len(mapping)} keys: {e}")
+            return False
+
+    async def adelete_many(self, keys: List[str]) -> int:
+        """Async version of delete_many()"""
+        if not keys or not self.is_async_available():
+            return 0
+
+        for key in keys:
+            await self._al1_delete(key)
+        try:
+            with self.breaker.track():
+                redis_keys = await self._aredis_keys(list(keys))
+                return await self.async_redis_client.delete(*redis_keys.values())
+        except Exception as e:
+            logger.error(f"Cache DELETE MANY error for {len(keys)} keys: {e}")
+            return 0
+
+    async def aget_or_set(
+        self,
+        key: str,
+        callback: Callable[[], Any],
+        ttl: Optional[int] = None,
+        wait_timeout: Optional[float] = None,
+        stale_ttl: Optional[int] = None,
+        refresh_callback: Optional[Callable[[], Any]] = None,
+        beta: Optional[float] = None
+    ) -> Any:
+        """
+        Async version of get_or_set() with the same distributed lock protocol
+
+        The callback may be a plain function or a coroutine function. Waiting
+        for another worker's lock uses the async client's BLPOP, so the event
+        loop keeps serving other requests during stampede waits. Stale-while-revalidate
+        refreshes run as asyncio tasks on the current loop.
+        """
+        async def compute() -> Any:
             value = callback()
-            # Try to cache anyway (best effort)
-            self.set(key, value, ttl)
+            if inspect.isawaitable(value):
+                value = await value
+            return value
+
+        if not self.is_async_available():
+            logger.warning(f"Redis unavailable, computing without cache: {key}")
+            return await compute()
+
+        enveloped = bool(stale_ttl or beta)
+
+        cached_value = await self._aget(key)
+        if cached_value is not None:
+            logger.debug(f"Cache HIT: {key}")
+            if not enveloped:
+                return cached_value
+
+            cached_value, expiry, delta = self._unwrap_entry(cached_value)
+            lock = (
+                await self._aacquire_refresh_lock(key)
+                if expiry is not None and should_refresh(expiry, delta, beta) else None
+            )
+            if lock is not None:
+                if stale_ttl:
+                    with self._stats_lock:
+                        self._stale_refreshes += 1
+                    task = asyncio.create_task(
+                        self._arefresh(key, refresh_callback or callback, ttl, stale_ttl, lock)
+                    )
+                    # Keep a reference so the task is not garbage collected mid-flight
+                    self._refresh_tasks.add(task)
+                    task.add_done_callback(self._refresh_tasks.discard)
+                else:
+                    with self._stats_lock:
+                        self._early_recomputes += 1
+                    refreshed = await self._arefresh(key, callback, ttl, stale_ttl, lock, admitted=True)
+                    if refreshed is not None:
+                        return refreshed
+            return cached_value
+
+        logger.debug(f"Cache MISS: {key}")
+        lock = self._lock_for(key)
+        deadline = time.monotonic() + (self.lock_timeout if wait_timeout is None else wait_timeout)
+
+        while True:
+            acquired = await self._atry_lock(key, lock)
+            if acquired is None:
+                return await compute()
+            if acquired:
+                logger.debug(f"Lock acquired for: {key}")
+                try:
+                    cached_value = await self._aread_value(key, enveloped)
+                    if cached_value is not None:
+                        logger.debug(f"Cache HIT after lock: {key}")
+                        return cached_value
+
+                    logger.info(f"Computing value for cache key: {key}")
+                    async with lock.arenewing():
+                        value, delta = await self._atimed_call(compute)
+                    await self._astore_value(key, value, ttl, stale_ttl, enveloped, delta)
+                    return value
+
+                except Exception as e:
+                    logger.error(f"Error computing value for cache key '{key}': {e}")
+                    raise
+
+                finally:
+                    try:
+                        with self._guarded(admitted=True):
+                            await lock.arelease()
+                        logger.debug(f"Lock released for: {key}")
+                    except Exception as e:
+                        logger.error(f"Error releasing lock for '{key}': {e}")
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+
+            logger.debug(f"Lock held by another process for '{key}', waiting for release")
+            try:
+                with self._guarded(admitted=True, timed=False):
+                    await lock.await_for_release(min(remaining, self.LOCK_WAIT_SLICE))
+            except Exception as e:
+                logger.error(f"Error waiting for lock on '{key}', computing without cache: {e}")
+                return await compute()
+
+            cached_value = await self._aread_value(key, enveloped)
+            if cached_value is not None:
+                logger.debug(f"Cache HIT after waiting: {key}")
+                return cached_value
+
+        logger.warning(f"Timed out waiting for lock on '{key}', computing without lock")
+        try:
+            value, delta = await self._atimed_call(compute)
+            await self._astore_value(key, value, ttl, stale_ttl, enveloped, delta)
             return value
         except Exception as e:
             logger.error(f"Error in fallback computation for '{key}': {e}")
@@ -299,7 +1466,8 @@ class CacheService:
             return None
 
         try:
-            return self.redis_client.incrby(key, amount)
+            with self.breaker.track():
+                return self.redis_client.incrby(key, amount)
         except Exception as e:
             logger.error(f"Cache INCREMENT error for key '{key}': {e}")
             return None
@@ -319,7 +1487,8 @@ class CacheService:
             return False
 
         try:
-            return self.redis_client.expire(key, ttl)
+            with self.breaker.track():
+                return self.redis_client.expire(key, ttl)
         except Exception as e:
             logger.error(f"Cache EXPIRE error for key '{key}': {e}")
             return False
@@ -338,8 +1507,9 @@ class CacheService:
             return None
 
         try:
-            ttl = self.redis_client.ttl(key)
-            return ttl if ttl > 0 else None
+            with self.breaker.track():
+                ttl = self.redis_client.ttl(key)
+                return ttl if ttl > 0 else None
         except Exception as e:
             logger.error(f"Cache GET TTL error for key '{key}': {e}")
             return None
@@ -371,6 +1541,21 @@ class CacheService:
 
         return ":".join(parts)
 
+    @staticmethod
+    def build_response_key(data_key: str) -> str:
+        """
+        Key of the pre-serialized HTTP response for a data cache key
+
+        Lives under the same prefix as the data key, so namespace generations,
+        L1 policies and invalidation messages cover both.
+        """
+        return f"{data_key}:response"
+
+    @staticmethod
+    def build_etag_key(data_key: str) -> str:
+        """Key of the ETag of a cached response (read alone for conditional GETs)"""
+        return f"{data_key}:etag"
+
 
 # Global cache service instance
 cache_service = CacheService()
\ No newline at end of file
@@ -0,0 +1,263 @@
+"""
+Cache Warmer
+
+Repopulates the hot catalog keys (default product pages, category list,
+popular filters) so users do not pay the full miss cost after a deploy or a
+catalog edit.
+
+- Targets are (loader, params) pairs. Services register a loader per cached
+  read (e.g. "products:list" -> ProductService(db).get_all(**params)) and
+  record their canonical first pages (record_page), so the hot set is the
+  configured targets plus the most requested ones. Request counts are merged
+  into a Redis sorted set on each warm pass, so every worker (and the next
+  deploy) learns from all of them. Both are bounded: each worker keeps the
+  top WARM_MAX_COUNTED targets, the sorted set is trimmed to
+  WARM_HOT_SET_SIZE members and expires when nothing is recorded.
+- Warming runs right after startup and after every namespace invalidation
+  (CacheService invalidation listener); invalidations within a short window
+  are coalesced into one pass.
+- Loads run in a small dedicated thread pool, each on its own DB session,
+  so warming never takes more than CacheConfig.WARM_CONCURRENCY connections
+  from the pool. Loaders go through get_or_set, so workers warming the same
+  key at the same time still compute it once.
+"""
+import json
+import logging
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from config.constants import CacheConfig, PaginationConfig
+from config.database import SessionLocal
+from services.cache_service import CacheService, cache_service
+
+logger = logging.getLogger(__name__)
+
+HOT_TARGETS_KEY = "cache:warm:hot"
+
+Target = Tuple[str, Dict[str, Any]]
+
+
+class CacheWarmer:
+    """
+    Keeps hot cache keys populated
+
+    Usage:
+        cache_warmer.register_loader("categories:list", lambda db, params: CategoryService(db).get_all(**params))
+        cache_warmer.record("categories:list", skip=0, limit=100)   # on every read
+        cache_warmer.start()                                       # app startup
+    """
+
+    def __init__(
+        self,
+        cache: CacheService = cache_service,
+        targets: Tuple[Target, ...] = CacheConfig.WARM_TARGETS,
+        concurrency: int = CacheConfig.WARM_CONCURRENCY,
+        debounce_seconds: float = CacheConfig.WARM_DEBOUNCE_SECONDS,
+        learned_targets: int = CacheConfig.WARM_LEARNED_TARGETS,
+        session_factory: Callable = SessionLocal,
+        max_counted: int = CacheConfig.WARM_MAX_COUNTED,
+        hot_set_size: int = CacheConfig.WARM_HOT_SET_SIZE,
+        hot_set_ttl: int = CacheConfig.WARM_HOT_SET_TTL
+    ):
+        self.cache = cache
+        self.targets = list(targets)
+        self.concurrency = concurrency
+        self.debounce_seconds = debounce_seconds
+        self.learned_targets = learned_targets
+        self.session_factory = session_factory
+        self.max_counted = max_counted
+        self.hot_set_size = max(hot_set_size, learned_targets)
+        self.hot_set_ttl = hot_set_ttl
+
+        self._loaders: Dict[str, Callable[[Any, Dict[str, Any]], Any]] = {}
+        self._counts: Counter = Counter()
+        self._counts_lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending: Dict[str, threading.Timer] = {}
+        self._pending_lock = threading.Lock()
+        self._warming = threading.local()
+        self._started = False
+        self.warmed = 0
+        self.errors = 0
+
+    # ------------------------------------------------------------------
+    # Registration / learning
+    # ------------------------------------------------------------------
+
+    def register_loader(self, name: str, loader: Callable[[Any, Dict[str, Any]], Any]):
+        """
+        Register how to (re)load a target
+
+        Args:
+            name: Loader name, also the cache namespace it fills (e.g. "products:list")
+            loader: loader(db_session, params) doing the cached read
+        """
+        self._loaders[name] = loader
+
+    def record(self, name: str, **params):
+        """Count a cached read so frequently requested targets get warmed"""
+        if getattr(self._warming, "active", False):
+            return
+        with self._counts_lock:
+            self._counts[self._encode(name, params)] += 1
+            if len(self._counts) > self.max_counted:
+                # Keep the top half: one-off targets never accumulate
+                self._counts = Counter(dict(self._counts.most_common(self.max_counted // 2)))
+
+    def record_page(self, name: str, skip: int, limit: int, cursor: Optional[str] = None, **params):
+        """
+        record() for list reads, counting canonical first pages only
+
+        Deep pages, cursors and non-default limits are never warm targets, and
+        the callers leave free-form params (search text, price bounds) out.
+        """
+        if skip or cursor or limit != PaginationConfig.DEFAULT_LIMIT:
+            return
+        self.record(name, skip=skip, limit=limit, **params)
+
+    @staticmethod
+    def _encode(name: str, params: Dict[str, Any]) -> str:
+        return json.dumps([name, params], sort_keys=True, separators=(",", ":"))
+
+    @staticmethod
+    def _decode(member: Any) -> Target:
+        if isinstance(member, bytes):
+            member = member.decode("utf-8")
+        name, params = json.loads(member)
+        return name, params
+
+    def _learned(self) -> List[Target]:
+        """Publish local counts to Redis and return the most requested targets"""
+        with self._counts_lock:
+            counts, self._counts = self._counts, Counter()
+
+        if not self.learned_targets:
+            return []
+        if not self.cache.is_available():
+            return [self._decode(member) for member, _ in counts.most_common(self.learned_targets)]
+
+        try:
+            pipe = self.cache.redis_client.pipeline(transaction=False)
+            for member, count in counts.items():
+                pipe.zincrby(HOT_TARGETS_KEY, count, member)
+            if counts:
+                # Bounded and self-cleaning: keep the top members only, and
+                # let the whole set go once no worker records anything
+                pipe.zremrangebyrank(HOT_TARGETS_KEY, 0, -self.hot_set_size - 1)
+                pipe.expire(HOT_TARGETS_KEY, self.hot_set_ttl)
+            pipe.zrevrange(HOT_TARGETS_KEY, 0, self.learned_targets - 1)
+            members = pipe.execute()[-1]
+            return [self._decode(member) for member in members]
+        except Exception as e:
+            logger.error(f"Error reading learned hot targets: {e}")
+            return [self._decode(member) for member, _ in counts.most_common(self.learned_targets)]
+
+    def hot_targets(self, namespace: Optional[str] = None) -> List[Target]:
+        """Configured + learned targets (deduplicated), optionally within a namespace"""
+        unique = {}
+        for name, params in self.targets + self._learned():
+            if name not in self._loaders:
+                continue
+            if namespace and not (name == namespace or name.startswith(f"{namespace}:")):
+                continue
+            unique.setdefault(self._encode(name, params), (name, params))
+        return list(unique.values())
+
+    # ------------------------------------------------------------------
+    # Warming
+    # ------------------------------------------------------------------
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._pending_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.concurrency,
+                    thread_name_prefix="cache-warmer"
+                )
+            return self._executor
+
+    def warm_target(self, name: str, params: Dict[str, Any]) -> bool:
+        """Load one target on a fresh DB session (blocking)"""
+        db = self.session_factory()
+        self._warming.active = True
+        try:
+            self._loaders[name](db, params)
+            self.warmed += 1
+            return True
+        except Exception as e:
+            self.errors += 1
+            logger.error(f"Cache warm failed for {name} {params}: {e}")
+            return False
+        finally:
+            self._warming.active = False
+            db.close()
+
+    def warm(self, namespace: Optional[str] = None) -> list:
+        """Submit every hot target (of a namespace) to the warm pool; returns the futures"""
+        if not self.cache.is_available():
+            return []
+
+        targets = self.hot_targets(namespace)
+        logger.info(f"Warming {len(targets)} cache targets" + (f" in '{namespace}'" if namespace else ""))
+        executor = self._get_executor()
+        return [executor.submit(self.warm_target, name, params) for name, params in targets]
+
+    def schedule(self, namespace: str):
+        """
+        Warm a namespace after the debounce window (invalidation listener)
+
+        Non-blocking: safe to call from request threads and the event loop.
+        """
+        # Namespaces without loaders (e.g. query cache table versions) have nothing to warm
+        if not any(name == namespace or name.startswith(f"{namespace}:") for name in self._loaders):
+            return
+        with self._pending_lock:
+            if namespace in self._pending:
+                return
+            timer = threading.Timer(self.debounce_seconds, self._run_scheduled, args=(namespace,))
+            timer.daemon = True
+            self._pending[namespace] = timer
+        timer.start()
+
+    def _run_scheduled(self, namespace: str):
+        with self._pending_lock:
+            self._pending.pop(namespace, None)
+        self.warm(namespace)
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def start(self):
+        """Warm everything now and re-warm after every invalidation"""
+        if self._started:
+            return
+        self._started = True
+        self.cache.add_invalidation_listener(self.schedule)
+        self.warm()
+
+    def stop(self):
+        self.cache.remove_invalidation_listener(self.schedule)
+        self._started = False
+        with self._pending_lock:
+            for timer in self._pending.values():
+                timer.cancel()
+            self._pending.clear()
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    def stats(self) -> dict:
+        return {
+            "enabled": self._started,
+            "loaders": sorted(self._loaders),
+            "warmed": self.warmed,
+            "errors": self.errors,
+            "pending": sorted(self._pending),
+        }
+
+
+# Global warmer instance (started from main.startup_event)
+cache_warmer = CacheWarmer()
@@ -1,13 +1,19 @@
 """Category service with Redis caching integration."""
 import logging
-from typing import List
+from typing import List, Optional, Type
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from config.constants import CacheConfig
 from models.category import CategoryModel
-from repositories.category_repository import CategoryRepository
+from repositories.base_repository import BaseRepository
+from repositories.base_repository_impl import InstanceNotFoundError
+from repositories.category_repository import AsyncCategoryRepository, CategoryRepository
 from schemas.category_schema import CategorySchema
 from services.base_service_impl import BaseServiceImpl
+from services.cache_invalidation import cache_invalidation
 from services.cache_service import cache_service
+from services.cache_warmer import cache_warmer
 from utils.logging_utils import get_sanitized_logger
 
 logger = get_sanitized_logger(__name__)
@@ -16,9 +22,9 @@ logger = get_sanitized_logger(__name__)
 class CategoryService(BaseServiceImpl):
     """Service for Category entity with aggressive caching (rarely changes)."""
 
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, repository_class: Type[BaseRepository] = CategoryRepository):
         super().__init__(
-            repository_class=CategoryRepository,
+            repository_class=repository_class,
             model=CategoryModel,
             schema=CategorySchema,
             db=db
@@ -28,35 +34,41 @@ class CategoryService(BaseServiceImpl):
         # Categories change rarely, so longer TTL (1 hour)
         self.cache_ttl = 3600
 
-    def get_all(self, skip: int = 0, limit: int = 100) -> List[CategorySchema]:
+    def list_cache_key(self, skip: int, limit: int, cursor: Optional[str] = None) -> str:
+        return self.cache.build_key(
+            self.cache_prefix, "list", skip=skip, limit=limit, **({"cursor": cursor} if cursor else {})
+        )
+
+    def item_cache_key(self, id_key: int) -> str:
+        return self.cache.build_key(self.cache_prefix, "id", id=id_key)
+
+    def missing_cache_key(self, id_key: int) -> str:
+        """Negative cache entry (cleared with the rest of the namespace on save)"""
+        return self.cache.build_key(self.cache_prefix, "missing", id=id_key)
+
+    def get_all(self, skip: int = 0, limit: int = 100, cursor: Optional[str] = None) -> List[CategorySchema]:
         """
         Get all categories with long-lived cache
 
-        Cache key pattern: categories:list:skip:{skip}:limit:{limit}
+        Cache key pattern: categories:list:skip:{skip}:limit:{limit}[:cursor:{cursor}]
         TTL: 1 hour (categories rarely change)
         """
-        cache_key = self.cache.build_key(
-            self.cache_prefix,
-            "list",
-            skip=skip,
-            limit=limit
+        cache_key = self.list_cache_key(skip, limit, cursor)
+        cache_warmer.record_page("categories:list", skip, limit, cursor)
+
+        def load(repository) -> List[dict]:
+            return [c.model_dump() for c in repository.find_all(skip=skip, limit=limit, cursor=cursor)]
+
+        # Cache with longer TTL, served stale while one worker refreshes it
+        categories = self.cache.get_or_set(
+            cache_key,
+            lambda: load(self._repository),
+            ttl=self.cache_ttl,
+            stale_ttl=CacheConfig.STALE_TTL,
+            refresh_callback=lambda: self._run_in_new_session(load),
+            beta=CacheConfig.XFETCH_BETA
         )
-
-        # Try cache first
-        cached_categories = self.cache.get(cache_key)
-        if cached_categories is not None:
-            logger.debug(f"Cache HIT: {cache_key}")
-            return [CategorySchema(**c) for c in cached_categories]
-
-        # Cache miss
-        logger.debug(f"Cache MISS: {cache_key}")
-        categories = super().get_all(skip, limit)
-
-        # Cache with longer TTL
-        categories_dict = [c.model_dump() for c in categories]
-        self.cache.set(cache_key, categories_dict, ttl=self.cache_ttl)
-
-        return categories
+        return [CategorySchema(**c) for c in categories]
 
     def get_one(self, id_key: int) -> CategorySchema:
         """
@@ -65,30 +77,35 @@ class CategoryService(BaseServiceImpl):
         Cache key pattern: categories:id:{id_key}
         TTL: 1 hour
         """
-        cache_key = self.cache.build_key(self.cache_prefix, "id", id=id_key)
+        cache_key = self.item_cache_key(id_key)
+        missing_key = self.missing_cache_key(id_key)
 
-        cached_category = self.cache.get(cache_key)
-        if cached_category is not None:
+        cached = self.cache.get_many([cache_key, missing_key])
+        if cache_key in cached:
             logger.debug(f"Cache HIT: {cache_key}")
-            return CategorySchema(**cached_category)
+            return CategorySchema(**cached[cache_key])
+        if missing_key in cached:
+            logger.debug(f"Negative cache HIT: {missing_key}")
+            raise InstanceNotFoundError(f"CategoryModel with id {id_key} not found")
 
         logger.debug(f"Cache MISS: {cache_key}")
-        category = super().get_one(id_key)
+        try:
+            category = super().get_one(id_key)
+        except InstanceNotFoundError:
+            self.cache.set(missing_key, 1, ttl=CacheConfig.NEGATIVE_TTL)
+            raise
 
         self.cache.set(cache_key, category.model_dump(), ttl=self.cache_ttl)
 
         return category
 
-    def save(self, schema: CategorySchema) -> CategorySchema:
-        """Create new category and invalidate cache"""
-        category = super().save(schema)
-        self._invalidate_all_cache()
-        return category
-
     def update(self, id_key: int, schema: CategorySchema) -> CategorySchema:
         """
         Update category with transactional cache invalidation
 
+        The category caches are invalidated by the commit itself
+        (services.cache_invalidation); a failed update leaves them untouched.
+
         Args:
             id_key: Category ID to update
             schema: Validated CategorySchema with new data
@@ -101,28 +118,82 @@ class CategoryService(BaseServiceImpl):
             ValueError: If validation fails
         """
         try:
-            # Update in database first (atomic transaction)
             category = super().update(id_key, schema)
+            logger.info(f"Category {id_key} updated successfully")
+            return category
+
+        except Exception as e:
+            logger.error(f"Failed to update category {id_key}: {e}")
+            raise
 
-            # Only invalidate cache AFTER successful DB commit
-            self._invalidate_all_cache()
 
-            logger.info(f"Category {id_key} updated and cache invalidated successfully")
+class AsyncCategoryService(CategoryService):
+    """CategoryService running on the async database layer (same cache keys)."""
+
+    def __init__(self, db: AsyncSession):
+        super().__init__(db, repository_class=AsyncCategoryRepository)
+
+    async def get_all(self, skip: int = 0, limit: int = 100, cursor: Optional[str] = None) -> List[CategorySchema]:
+        cache_key = self.list_cache_key(skip, limit, cursor)
+        cache_warmer.record_page("categories:list", skip, limit, cursor)
+
+        async def load(repository) -> List[dict]:
+            return [c.model_dump() for c in await repository.find_all(skip=skip, limit=limit, cursor=cursor)]
+
+        categories = await self.cache.aget_or_set(
+            cache_key,
+            lambda: load(self._repository),
+            ttl=self.cache_ttl,
+            stale_ttl=CacheConfig.STALE_TTL,
+            refresh_callback=lambda: self._arun_in_new_session(load),
+            beta=CacheConfig.XFETCH_BETA
+        )
+        return [CategorySchema(**c) for c in categories]
+
+    async def get_one(self, id_key: int) -> CategorySchema:
+        cache_key = self.item_cache_key(id_key)
+        missing_key = self.missing_cache_key(id_key)
+
+        cached = await self.cache.aget_many([cache_key, missing_key])
+        if cache_key in cached:
+            logger.debug(f"Cache HIT: {cache_key}")
+            return CategorySchema(**cached[cache_key])
+        if missing_key in cached:
+            logger.debug(f"Negative cache HIT: {missing_key}")
+            raise InstanceNotFoundError(f"CategoryModel with id {id_key} not found")
+
+        logger.debug(f"Cache MISS: {cache_key}")
+        try:
+            category = await self._repository.find(id_key)
+        except InstanceNotFoundError:
+            await self.cache.aset(missing_key, 1, ttl=CacheConfig.NEGATIVE_TTL)
+            raise
+
+        await self.cache.aset(cache_key, category.model_dump(), ttl=self.cache_ttl)
+        return category
+
+    async def save(self, schema: CategorySchema) -> CategorySchema:
+        return await self._repository.save(self.to_model(schema))
+
+    async def update(self, id_key: int, schema: CategorySchema) -> CategorySchema:
+        """Update category (caches are invalidated by the commit)"""
+        try:
+            category = await self._repository.update(id_key, schema.model_dump(exclude_unset=True))
+            logger.info(f"Category {id_key} updated successfully")
             return category
 
         except Exception as e:
-            # If update fails, cache remains consistent (no invalidation)
             logger.error(f"Failed to update category {id_key}: {e}")
             raise
 
-    def delete(self, id_key: int) -> None:
-        """Delete category and invalidate cache"""
-        super().delete(id_key)
-        self._invalidate_all_cache()
-
-    def _invalidate_all_cache(self):
-        """Invalidate all category caches"""
-        pattern = f"{self.cache_prefix}:*"
-        deleted_count = self.cache.delete_pattern(pattern)
-        if deleted_count > 0:
-            logger.info(f"Invalidated {deleted_count} category cache entries")
+    async def delete(self, id_key: int) -> None:
+        await self._repository.remove(id_key)
+
+
+# Products embed their category, so product lists go stale with it too
+cache_invalidation.register(
+    CategoryModel,
+    namespaces=("categories", "products:list", "products:filter")
+)
+
+cache_warmer.register_loader("categories:list", lambda db, params: CategoryService(db).get_all(**params))
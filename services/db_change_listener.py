@@ -0,0 +1,238 @@
+"""
+DB Change Listener
+
+Applies cache invalidations for writes that never go through the services
+(seed scripts, admin SQL, migrations). The NOTIFY triggers of alembic
+revision 3f9a1c7e52d4 publish every row change of the catalog tables;
+this listener LISTENs on that channel and maps the rows to cache keys and
+namespaces with the same registry the session hooks use
+(services.cache_invalidation).
+
+- One listener per deployment: workers compete for a RedisLock and only
+  the holder keeps a LISTEN connection open. It renews the lock while
+  listening, so if it dies another worker takes over within
+  CacheConfig.DB_NOTIFY_LEADER_TTL seconds.
+- Notifications are drained in batches, and each batch becomes one
+  CacheService.invalidate() call (a 10k-row seed is a handful of pipelines,
+  not 10k round trips).
+- Changes made while nobody listened are unknown, so a new leader
+  invalidates every registered namespace once before listening.
+
+Writes made through the services are seen twice (commit hook and NOTIFY);
+the second invalidation is redundant but harmless.
+
+Requires PostgreSQL and psycopg2; the triggers are installed by
+`alembic upgrade head`.
+"""
+import json
+import logging
+import select
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from config.constants import CacheConfig
+from config.database import engine
+from services.cache_invalidation import CacheInvalidationRegistry, cache_invalidation
+from services.redis_lock import RedisLock
+
+logger = logging.getLogger(__name__)
+
+LEADER_LOCK_KEY = "lock:db-change-listener"
+
+
+def connect_from_engine() -> Any:
+    """Dedicated psycopg2 connection to the application database (outside the pool)"""
+    import psycopg2
+
+    url = engine.url.set(drivername="postgresql")
+    return psycopg2.connect(url.render_as_string(hide_password=False))
+
+
+class DatabaseChangeListener:
+    """
+    LISTEN/NOTIFY -> cache invalidation bridge
+
+    Usage:
+        db_change_listener.start()   # app startup (PostgreSQL only)
+        db_change_listener.stop()    # app shutdown
+    """
+
+    # Longest single wait for notifications (bounds stop() latency)
+    POLL_SECONDS = 1.0
+
+    def __init__(
+        self,
+        connect: Callable[[], Any] = connect_from_engine,
+        registry: CacheInvalidationRegistry = cache_invalidation,
+        channel: str = CacheConfig.DB_NOTIFY_CHANNEL,
+        leader_ttl: float = CacheConfig.DB_NOTIFY_LEADER_TTL,
+        reconnect_delay: float = 1.0
+    ):
+        """
+        Args:
+            connect: Returns a new psycopg2 connection
+            registry: Model -> cache entries registry
+            channel: NOTIFY channel used by the triggers
+            leader_ttl: Seconds before the leader lock of a dead listener expires
+            reconnect_delay: Seconds to wait after a connection error
+        """
+        self.connect = connect
+        self.registry = registry
+        self.channel = channel
+        self.leader_ttl = leader_ttl
+        self.reconnect_delay = reconnect_delay
+
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.is_leader = False
+        self.received = 0
+        self.applied = 0
+        self.errors = 0
+
+    # ------------------------------------------------------------------
+    # Translation
+    # ------------------------------------------------------------------
+
+    def handle_payloads(self, payloads: List[str]) -> bool:
+        """
+        Apply a batch of NOTIFY payloads as a single cache invalidation
+
+        Returns:
+            True if something was invalidated
+        """
+        rows_by_table: Dict[str, List[dict]] = {}
+        for raw in payloads:
+            try:
+                message = json.loads(raw)
+                table = message["table"]
+            except (ValueError, KeyError, TypeError) as e:
+                logger.warning(f"Ignoring malformed DB change notification: {e}")
+                continue
+            rows = rows_by_table.setdefault(table, [])
+            rows.extend(row for row in (message.get("new"), message.get("old")) if row)
+
+        self.received += len(payloads)
+        keys, namespaces = set(), set()
+        for table, rows in rows_by_table.items():
+            table_keys, table_namespaces = self.registry.collect_rows(table, rows)
+            keys.update(table_keys)
+            namespaces.update(table_namespaces)
+
+        if not (keys or namespaces):
+            return False
+        self.registry.cache.invalidate(sorted(keys), sorted(namespaces))
+        self.applied += 1
+        return True
+
+    def invalidate_all(self) -> bool:
+        """Invalidate every registered namespace (changes may have been missed)"""
+        namespaces = self.registry.namespaces()
+        if not namespaces:
+            return False
+        return self.registry.cache.invalidate(namespaces=namespaces)
+
+    # ------------------------------------------------------------------
+    # Leadership
+    # ------------------------------------------------------------------
+
+    def try_lead(self) -> Optional[RedisLock]:
+        """Take the deployment-wide listener lock, or None if another worker holds it"""
+        cache = self.registry.cache
+        if not cache.is_available():
+            return None
+        lock = RedisLock(LEADER_LOCK_KEY, cache.redis_client, timeout=self.leader_ttl)
+        try:
+            return lock if lock.acquire() else None
+        except Exception as e:
+            logger.error(f"Error acquiring DB change listener lock: {e}")
+            return None
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            lock = self.try_lead()
+            if lock is None:
+                self._stop_event.wait(self.leader_ttl / 3)
+                continue
+
+            self.is_leader = True
+            try:
+                self._listen(lock)
+            except Exception as e:
+                self.errors += 1
+                logger.error(f"DB change listener error: {e}")
+                self._stop_event.wait(self.reconnect_delay)
+            finally:
+                self.is_leader = False
+                try:
+                    lock.release()
+                except Exception:
+                    pass
+
+    def _listen(self, lock: RedisLock):
+        """LISTEN while we hold the lock; returns when it is lost or on stop()"""
+        connection = self.connect()
+        try:
+            connection.autocommit = True
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT count(*) FROM pg_trigger WHERE tgname LIKE %s",
+                    ("%\\_cache\\_invalidation",)
+                )
+                if not cursor.fetchone()[0]:
+                    logger.warning("⚠️  No cache invalidation triggers found: run `alembic upgrade head`")
+                cursor.execute(f'LISTEN "{self.channel}"')
+
+            self.invalidate_all()
+            logger.info(f"✅ DB change listener on channel '{self.channel}' (leader)")
+
+            renew_every = self.leader_ttl / 3
+            next_renewal = time.monotonic() + renew_every
+            while not self._stop_event.is_set():
+                timeout = min(self.POLL_SECONDS, max(0.0, next_renewal - time.monotonic()))
+                if select.select([connection], [], [], timeout) != ([], [], []):
+                    connection.poll()
+                    payloads = [notify.payload for notify in connection.notifies]
+                    connection.notifies.clear()
+                    if payloads:
+                        self.handle_payloads(payloads)
+
+                if time.monotonic() >= next_renewal:
+                    if not lock.extend():
+                        logger.warning("DB change listener lost its leader lock")
+                        return
+                    next_renewal = time.monotonic() + renew_every
+        finally:
+            connection.close()
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def start(self) -> None:
+        """Start competing for leadership in a background thread (idempotent)"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="db-change-listener", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 2.0) -> None:
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def stats(self) -> dict:
+        return {
+            "channel": self.channel,
+            "running": self._thread is not None and self._thread.is_alive(),
+            "leader": self.is_leader,
+            "received": self.received,
+            "applied": self.applied,
+            "errors": self.errors,
+        }
+
+
+# Global listener (started from main.startup_event on PostgreSQL)
+db_change_listener = DatabaseChangeListener()
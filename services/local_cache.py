@@ -0,0 +1,91 @@
+"""
+Local (L1) Cache Module
+
+Bounded in-process LRU cache with per-entry TTL, consulted by CacheService
+before Redis. Each worker process has its own copy, so entries are kept
+short-lived and sized to fit comfortably in memory.
+"""
+import fnmatch
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+
+class LocalCache:
+    """
+    Thread-safe LRU cache with TTL
+
+    Values are stored already deserialized, so an L1 hit skips both the
+    Redis round trip and json.loads. Callers must treat returned values as
+    read-only (they are shared between requests of the same worker).
+    """
+
+    def __init__(self, max_entries: int = 10000):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[Any, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            value, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        """Store a value for ttl seconds, evicting the least recently used entry if full"""
+        if ttl <= 0 or self.max_entries <= 0:
+            return
+
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key: str) -> bool:
+        """Remove a key; returns True if it was present"""
+        with self._lock:
+            return self._entries.pop(key, None) is not None
+
+    def delete_pattern(self, pattern: str) -> int:
+        """Remove every key matching a Redis-style glob pattern"""
+        with self._lock:
+            keys = [key for key in self._entries if fnmatch.fnmatchcase(key, pattern)]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def clear(self) -> None:
+        """Remove all entries"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss counters and current size"""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+        }
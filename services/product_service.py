@@ -1,22 +1,40 @@
 import logging
 import os
-from typing import List, Optional
+from typing import List, Optional, Type
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from config.constants import CacheConfig
 from models.product import ProductModel
-from repositories.product_repository import ProductRepository
-from schemas.product_schema import ProductSchema
+from models.review import ReviewModel
+from repositories.base_repository import BaseRepository
+from repositories.base_repository_impl import InstanceNotFoundError
+from repositories.product_repository import PRODUCT_SORT_KEYS, AsyncProductRepository, ProductRepository
+from schemas.product_schema import ProductListSchema, ProductSchema, ProductSuggestionSchema, ProductSummarySchema
 from services.base_service_impl import BaseServiceImpl
+from services.cache_invalidation import cache_invalidation
 from services.cache_service import cache_service
+from services.cache_warmer import cache_warmer
 from utils.logging_utils import get_sanitized_logger
 
 logger = get_sanitized_logger(__name__)
 
 
+def product_cache_keys(id_key: int) -> List[str]:
+    """Per-product cache entries: item, its HTTP response and ETag, negative entry"""
+    item_key = cache_service.build_key("products", "id", id=id_key)
+    return [
+        item_key,
+        cache_service.build_response_key(item_key),
+        cache_service.build_etag_key(item_key),
+        cache_service.build_key("products", "missing", id=id_key),
+    ]
+
+
 class ProductService(BaseServiceImpl):
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, repository_class: Type[BaseRepository] = ProductRepository):
         super().__init__(
-            repository_class=ProductRepository,
+            repository_class=repository_class,
             model=ProductModel,
             schema=ProductSchema,
             db=db
@@ -35,64 +53,160 @@ class ProductService(BaseServiceImpl):
         except Exception as e:
             logger.error(f"Failed to delete image {image_url}: {e}")
 
-    def get_all(self, skip: int = 0, limit: int = 100, include_inactive: bool = False) -> List[ProductSchema]:
-        cache_key = self.cache.build_key(
+    def list_cache_key(self, skip: int, limit: int, include_inactive: bool, cursor: Optional[str] = None,
+                       lean: bool = False) -> str:
+        return self.cache.build_key(
             self.cache_prefix,
             "list",
             skip=skip,
             limit=limit,
-            inactive=str(include_inactive)
+            inactive=str(include_inactive),
+            **({"cursor": cursor} if cursor else {}),
+            **({"view": "lean"} if lean else {})
         )
 
-        cached_products = self.cache.get(cache_key)
-        if cached_products is not None:
-            logger.debug(f"Cache HIT: {cache_key}")
-            return [ProductSchema(**p) for p in cached_products]
+    def item_cache_key(self, id_key: int) -> str:
+        return self.cache.build_key(self.cache_prefix, "id", id=id_key)
 
-        logger.debug(f"Cache MISS: {cache_key}")
-        
-        products = self._repository.find_all(skip, limit, include_inactive)
+    def missing_cache_key(self, id_key: int) -> str:
+        """Negative cache entry: the ID was looked up and does not exist"""
+        return self.cache.build_key(self.cache_prefix, "missing", id=id_key)
+
+    def filter_cache_key(self, search, category_id, min_price, max_price,
+                          in_stock_only, active, sort_by, skip, limit, cursor=None) -> str:
+        return self.cache.build_key(
+            self.cache_prefix,
+            "filter",
+            search=search or "",
+            category_id=category_id or "",
+            min_price=min_price or "",
+            max_price=max_price or "",
+            in_stock_only=str(in_stock_only),
+            active=str(active),
+            sort_by=sort_by or "",
+            skip=skip,
+            limit=limit,
+            **({"cursor": cursor} if cursor else {})
+        )
 
-        products_dict = [p.model_dump() for p in products]
-        self.cache.set(cache_key, products_dict)
+    def suggest_cache_key(self, term: str, limit: int) -> str:
+        return self.cache.build_key(self.cache_prefix, "suggest", q=term, limit=limit)
+
+    @staticmethod
+    def suggest_term(q: str) -> Optional[str]:
+        """Normalized typeahead prefix ("  Gaming   LAP" -> "gaming lap"), None if too short"""
+        term = " ".join(q.lower().split())
+        return term if len(term) >= CacheConfig.SUGGEST_MIN_CHARS else None
+
+    @staticmethod
+    def _record_filter(search, category_id, min_price, max_price,
+                       in_stock_only, active, sort_by, skip, limit, cursor) -> None:
+        """
+        Count a filter read for warming: canonical first pages only, never
+        search text, price bounds or unknown sort modes (unbounded key space)
+        """
+        if search or min_price is not None or max_price is not None:
+            return
+        if sort_by is not None and sort_by not in PRODUCT_SORT_KEYS:
+            return
+        optional = {"category_id": category_id, "in_stock_only": in_stock_only, "sort_by": sort_by}
+        cache_warmer.record_page(
+            "products:filter", skip, limit, cursor, active=active,
+            **{name: value for name, value in optional.items() if value}
+        )
 
-        return products
+    @staticmethod
+    def _early_refresh_beta(skip: int, cursor: Optional[str] = None) -> Optional[float]:
+        """XFetch only for first pages: the hot keys, where expiry stampedes hurt"""
+        return CacheConfig.XFETCH_BETA if skip == 0 and not cursor else None
+
+    def get_all(self, skip: int = 0, limit: int = 100, include_inactive: bool = False,
+                cursor: Optional[str] = None, lean: bool = False) -> List[ProductSummarySchema]:
+        """
+        Product list page. lean=True returns flat ProductListSchema rows read
+        with a Core column select (no category, no reviews) for grid views.
+        """
+        cache_key = self.list_cache_key(skip, limit, include_inactive, cursor, lean)
+        cache_warmer.record_page(
+            "products:list", skip, limit, cursor, include_inactive=include_inactive,
+            **({"lean": True} if lean else {})
+        )
+        schema = ProductListSchema if lean else ProductSummarySchema
+
+        def load(repository) -> List[dict]:
+            find_all = repository.find_all_lean if lean else repository.find_all
+            return [p.model_dump() for p in find_all(skip, limit, include_inactive, cursor)]
+
+        # Stale-while-revalidate: an expired list is served immediately while
+        # one worker reloads it on its own DB session
+        products = self.cache.get_or_set(
+            cache_key,
+            lambda: load(self._repository),
+            stale_ttl=CacheConfig.STALE_TTL,
+            refresh_callback=lambda: self._run_in_new_session(load),
+            beta=self._early_refresh_beta(skip, cursor)
+        )
+        return [schema(**p) for p in products]
 
     def get_one(self, id_key: int) -> ProductSchema:
-        cache_key = self.cache.build_key(self.cache_prefix, "id", id=id_key)
+        cache_key = self.item_cache_key(id_key)
+        missing_key = self.missing_cache_key(id_key)
 
-        cached_product = self.cache.get(cache_key)
-        if cached_product is not None:
+        # Product and negative entry in one MGET
+        cached = self.cache.get_many([cache_key, missing_key])
+        if cache_key in cached:
             logger.debug(f"Cache HIT: {cache_key}")
-            return ProductSchema(**cached_product)
+            return ProductSchema(**cached[cache_key])
+        if missing_key in cached:
+            logger.debug(f"Negative cache HIT: {missing_key}")
+            raise InstanceNotFoundError(f"Product with id {id_key} not found")
 
         logger.debug(f"Cache MISS: {cache_key}")
-        product = super().get_one(id_key)
+        try:
+            product = super().get_one(id_key)
+        except InstanceNotFoundError:
+            self.cache.set(missing_key, 1, ttl=CacheConfig.NEGATIVE_TTL)
+            raise
 
         self.cache.set(cache_key, product.model_dump())
 
         return product
 
-    def save(self, schema: ProductSchema) -> ProductSchema:
-        product = super().save(schema)
-        self._invalidate_list_cache()
-        return product
+    def get_many(self, ids: List[int]) -> List[ProductSchema]:
+        """
+        Batch lookup by ID: one MGET for the cached products, one IN query
+        for the misses, one pipelined write-back.
 
-    def update(self, id_key: int, schema: ProductSchema) -> ProductSchema:
-        cache_key = self.cache.build_key(self.cache_prefix, "id", id=id_key)
+        Returns products in the order of `ids` (unknown IDs are skipped).
+        """
+        ids = list(dict.fromkeys(ids))
+        keys = {id_key: self.item_cache_key(id_key) for id_key in ids}
+
+        cached = self.cache.get_many(list(keys.values()))
+        found = {
+            id_key: ProductSchema(**cached[key])
+            for id_key, key in keys.items() if key in cached
+        }
 
+        missing = [id_key for id_key in ids if id_key not in found]
+        if missing:
+            logger.debug(f"Cache MISS for {len(missing)} of {len(ids)} products")
+            products = self._repository.find_by_ids(missing)
+            self.cache.set_many({keys[p.id_key]: p.model_dump() for p in products})
+            found.update({p.id_key: p for p in products})
+
+        return [found[id_key] for id_key in ids if id_key in found]
+
+    def update(self, id_key: int, schema: ProductSchema) -> ProductSchema:
         try:
             # ⚠️ CORRECCIÓN AQUÍ: Usamos .find() en lugar de .get_by_id()
             # porque ProductRepository usa 'find' para manejar lazyloads.
             old_product = self._repository.find(id_key)
             old_image = old_product.image_url if old_product else None
 
+            # Cache entries are evicted on commit (services.cache_invalidation)
             product = super().update(id_key, schema)
 
-            self.cache.delete(cache_key)
-            self._invalidate_list_cache()
-            self._invalidate_filter_cache()
-
             if old_image and product.image_url != old_image:
                 self._delete_image_file(old_image)
 
@@ -109,11 +223,6 @@ class ProductService(BaseServiceImpl):
         # Soft delete: solo actualizamos active = False
         self._repository.update(id_key, {"active": False})
 
-        cache_key = self.cache.build_key(self.cache_prefix, "id", id=id_key)
-        self.cache.delete(cache_key)
-        self._invalidate_list_cache()
-        self._invalidate_filter_cache()
-        
     def filter_products(
         self,
         search: Optional[str] = None,
@@ -124,52 +233,240 @@ class ProductService(BaseServiceImpl):
         active: Optional[bool] = True,
         sort_by: Optional[str] = None,
         skip: int = 0,
-        limit: int = 100
-    ) -> List[ProductSchema]:
-        cache_key = self.cache.build_key(
-            self.cache_prefix,
-            "filter",
-            search=search or "",
-            category_id=category_id or "",
-            min_price=min_price or "",
-            max_price=max_price or "",
-            in_stock_only=str(in_stock_only),
-            active=str(active),
-            sort_by=sort_by or "",
-            skip=skip,
-            limit=limit
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> List[ProductSummarySchema]:
+        cache_key = self.filter_cache_key(
+            search, category_id, min_price, max_price,
+            in_stock_only, active, sort_by, skip, limit, cursor
+        )
+        self._record_filter(
+            search, category_id, min_price, max_price, in_stock_only, active, sort_by, skip, limit, cursor
+        )
+
+        def load(repository) -> List[dict]:
+            products = repository.filter_products(
+                search=search,
+                category_id=category_id,
+                min_price=min_price,
+                max_price=max_price,
+                in_stock_only=in_stock_only,
+                active=active,
+                sort_by=sort_by,
+                skip=skip,
+                limit=limit,
+                cursor=cursor
+            )
+            return [p.model_dump() for p in products]
+
+        products = self.cache.get_or_set(
+            cache_key,
+            lambda: load(self._repository),
+            stale_ttl=CacheConfig.STALE_TTL,
+            refresh_callback=lambda: self._run_in_new_session(load),
+            beta=self._early_refresh_beta(skip, cursor)
+        )
+        return [ProductSummarySchema(**p) for p in products]
+
+    def suggest(self, q: str, limit: int = CacheConfig.SUGGEST_DEFAULT_LIMIT) -> List[ProductSuggestionSchema]:
+        """
+        Typeahead suggestions: id, name, price and image of the top matches.
+
+        Cached per normalized prefix, so every keystroke of a popular query
+        is served from the cache (L1 when enabled) without touching the DB.
+        """
+        term = self.suggest_term(q)
+        if term is None:
+            return []
+
+        suggestions = self.cache.get_or_set(
+            self.suggest_cache_key(term, limit),
+            lambda: [s.model_dump() for s in self._repository.suggest(term, limit)],
+            ttl=CacheConfig.SUGGEST_TTL
+        )
+        return [ProductSuggestionSchema(**s) for s in suggestions]
+
+    def get_by_id(self, id_key: int):
+        return self.get_one(id_key)
+
+
+class AsyncProductService(ProductService):
+    """
+    ProductService running on the async database layer.
+
+    Shares cache keys and invalidation with ProductService so both
+    stacks can serve the same deployment interchangeably.
+    """
+
+    def __init__(self, db: AsyncSession):
+        super().__init__(db, repository_class=AsyncProductRepository)
+
+    async def get_all(self, skip: int = 0, limit: int = 100, include_inactive: bool = False,
+                      cursor: Optional[str] = None, lean: bool = False) -> List[ProductSummarySchema]:
+        cache_key = self.list_cache_key(skip, limit, include_inactive, cursor, lean)
+        cache_warmer.record_page(
+            "products:list", skip, limit, cursor, include_inactive=include_inactive,
+            **({"lean": True} if lean else {})
+        )
+        schema = ProductListSchema if lean else ProductSummarySchema
+
+        async def load(repository) -> List[dict]:
+            find_all = repository.find_all_lean if lean else repository.find_all
+            return [p.model_dump() for p in await find_all(skip, limit, include_inactive, cursor)]
+
+        products = await self.cache.aget_or_set(
+            cache_key,
+            lambda: load(self._repository),
+            stale_ttl=CacheConfig.STALE_TTL,
+            refresh_callback=lambda: self._arun_in_new_session(load),
+            beta=self._early_refresh_beta(skip, cursor)
         )
+        return [schema(**p) for p in products]
 
-        cached_products = self.cache.get(cache_key)
-        if cached_products is not None:
+    async def get_one(self, id_key: int) -> ProductSchema:
+        cache_key = self.item_cache_key(id_key)
+        missing_key = self.missing_cache_key(id_key)
+
+        cached = await self.cache.aget_many([cache_key, missing_key])
+        if cache_key in cached:
             logger.debug(f"Cache HIT: {cache_key}")
-            return [ProductSchema(**p) for p in cached_products]
+            return ProductSchema(**cached[cache_key])
+        if missing_key in cached:
+            logger.debug(f"Negative cache HIT: {missing_key}")
+            raise InstanceNotFoundError(f"Product with id {id_key} not found")
 
         logger.debug(f"Cache MISS: {cache_key}")
-        products = self._repository.filter_products(
-            search=search,
-            category_id=category_id,
-            min_price=min_price,
-            max_price=max_price,
-            in_stock_only=in_stock_only,
-            active=active,
-            sort_by=sort_by,
-            skip=skip,
-            limit=limit
+        try:
+            product = await self._repository.find(id_key)
+        except InstanceNotFoundError:
+            await self.cache.aset(missing_key, 1, ttl=CacheConfig.NEGATIVE_TTL)
+            raise
+
+        await self.cache.aset(cache_key, product.model_dump())
+        return product
+
+    async def get_many(self, ids: List[int]) -> List[ProductSchema]:
+        ids = list(dict.fromkeys(ids))
+        keys = {id_key: self.item_cache_key(id_key) for id_key in ids}
+
+        cached = await self.cache.aget_many(list(keys.values()))
+        found = {
+            id_key: ProductSchema(**cached[key])
+            for id_key, key in keys.items() if key in cached
+        }
+
+        missing = [id_key for id_key in ids if id_key not in found]
+        if missing:
+            logger.debug(f"Cache MISS for {len(missing)} of {len(ids)} products")
+            products = await self._repository.find_by_ids(missing)
+            await self.cache.aset_many({keys[p.id_key]: p.model_dump() for p in products})
+            found.update({p.id_key: p for p in products})
+
+        return [found[id_key] for id_key in ids if id_key in found]
+
+    async def save(self, schema: ProductSchema) -> ProductSchema:
+        return await self._repository.save(self.to_model(schema))
+
+    async def update(self, id_key: int, schema: ProductSchema) -> ProductSchema:
+        try:
+            old_product = await self._repository.find(id_key)
+            old_image = old_product.image_url if old_product else None
+
+            product = await self._repository.update(id_key, schema.model_dump(exclude_unset=True))
+
+            if old_image and product.image_url != old_image:
+                self._delete_image_file(old_image)
+
+            logger.info(f"Product {id_key} updated successfully")
+            return product
+
+        except Exception as e:
+            logger.error(f"Failed to update product {id_key}: {e}")
+            raise
+
+    async def delete(self, id_key: int) -> None:
+        logger.info(f"Soft deleting (deactivating) product {id_key}")
+
+        await self._repository.update(id_key, {"active": False})
+
+    async def filter_products(
+        self,
+        search: Optional[str] = None,
+        category_id: Optional[int] = None,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+        in_stock_only: bool = False,
+        active: Optional[bool] = True,
+        sort_by: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> List[ProductSummarySchema]:
+        cache_key = self.filter_cache_key(
+            search, category_id, min_price, max_price,
+            in_stock_only, active, sort_by, skip, limit, cursor
+        )
+        self._record_filter(
+            search, category_id, min_price, max_price, in_stock_only, active, sort_by, skip, limit, cursor
         )
 
-        products_dict = [p.model_dump() for p in products]
-        self.cache.set(cache_key, products_dict)
+        async def load(repository) -> List[dict]:
+            products = await repository.filter_products(
+                search=search,
+                category_id=category_id,
+                min_price=min_price,
+                max_price=max_price,
+                in_stock_only=in_stock_only,
+                active=active,
+                sort_by=sort_by,
+                skip=skip,
+                limit=limit,
+                cursor=cursor
+            )
+            return [p.model_dump() for p in products]
+
+        products = await self.cache.aget_or_set(
+            cache_key,
+            lambda: load(self._repository),
+            stale_ttl=CacheConfig.STALE_TTL,
+            refresh_callback=lambda: self._arun_in_new_session(load),
+            beta=self._early_refresh_beta(skip, cursor)
+        )
+        return [ProductSummarySchema(**p) for p in products]
 
-        return products
+    async def suggest(self, q: str, limit: int = CacheConfig.SUGGEST_DEFAULT_LIMIT) -> List[ProductSuggestionSchema]:
+        term = self.suggest_term(q)
+        if term is None:
+            return []
 
-    def _invalidate_list_cache(self):
-        pattern = f"{self.cache_prefix}:list:*"
-        self.cache.delete_pattern(pattern)
+        async def load() -> List[dict]:
+            return [s.model_dump() for s in await self._repository.suggest(term, limit)]
 
-    def _invalidate_filter_cache(self):
-        pattern = f"{self.cache_prefix}:filter:*"
-        self.cache.delete_pattern(pattern)
-            
-    def get_by_id(self, id_key: int):
-        return self.get_one(id_key)
\ No newline at end of file
+        suggestions = await self.cache.aget_or_set(
+            self.suggest_cache_key(term, limit),
+            load,
+            ttl=CacheConfig.SUGGEST_TTL
+        )
+        return [ProductSuggestionSchema(**s) for s in suggestions]
+
+    async def get_by_id(self, id_key: int):
+        return await self.get_one(id_key)
+
+
+# Any committed change to a product (edits, soft deletes, stock moves from
+# order details, rating aggregates from reviews) evicts the product and its lists
+cache_invalidation.register(
+    ProductModel,
+    namespaces=("products:list", "products:filter", "products:suggest"),
+    keys=lambda product: product_cache_keys(product.id_key)
+)
+# Reviews are embedded in the product detail only: lists show the aggregates,
+# which ReviewService updates on the product row in the same transaction
+cache_invalidation.register(
+    ReviewModel,
+    keys=lambda review: product_cache_keys(review.product_id) if review.product_id else []
+)
+
+# Hot product lists are re-warmed after startup and after every invalidation
+cache_warmer.register_loader("products:list", lambda db, params: ProductService(db).get_all(**params))
+cache_warmer.register_loader("products:filter", lambda db, params: ProductService(db).filter_products(**params))
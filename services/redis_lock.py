@@ -0,0 +1,226 @@
+"""
+Redis Lock
+
+Distributed lock used by CacheService.get_or_set (and anything else that
+needs one worker across the deployment to do something).
+
+- Every acquisition stores a unique owner token, and release / extend are
+  compare-and-set Lua scripts, so a holder whose lock already expired can
+  never delete or extend the lock of the worker that took it over.
+- Long computations keep the lock alive with extend() or the renewing()
+  / arenewing() context managers instead of relying on a large timeout.
+- Waiters do not poll: release pushes the owner token on a notification
+  list and waiters block on BLPOP. Each woken waiter pushes the token back
+  (relay) so every waiter wakes up; the list expires on its own and is
+  cleared by the next acquire.
+
+Sync methods use the sync client, `a`-prefixed methods the redis.asyncio one.
+"""
+import asyncio
+import contextlib
+import logging
+import threading
+import uuid
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+# KEYS[1] lock, KEYS[2] notification list; ARGV[1] token, ARGV[2] timeout ms
+ACQUIRE_SCRIPT = """
+if redis.call('set', KEYS[1], ARGV[1], 'NX', 'PX', ARGV[2]) then
+    redis.call('del', KEYS[2])
+    return 1
+end
+return 0
+"""
+
+RELEASE_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    redis.call('del', KEYS[1])
+    redis.call('del', KEYS[2])
+    redis.call('rpush', KEYS[2], ARGV[1])
+    redis.call('pexpire', KEYS[2], ARGV[2])
+    return 1
+end
+return 0
+"""
+
+# KEYS[1] lock; ARGV[1] token, ARGV[2] new timeout ms
+EXTEND_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('pexpire', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+
+class RedisLock:
+    """
+    Owner-token lock on a Redis key
+
+    Usage:
+        lock = RedisLock("lock:products:list", client=redis_client, timeout=10)
+        if lock.acquire():
+            try:
+                with lock.renewing():
+                    compute()
+            finally:
+                lock.release()
+        else:
+            lock.wait_for_release(timeout=1.0)
+    """
+
+    def __init__(self, name: str, client: Any = None, async_client: Any = None, timeout: float = 10.0):
+        """
+        Args:
+            name: Lock key
+            client: Sync Redis client (decode_responses=True)
+            async_client: redis.asyncio client (decode_responses=True)
+            timeout: Seconds before an unreleased (crashed holder) lock expires
+        """
+        self.name = name
+        self.notify_key = f"{name}:notify"
+        self.client = client
+        self.async_client = async_client
+        self.timeout = timeout
+        self.token: Optional[str] = None
+
+    @property
+    def _timeout_ms(self) -> int:
+        return int(self.timeout * 1000)
+
+    def _script(self, client: Any, script: str):
+        return client.register_script(script)
+
+    # ------------------------------------------------------------------
+    # Sync API
+    # ------------------------------------------------------------------
+
+    def acquire(self) -> bool:
+        """Try once to take the lock (non-blocking)"""
+        token = uuid.uuid4().hex
+        acquired = self._script(self.client, ACQUIRE_SCRIPT)(
+            keys=[self.name, self.notify_key], args=[token, self._timeout_ms]
+        )
+        if acquired:
+            self.token = token
+        return bool(acquired)
+
+    def release(self) -> bool:
+        """Release the lock if we still own it and wake the waiters"""
+        if self.token is None:
+            return False
+        released = self._script(self.client, RELEASE_SCRIPT)(
+            keys=[self.name, self.notify_key], args=[self.token, self._timeout_ms]
+        )
+        self.token = None
+        if not released:
+            logger.warning(f"Lock '{self.name}' expired before release (held longer than {self.timeout}s)")
+        return bool(released)
+
+    def extend(self) -> bool:
+        """Reset the lock TTL to `timeout` if we still own it"""
+        if self.token is None:
+            return False
+        return bool(self._script(self.client, EXTEND_SCRIPT)(
+            keys=[self.name], args=[self.token, self._timeout_ms]
+        ))
+
+    def wait_for_release(self, timeout: float) -> bool:
+        """
+        Block until the holder releases the lock or `timeout` seconds pass
+
+        Keep `timeout` below the client's socket_timeout. Returns True when
+        woken by a release notification.
+        """
+        popped = self.client.blpop([self.notify_key], timeout=timeout)
+        if popped is None:
+            return False
+        # Relay the notification to the next waiter
+        pipe = self.client.pipeline(transaction=False)
+        pipe.rpush(self.notify_key, popped[1])
+        pipe.pexpire(self.notify_key, self._timeout_ms)
+        pipe.execute()
+        return True
+
+    @contextlib.contextmanager
+    def renewing(self):
+        """Extend the lock every timeout/3 seconds from a background thread"""
+        stopped = threading.Event()
+
+        def renew():
+            while not stopped.wait(self.timeout / 3):
+                try:
+                    if not self.extend():
+                        logger.warning(f"Lock '{self.name}' lost while renewing")
+                        return
+                except Exception as e:
+                    logger.error(f"Error renewing lock '{self.name}': {e}")
+
+        thread = threading.Thread(target=renew, name=f"lock-renew:{self.name}", daemon=True)
+        thread.start()
+        try:
+            yield self
+        finally:
+            stopped.set()
+
+    # ------------------------------------------------------------------
+    # Async API
+    # ------------------------------------------------------------------
+
+    async def aacquire(self) -> bool:
+        token = uuid.uuid4().hex
+        acquired = await self._script(self.async_client, ACQUIRE_SCRIPT)(
+            keys=[self.name, self.notify_key], args=[token, self._timeout_ms]
+        )
+        if acquired:
+            self.token = token
+        return bool(acquired)
+
+    async def arelease(self) -> bool:
+        if self.token is None:
+            return False
+        released = await self._script(self.async_client, RELEASE_SCRIPT)(
+            keys=[self.name, self.notify_key], args=[self.token, self._timeout_ms]
+        )
+        self.token = None
+        if not released:
+            logger.warning(f"Lock '{self.name}' expired before release (held longer than {self.timeout}s)")
+        return bool(released)
+
+    async def aextend(self) -> bool:
+        if self.token is None:
+            return False
+        return bool(await self._script(self.async_client, EXTEND_SCRIPT)(
+            keys=[self.name], args=[self.token, self._timeout_ms]
+        ))
+
+    async def await_for_release(self, timeout: float) -> bool:
+        """Async version of wait_for_release() (BLPOP does not block the loop)"""
+        popped = await self.async_client.blpop([self.notify_key], timeout=timeout)
+        if popped is None:
+            return False
+        pipe = self.async_client.pipeline(transaction=False)
+        pipe.rpush(self.notify_key, popped[1])
+        pipe.pexpire(self.notify_key, self._timeout_ms)
+        await pipe.execute()
+        return True
+
+    @contextlib.asynccontextmanager
+    async def arenewing(self):
+        """Extend the lock every timeout/3 seconds from an asyncio task"""
+        async def renew():
+            while True:
+                await asyncio.sleep(self.timeout / 3)
+                try:
+                    if not await self.aextend():
+                        logger.warning(f"Lock '{self.name}' lost while renewing")
+                        return
+                except Exception as e:
+                    logger.error(f"Error renewing lock '{self.name}': {e}")
+
+        task = asyncio.create_task(renew())
+        try:
+            yield self
+        finally:
+            task.cancel()
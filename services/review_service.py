@@ -1,14 +1,28 @@
 """Review service with proper dependency injection."""
+from typing import List, Optional
+
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
+from models.product import ProductModel
 from models.review import ReviewModel
+from repositories.base_repository_impl import InstanceNotFoundError
 from repositories.review_repository import ReviewRepository
 from schemas.review_schema import ReviewSchema
 from services.base_service_impl import BaseServiceImpl
+from utils.logging_utils import get_sanitized_logger
+
+logger = get_sanitized_logger(__name__)
 
 
 class ReviewService(BaseServiceImpl):
-    """Service for Review entity business logic."""
+    """
+    Service for Review entity business logic.
+
+    Every write also refreshes rating_avg / rating_count of the product(s)
+    involved, in the same transaction and under a row lock on the product,
+    so concurrent reviews of one product cannot lose updates.
+    """
 
     def __init__(self, db: Session):
         super().__init__(
@@ -17,3 +31,66 @@ class ReviewService(BaseServiceImpl):
             schema=ReviewSchema,
             db=db
         )
+
+    def _lock_product(self, product_id: int) -> ProductModel:
+        stmt = select(ProductModel).where(ProductModel.id_key == product_id).with_for_update()
+        product = self._repository.session.execute(stmt).scalar_one_or_none()
+        if product is None:
+            logger.error(f"Product with id {product_id} not found")
+            raise InstanceNotFoundError(f"Product with id {product_id} not found")
+        return product
+
+    def _refresh_rating(self, product: ProductModel, exclude_id: Optional[int] = None,
+                        extra: Optional[float] = None) -> None:
+        """
+        Recompute the aggregates of a locked product from its stored reviews,
+        leaving out exclude_id (review being deleted / rewritten) and adding
+        extra (rating being written). Uses the reviews.product_id index.
+        """
+        stmt = select(func.count(ReviewModel.id_key), func.sum(ReviewModel.rating)).where(
+            ReviewModel.product_id == product.id_key
+        )
+        if exclude_id is not None:
+            stmt = stmt.where(ReviewModel.id_key != exclude_id)
+        count, total = self._repository.session.execute(stmt).one()
+        total = total or 0.0
+        if extra is not None:
+            count, total = count + 1, total + extra
+
+        product.rating_count = count
+        product.rating_avg = total / count if count else None
+
+    def get_by_product(self, product_id: int, skip: int = 0, limit: int = 20,
+                       cursor: Optional[str] = None) -> List[ReviewSchema]:
+        """Paginated reviews of a product, newest first."""
+        reviews = self._repository.find_by_product(product_id, skip, limit, cursor)
+        if not reviews and self._repository.session.get(ProductModel, product_id) is None:
+            raise InstanceNotFoundError(f"Product with id {product_id} not found")
+        return reviews
+
+    def save(self, schema: ReviewSchema) -> ReviewSchema:
+        product = self._lock_product(schema.product_id)
+        self._refresh_rating(product, extra=schema.rating)
+        # Review and aggregates are committed together
+        return super().save(schema)
+
+    def update(self, id_key: int, schema: ReviewSchema) -> ReviewSchema:
+        existing = self._repository.find(id_key)
+
+        # Old and new product (a review may move), locked in id order so two
+        # opposite moves cannot deadlock
+        product_ids = {existing.product_id, schema.product_id} - {None}
+        for product_id in sorted(product_ids):
+            product = self._lock_product(product_id)
+            self._refresh_rating(
+                product, exclude_id=id_key,
+                extra=schema.rating if product_id == schema.product_id else None
+            )
+
+        return super().update(id_key, schema)
+
+    def delete(self, id_key: int) -> None:
+        review = self._repository.find(id_key)
+        if review.product_id is not None:
+            self._refresh_rating(self._lock_product(review.product_id), exclude_id=id_key)
+        super().delete(id_key)
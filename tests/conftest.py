@@ -1,11 +1,16 @@
 """Pytest configuration and fixtures for testing."""
+import asyncio
+import fnmatch
 import os
+import time
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.pool import StaticPool
+from fastapi import FastAPI
 from fastapi.testclient import TestClient
 from datetime import datetime, date
-from typing import Generator
+from typing import Generator, List
 
 # Set test environment before importing app modules
 os.environ['POSTGRES_HOST'] = 'localhost'
@@ -18,6 +23,10 @@ os.environ['REDIS_PORT'] = '6379'
 
 from models.base_model import base as Base
 from main import create_fastapi_app
+from config.database import get_db
+from controllers.product_controller import ProductController
+from services.cache_service import CacheService
+from services.redis_lock import ACQUIRE_SCRIPT, EXTEND_SCRIPT
 
 
 # Test database URL
@@ -30,6 +39,7 @@ def engine():
     test_engine = create_engine(
         TEST_DATABASE_URL,
         connect_args={"check_same_thread": False},  # SQLite specific
+        poolclass=StaticPool,  # one connection: TestClient threads see the same in-memory DB
         echo=False
     )
     Base.metadata.create_all(bind=test_engine)
@@ -77,6 +87,28 @@ def client(db_session: Session) -> Generator[TestClient, None, None]:
         yield test_client
 
 
+@pytest.fixture
+def api_client(db_session: Session) -> TestClient:
+    """Product routes on a bare FastAPI app, with get_db bound to db_session."""
+    app = FastAPI()
+    app.include_router(ProductController().router, prefix="/products")
+    app.dependency_overrides[get_db] = lambda: db_session
+    return TestClient(app)
+
+
+@pytest.fixture
+def sql_statements(engine) -> Generator[List[str], None, None]:
+    """SQL statements executed on the test engine during the test."""
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    yield statements
+    event.remove(engine, "before_cursor_execute", record)
+
+
 # Model fixtures
 @pytest.fixture
 def sample_category_data():
@@ -338,3 +370,232 @@ def mock_redis(monkeypatch):
             return results
 
     return MockRedis()
+
+
+# In-memory Redis fakes for CacheService, RedisLock and the invalidation bus
+class FakeRedis:
+    """Minimal in-memory stand-in for the redis.Redis commands CacheService uses."""
+
+    def __init__(self):
+        self.data = {}
+        self.expires_at = {}
+        self.published = []
+        self.round_trips = 0
+
+    def _expire_keys(self):
+        now = time.monotonic()
+        for key in [k for k, deadline in self.expires_at.items() if deadline <= now]:
+            self.data.pop(key, None)
+            self.expires_at.pop(key, None)
+
+    def get(self, key):
+        self._expire_keys()
+        return self.data.get(key)
+
+    def set(self, key, value, nx=False, ex=None):
+        self._expire_keys()
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        if ex:
+            self.expires_at[key] = time.monotonic() + ex
+        return True
+
+    def setex(self, key, ttl, value):
+        return self.set(key, value, ex=ttl)
+
+    def delete(self, *keys):
+        deleted = 0
+        for key in keys:
+            if key in self.data:
+                deleted += 1
+            self.data.pop(key, None)
+            self.expires_at.pop(key, None)
+        return deleted
+
+    def keys(self, pattern):
+        raise AssertionError("KEYS blocks Redis; CacheService must use SCAN")
+
+    def scan_iter(self, match="*", count=None):
+        self._expire_keys()
+        return iter([k for k in self.data if fnmatch.fnmatchcase(k, match)])
+
+    def incr(self, key, amount=1):
+        value = int(self.data.get(key, 0)) + amount
+        self.data[key] = str(value)
+        return value
+
+    incrby = incr
+
+    def mget(self, keys):
+        self.round_trips += 1
+        return [self.get(key) for key in keys]
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    def publish(self, channel, message):
+        self.published.append((channel, message))
+        return 1
+
+    def rpush(self, key, *values):
+        self.data.setdefault(key, []).extend(values)
+        return len(self.data[key])
+
+    def pexpire(self, key, ms):
+        if key not in self.data:
+            return 0
+        self.expires_at[key] = time.monotonic() + ms / 1000
+        return 1
+
+    def lpop_nowait(self, key):
+        self._expire_keys()
+        items = self.data.get(key)
+        if not items:
+            return None
+        value = items.pop(0)
+        if not items:
+            self.delete(key)
+        return (key, value)
+
+    def blpop(self, keys, timeout=0):
+        deadline = time.monotonic() + timeout
+        while True:
+            for key in keys:
+                popped = self.lpop_nowait(key)
+                if popped:
+                    return popped
+            if time.monotonic() >= deadline:
+                return None
+            time.sleep(0.005)
+
+    def register_script(self, script):
+        return FakeScript(self, script)
+
+    def zincrby(self, key, amount, member):
+        scores = self.data.setdefault(key, {})
+        scores[member] = scores.get(member, 0) + amount
+        return scores[member]
+
+    def zremrangebyrank(self, key, start, end):
+        scores = self.data.get(key, {})
+        ranked = sorted(scores, key=scores.get)
+        doomed = ranked[start:end + 1 if end != -1 else None]
+        for member in doomed:
+            del scores[member]
+        return len(doomed)
+
+    def expire(self, key, seconds):
+        return self.pexpire(key, seconds * 1000)
+
+    def zrevrange(self, key, start, end):
+        scores = self.data.get(key, {})
+        ranked = sorted(scores, key=scores.get, reverse=True)
+        return ranked[start:end + 1 if end >= 0 else None]
+
+
+class FakeScript:
+    """Python versions of the RedisLock Lua scripts."""
+
+    def __init__(self, redis, script):
+        self.redis = redis
+        self.script = script
+
+    def __call__(self, keys=(), args=()):
+        redis = self.redis
+        if self.script == ACQUIRE_SCRIPT:
+            if not redis.set(keys[0], args[0], nx=True, ex=args[1] / 1000):
+                return 0
+            redis.delete(keys[1])
+            return 1
+        if redis.get(keys[0]) != args[0]:
+            return 0
+        if self.script == EXTEND_SCRIPT:
+            return redis.pexpire(keys[0], args[1])
+        redis.delete(keys[0], keys[1])
+        redis.rpush(keys[1], args[0])
+        redis.pexpire(keys[1], args[1])
+        return 1
+
+
+class FakePipeline:
+    """Queues commands and runs them against FakeRedis on execute()."""
+
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self.commands.append((name, args, kwargs))
+            return self
+        return queue
+
+    def execute(self):
+        self.redis.round_trips += 1
+        return [getattr(self.redis, name)(*args, **kwargs) for name, args, kwargs in self.commands]
+
+
+class FakeAsyncPipeline(FakePipeline):
+    async def execute(self):
+        return FakePipeline.execute(self)
+
+
+class FakeAsyncRedis:
+    """redis.asyncio flavour of FakeRedis sharing the same storage."""
+
+    def __init__(self, sync_client: FakeRedis):
+        self.sync = sync_client
+
+    def pipeline(self, transaction=True):
+        return FakeAsyncPipeline(self.sync)
+
+    async def scan_iter(self, match="*", count=None):
+        for key in self.sync.scan_iter(match=match, count=count):
+            yield key
+
+    async def blpop(self, keys, timeout=0):
+        deadline = time.monotonic() + timeout
+        while True:
+            for key in keys:
+                popped = self.sync.lpop_nowait(key)
+                if popped:
+                    return popped
+            if time.monotonic() >= deadline:
+                return None
+            await asyncio.sleep(0.005)
+
+    def register_script(self, script):
+        script = FakeScript(self.sync, script)
+
+        async def run(keys=(), args=()):
+            return script(keys, args)
+
+        return run
+
+    def __getattr__(self, name):
+        method = getattr(self.sync, name)
+
+        async def wrapper(*args, **kwargs):
+            return method(*args, **kwargs)
+
+        return wrapper
+
+
+def use_fake_redis(service: CacheService, fake_redis: FakeRedis) -> CacheService:
+    """Point every Redis client of a CacheService at fake_redis and enable it."""
+    service.enabled = True
+    service.redis_client = service.binary_redis_client = fake_redis
+    service.async_redis_client = service.async_binary_redis_client = FakeAsyncRedis(fake_redis)
+    return service
+
+
+@pytest.fixture
+def fake_redis():
+    return FakeRedis()
+
+
+@pytest.fixture
+def fake_cache(fake_redis) -> CacheService:
+    """CacheService backed by fake_redis (sync and asyncio clients)."""
+    return use_fake_redis(CacheService(), fake_redis)
@@ -0,0 +1,199 @@
+"""Tests for the async database layer (AsyncSession repositories and services)."""
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from config.database import _to_async_uri
+from models.base_model import base as Base
+from models.category import CategoryModel
+from models.client import ClientModel
+from models.product import ProductModel
+from repositories.base_repository_impl import AsyncBaseRepositoryImpl, InstanceNotFoundError
+from repositories.category_repository import AsyncCategoryRepository
+from repositories.product_repository import AsyncProductRepository
+from schemas.category_schema import CategorySchema
+from schemas.client_schema import ClientSchema
+from services.category_service import AsyncCategoryService
+from services.product_service import AsyncProductService
+
+
+@pytest.fixture
+async def async_session():
+    """Fresh in-memory SQLite database driven through aiosqlite."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    session_factory = async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+    async with session_factory() as session:
+        yield session
+
+    await engine.dispose()
+
+
+@pytest.fixture
+async def catalog(async_session):
+    """Seed one category with an active and an inactive product."""
+    category = CategoryModel(name="Electronics")
+    async_session.add(category)
+    await async_session.flush()
+
+    async_session.add_all([
+        ProductModel(name="Laptop", price=999.99, stock=10, category_id=category.id_key, active=True),
+        ProductModel(name="Old Phone", price=99.99, stock=0, category_id=category.id_key, active=False),
+    ])
+    await async_session.commit()
+    return category
+
+
+class TestAsyncUri:
+    """Tests for the asyncpg URI translation."""
+
+    def test_translates_postgresql_scheme(self):
+        assert _to_async_uri("postgresql://u:p@h:5432/db") == "postgresql+asyncpg://u:p@h:5432/db"
+
+    def test_translates_psycopg2_scheme(self):
+        assert _to_async_uri("postgresql+psycopg2://u:p@h/db") == "postgresql+asyncpg://u:p@h/db"
+
+    def test_leaves_other_schemes_untouched(self):
+        assert _to_async_uri("sqlite:///test.db") == "sqlite:///test.db"
+
+
+class TestAsyncBaseRepository:
+    """Tests for AsyncBaseRepositoryImpl CRUD operations."""
+
+    async def test_save_and_find(self, async_session):
+        repository = AsyncBaseRepositoryImpl(ClientModel, ClientSchema, async_session)
+
+        saved = await repository.save(ClientModel(name="Ana", lastname="Diaz", email="ana@example.com"))
+        found = await repository.find(saved.id_key)
+
+        assert found.email == "ana@example.com"
+
+    async def test_find_missing_raises(self, async_session):
+        repository = AsyncBaseRepositoryImpl(ClientModel, ClientSchema, async_session)
+
+        with pytest.raises(InstanceNotFoundError):
+            await repository.find(999)
+
+    async def test_update_blocks_protected_fields(self, async_session):
+        repository = AsyncBaseRepositoryImpl(ClientModel, ClientSchema, async_session)
+        saved = await repository.save(ClientModel(name="Ana", email="ana@example.com"))
+
+        with pytest.raises(ValueError):
+            await repository.update(saved.id_key, {"id_key": 42})
+
+        updated = await repository.update(saved.id_key, {"name": "Ana Maria"})
+        assert updated.name == "Ana Maria"
+
+    async def test_find_all_validates_pagination(self, async_session):
+        repository = AsyncBaseRepositoryImpl(ClientModel, ClientSchema, async_session)
+
+        with pytest.raises(ValueError):
+            await repository.find_all(skip=-1)
+
+    async def test_remove(self, async_session):
+        repository = AsyncBaseRepositoryImpl(ClientModel, ClientSchema, async_session)
+        saved = await repository.save(ClientModel(name="Ana", email="ana@example.com"))
+
+        await repository.remove(saved.id_key)
+
+        with pytest.raises(InstanceNotFoundError):
+            await repository.find(saved.id_key)
+
+
+class TestAsyncCatalogRepositories:
+    """Tests for AsyncProductRepository and AsyncCategoryRepository."""
+
+    async def test_product_find_all_excludes_inactive(self, async_session, catalog):
+        products = await AsyncProductRepository(async_session).find_all()
+
+        assert [p.name for p in products] == ["Laptop"]
+        assert products[0].category.name == "Electronics"
+
+    async def test_product_filter(self, async_session, catalog):
+        repository = AsyncProductRepository(async_session)
+
+        products = await repository.filter_products(search="lap", active=None, sort_by="price_asc")
+
+        assert [p.name for p in products] == ["Laptop"]
+
+    async def test_category_find_includes_products(self, async_session, catalog):
+        category = await AsyncCategoryRepository(async_session).find(catalog.id_key)
+
+        assert {p.name for p in category.products} == {"Laptop", "Old Phone"}
+
+
+class TestAsyncServices:
+    """Tests for AsyncProductService and AsyncCategoryService (cache unavailable)."""
+
+    async def test_product_service_soft_delete(self, async_session, catalog):
+        service = AsyncProductService(async_session)
+        product = (await service.get_all())[0]
+
+        await service.delete(product.id_key)
+
+        assert await service.get_all() == []
+        assert (await service.get_one(product.id_key)).active is False
+
+    async def test_category_service_save(self, async_session):
+        service = AsyncCategoryService(async_session)
+
+        saved = await service.save(CategorySchema(name="Books"))
+
+        assert (await service.get_one(saved.id_key)).name == "Books"
+
+
+class TestAsyncProductBatchLookup:
+    """Tests for the ID-batch product lookup (cache MGET + IN query for misses)."""
+
+    async def test_get_many_reads_misses_once(self, async_session, catalog, fake_cache, monkeypatch):
+        service = AsyncProductService(async_session)
+        service.cache = fake_cache
+        ids = [p.id_key for p in await service._repository.find_all(include_inactive=True)]
+
+        queries = []
+        original = service._repository.find_by_ids
+
+        async def spy(missing):
+            queries.append(missing)
+            return await original(missing)
+
+        monkeypatch.setattr(service._repository, "find_by_ids", spy)
+
+        first = await service.get_many(list(reversed(ids)) + [999])
+        second = await service.get_many(ids)
+
+        assert [p.id_key for p in first] == list(reversed(ids))
+        assert [p.id_key for p in second] == ids
+        assert queries == [list(reversed(ids)) + [999]]
+
+
+class TestAsyncNegativeCache:
+    """Tests for negative caching of missing product IDs."""
+
+    async def test_missing_id_cached_until_saved(self, async_session, catalog, fake_cache, monkeypatch):
+        # Saving clears the negative entry through the commit hooks
+        from services.cache_invalidation import cache_invalidation
+        monkeypatch.setattr(cache_invalidation, "cache", fake_cache)
+
+        service = AsyncProductService(async_session)
+        service.cache = fake_cache
+        lookups = []
+        original = service._repository.find
+
+        async def spy(id_key):
+            lookups.append(id_key)
+            return await original(id_key)
+
+        monkeypatch.setattr(service._repository, "find", spy)
+
+        for _ in range(3):
+            with pytest.raises(InstanceNotFoundError):
+                await service.get_one(3)
+        assert lookups == [3]
+
+        from schemas.product_schema import ProductSchema
+        created = await service.save(ProductSchema(name="Tablet", price=299.99, stock=5, category_id=catalog.id_key))
+
+        assert created.id_key == 3
+        assert (await service.get_one(3)).name == "Tablet"
@@ -0,0 +1,133 @@
+"""Tests for model-driven cache invalidation on transaction commit."""
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from models.base_model import base as Base
+from models.category import CategoryModel
+from models.product import ProductModel
+from models.review import ReviewModel
+from services.cache_invalidation import cache_invalidation
+from services.product_service import product_cache_keys
+
+
+@pytest.fixture
+def cache(fake_cache, monkeypatch):
+    monkeypatch.setattr(cache_invalidation, "cache", fake_cache)
+    return fake_cache
+
+
+@pytest.fixture
+def product(db_session):
+    category = CategoryModel(name="Electronics")
+    db_session.add(category)
+    db_session.flush()
+    product = ProductModel(name="Laptop", price=999.99, stock=10, category_id=category.id_key)
+    db_session.add(product)
+    db_session.commit()
+    return product
+
+
+def cache_product(cache, product_id):
+    item_key = product_cache_keys(product_id)[0]
+    cache.set(item_key, {"id_key": product_id})
+    cache.set("products:list:skip:0", [product_id])
+    return item_key
+
+
+class TestCommitInvalidation:
+    """Session events evict the cache entries of committed changes."""
+
+    def test_stock_change_evicts_product_in_one_round_trip(self, cache, fake_redis, db_session, product):
+        item_key = cache_product(cache, product.id_key)
+        round_trips = fake_redis.round_trips
+
+        # What OrderDetailService.save does to the product row
+        product.stock -= 2
+        db_session.flush()
+        assert cache.get(item_key) is not None  # nothing before commit
+
+        db_session.commit()
+
+        assert fake_redis.round_trips == round_trips + 1
+        assert cache.get(item_key) is None
+        assert cache.get("products:list:skip:0") is None
+
+    def test_rollback_keeps_cache(self, cache, db_session, product):
+        item_key = cache_product(cache, product.id_key)
+
+        product.price = 1.0
+        db_session.flush()
+        db_session.rollback()
+
+        assert cache.get(item_key) == {"id_key": product.id_key}
+
+    def test_flushes_of_one_transaction_are_batched(self, cache, fake_redis, db_session, product):
+        cache_product(cache, product.id_key)
+        round_trips = fake_redis.round_trips
+        generation = int(fake_redis.get("gen:products:list") or 0)
+
+        product.stock -= 1
+        db_session.flush()
+        db_session.add(ReviewModel(rating=5.0, comment="Great", product_id=product.id_key))
+        db_session.flush()
+        db_session.add(ProductModel(name="Mouse", price=19.99, stock=3, category_id=product.category_id))
+        db_session.commit()
+
+        assert fake_redis.round_trips == round_trips + 1
+        assert int(fake_redis.get("gen:products:list")) == generation + 1
+
+    def test_category_change_invalidates_product_lists(self, cache, fake_redis, db_session, product):
+        cache.set("categories:list:skip:0", [1])
+        cache.set("products:filter:active:True", [product.id_key])
+
+        product.category.name = "Computers"
+        db_session.commit()
+
+        assert cache.get("categories:list:skip:0") is None
+        assert cache.get("products:filter:active:True") is None
+
+    def test_unchanged_dirty_instance_is_ignored(self, cache, db_session, product):
+        item_key = cache_product(cache, product.id_key)
+
+        product.stock = product.stock  # marks dirty, no net change
+        db_session.commit()
+
+        assert cache.get(item_key) is not None
+
+    async def test_sync_session_on_the_loop_invalidates_before_returning(self, cache, db_session, product):
+        item_key = cache_product(cache, product.id_key)
+
+        product.stock = 3
+        db_session.commit()
+
+        assert cache.get(item_key) is None
+        assert cache_invalidation._tasks == set()
+
+    async def test_async_session_commit(self, cache, monkeypatch):
+        def blocking(*args):
+            raise AssertionError("sync invalidate called on the event loop")
+
+        monkeypatch.setattr(cache, "invalidate", blocking)
+        claims = []
+        allow = cache.breaker.allow
+        monkeypatch.setattr(cache.breaker, "allow", lambda: claims.append(1) or allow())
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        factory = async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+
+        async with factory() as db:
+            product = ProductModel(name="Laptop", price=999.99, stock=10)
+            db.add(product)
+            await db.commit()
+            item_key = cache_product(cache, product.id_key)
+
+            product.active = False
+            claims.clear()
+            await db.commit()
+            await cache_invalidation.settle(db)
+            assert len(claims) == 1
+
+        assert cache.get(item_key) is None
+        assert cache_invalidation._tasks == set()
+        await engine.dispose()
@@ -0,0 +1,471 @@
+"""Unit tests for CacheService using in-memory Redis fakes."""
+import asyncio
+import json
+import random
+import time
+
+import pytest
+
+from services.cache_codecs import CacheCodec
+from services.cache_invalidation_bus import CacheInvalidationBus
+from services.cache_service import SWR_MARKER, CacheService, should_refresh
+from services.local_cache import LocalCache
+from tests.conftest import use_fake_redis
+
+
+class TestSyncCache:
+    """Tests for the blocking CacheService API."""
+
+    def test_set_and_get_roundtrip(self, fake_cache):
+        fake_cache.set("products:id:1", {"name": "Laptop"})
+
+        assert fake_cache.get("products:id:1") == {"name": "Laptop"}
+
+    def test_delete_pattern(self, fake_cache):
+        fake_cache.set("products:list:a", [1])
+        fake_cache.set("products:list:b", [2])
+        fake_cache.set("categories:list:a", [3])
+
+        assert fake_cache.delete_pattern("products:list:*") == 2
+        assert fake_cache.get("categories:list:a") == [3]
+
+    def test_get_or_set_computes_once(self, fake_cache):
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return {"value": 1}
+
+        assert fake_cache.get_or_set("k", compute) == {"value": 1}
+        assert fake_cache.get_or_set("k", compute) == {"value": 1}
+        assert len(calls) == 1
+
+
+class TestAsyncCache:
+    """Tests for the redis.asyncio CacheService API."""
+
+    async def test_aset_and_aget_roundtrip(self, fake_cache):
+        await fake_cache.aset("categories:list", [{"name": "Books"}])
+
+        assert await fake_cache.aget("categories:list") == [{"name": "Books"}]
+        # Both APIs share the same keyspace
+        assert fake_cache.get("categories:list") == [{"name": "Books"}]
+
+    async def test_adelete_pattern(self, fake_cache):
+        await fake_cache.aset("products:filter:a", [1])
+        await fake_cache.aset("products:filter:b", [2])
+
+        assert await fake_cache.adelete_pattern("products:filter:*") == 2
+        assert await fake_cache.aget("products:filter:a") is None
+
+    async def test_aget_or_set_accepts_coroutine_callback(self, fake_cache):
+        async def compute():
+            return {"value": 2}
+
+        assert await fake_cache.aget_or_set("k", compute) == {"value": 2}
+        assert await fake_cache.aget("k") == {"value": 2}
+
+    async def test_aget_or_set_waits_without_blocking_loop(self, fake_cache, fake_redis):
+        # Another worker holds the lock and fills the cache shortly after,
+        # without a release notification (e.g. an older deployment)
+        fake_cache.LOCK_WAIT_SLICE = 0.02
+        fake_redis.set("lock:k", "1", nx=True, ex=10)
+        ticks = []
+
+        async def other_worker():
+            for _ in range(3):
+                ticks.append(1)
+                await asyncio.sleep(0.01)
+            fake_redis.set("k", '"filled"')
+
+        result, _ = await asyncio.gather(
+            fake_cache.aget_or_set("k", lambda: "recomputed"),
+            other_worker()
+        )
+
+        assert result == "filled"
+        assert len(ticks) == 3
+
+    async def test_unavailable_cache_computes_directly(self, fake_cache):
+        fake_cache.async_redis_client = None
+
+        assert await fake_cache.aget("k") is None
+        assert await fake_cache.aget_or_set("k", lambda: 5) == 5
+
+
+@pytest.fixture
+def tiered_cache(fake_redis):
+    service = CacheService(
+        l1_enabled=True,
+        l1_max_entries=2,
+        l1_policies={"categories": 300, "products:id": 30}
+    )
+    return use_fake_redis(service, fake_redis)
+
+
+class TestLocalCacheTier:
+    """Tests for the in-process L1 tier in front of Redis."""
+
+    def test_l1_hit_skips_redis(self, tiered_cache, fake_redis):
+        tiered_cache.set("categories:list", [{"name": "Books"}])
+        fake_redis.data.clear()
+
+        assert tiered_cache.get("categories:list") == [{"name": "Books"}]
+        assert tiered_cache.stats()["l1"]["hits"] == 1
+
+    def test_prefix_without_policy_bypasses_l1(self, tiered_cache, fake_redis):
+        tiered_cache.set("products:list:a", [1])
+        fake_redis.data.clear()
+
+        assert tiered_cache.get("products:list:a") is None
+        assert tiered_cache.stats()["l2"]["misses"] == 1
+
+    def test_redis_hit_populates_l1(self, tiered_cache, fake_redis):
+        fake_redis.set("products:id:id:1", '{"name": "Laptop"}')
+
+        assert tiered_cache.get("products:id:id:1") == {"name": "Laptop"}
+        fake_redis.data.clear()
+        assert tiered_cache.get("products:id:id:1") == {"name": "Laptop"}
+
+        stats = tiered_cache.stats()
+        assert stats["l2"]["hits"] == 1
+        assert stats["l1"]["hits"] == 1
+
+    def test_delete_pattern_clears_both_tiers(self, tiered_cache):
+        tiered_cache.set("categories:id:1", {"name": "Books"})
+
+        tiered_cache.delete_pattern("categories:*")
+
+        assert tiered_cache.get("categories:id:1") is None
+
+    def test_lru_eviction_and_ttl(self, tiered_cache, monkeypatch):
+        local = tiered_cache.local_cache
+        local.set("a", 1, ttl=30)
+        local.set("b", 2, ttl=30)
+        local.get("a")
+        local.set("c", 3, ttl=30)
+
+        assert local.get("b") is None
+        assert local.get("a") == 1
+        assert local.stats()["evictions"] == 1
+
+        now = time.monotonic()
+        monkeypatch.setattr("services.local_cache.time.monotonic", lambda: now + 31)
+        assert local.get("a") is None
+
+    async def test_async_api_shares_l1(self, tiered_cache, fake_redis):
+        await tiered_cache.aset("categories:list", [{"name": "Books"}])
+        fake_redis.data.clear()
+
+        assert await tiered_cache.aget("categories:list") == [{"name": "Books"}]
+        await tiered_cache.adelete("categories:list")
+        assert await tiered_cache.aget("categories:list") is None
+
+
+class TestCacheInvalidationBus:
+    """Tests for cross-worker L1 invalidation messages."""
+
+    @staticmethod
+    def _worker(fake_redis):
+        local = LocalCache()
+        return local, CacheInvalidationBus(local, lambda: fake_redis)
+
+    def test_deletes_are_published(self, tiered_cache, fake_redis):
+        tiered_cache.delete("categories:id:1")
+        tiered_cache.delete_pattern("categories:*")
+
+        ops = [json.loads(message)["op"] for _, message in fake_redis.published]
+        seqs = [json.loads(message)["seq"] for _, message in fake_redis.published]
+        assert ops == ["key", "pattern"]
+        assert seqs == [1, 2]
+
+    def test_remote_messages_evict_local_entries(self, fake_redis):
+        _, publisher = self._worker(fake_redis)
+        local, subscriber = self._worker(fake_redis)
+        local.set("products:id:id:1", {"name": "Laptop"}, ttl=30)
+        local.set("products:list:a", [1], ttl=30)
+        local.set("categories:list", [2], ttl=30)
+
+        subscriber.handle_message(publisher.build_message("key", "products:id:id:1"))
+        subscriber.handle_message(publisher.build_message("pattern", "products:*"))
+
+        assert local.get("products:id:id:1") is None
+        assert local.get("products:list:a") is None
+        assert local.get("categories:list") == [2]
+
+    def test_own_messages_are_ignored(self, fake_redis):
+        local, bus = self._worker(fake_redis)
+        local.set("categories:list", [1], ttl=30)
+
+        bus.handle_message(bus.build_message("flush"))
+
+        assert local.get("categories:list") == [1]
+
+    def test_sequence_gap_flushes_local_cache(self, fake_redis):
+        _, publisher = self._worker(fake_redis)
+        local, subscriber = self._worker(fake_redis)
+
+        subscriber.handle_message(publisher.build_message("key", "a"))
+        local.set("categories:list", [1], ttl=30)
+        publisher.build_message("key", "lost")  # never delivered
+        subscriber.handle_message(publisher.build_message("key", "b"))
+        assert local.get("categories:list") == [1]  # may still arrive
+
+        subscriber.expire_gaps(time.monotonic() + subscriber.reorder_window)
+
+        assert local.get("categories:list") is None
+        assert subscriber.stats()["gap_flushes"] == 1
+
+    def test_reordered_messages_do_not_flush(self, fake_redis):
+        _, publisher = self._worker(fake_redis)
+        local, subscriber = self._worker(fake_redis)
+        first, second, third = (publisher.build_message("key", key) for key in ("a", "b", "c"))
+        local.set("b", 1, ttl=30)
+        local.set("categories:list", [1], ttl=30)
+
+        for message in (first, third, second):
+            subscriber.handle_message(message)
+        subscriber.expire_gaps(time.monotonic() + subscriber.reorder_window)
+
+        assert local.get("b") is None
+        assert local.get("categories:list") == [1]
+        assert subscriber.stats()["gap_flushes"] == 0
+
+    def test_failed_publish_gives_its_seq_back(self, fake_redis, monkeypatch):
+        _, publisher = self._worker(fake_redis)
+
+        def down(channel, message):
+            raise ConnectionError("redis down")
+
+        monkeypatch.setattr(fake_redis, "publish", down)
+        assert publisher.publish("key", "a") is False
+        monkeypatch.undo()
+
+        assert json.loads(publisher.build_message("key", "b"))["seq"] == 1
+
+
+class TestNamespaceGenerations:
+    """Tests for generation-based invalidation of versioned namespaces."""
+
+    def test_generation_is_embedded_in_redis_key(self, fake_cache, fake_redis):
+        fake_cache.set("products:list:skip:0", [1])
+
+        assert "products:list:g0:skip:0" in fake_redis.data
+
+    def test_invalidate_namespace_is_single_incr(self, fake_cache, fake_redis):
+        fake_cache.set("products:list:skip:0", [1])
+        fake_cache.set("products:id:id:1", {"name": "Laptop"})
+
+        assert fake_cache.invalidate_namespace("products:list") == 1
+
+        assert fake_cache.get("products:list:skip:0") is None
+        assert fake_cache.get("products:id:id:1") == {"name": "Laptop"}
+        # Old generation is left to expire instead of being deleted
+        assert "products:list:g0:skip:0" in fake_redis.data
+
+        fake_cache.set("products:list:skip:0", [2])
+        assert fake_cache.get("products:list:skip:0") == [2]
+
+    def test_longest_namespace_wins(self, fake_cache):
+        fake_cache.versioned_namespaces = ("products", "products:filter")
+
+        assert fake_cache._namespace_of("products:filter:search:x") == "products:filter"
+        assert fake_cache._namespace_of("products:id:id:1") == "products"
+        assert fake_cache._namespace_of("productsx:id") is None
+
+    async def test_async_invalidation_shares_generation(self, fake_cache):
+        await fake_cache.aset("categories:list:skip:0", [{"name": "Books"}])
+
+        await fake_cache.ainvalidate_namespace("categories")
+
+        assert await fake_cache.aget("categories:list:skip:0") is None
+        assert fake_cache._redis_key("categories:list:skip:0") == "categories:g1:list:skip:0"
+
+    def test_invalidation_evicts_l1(self, tiered_cache):
+        tiered_cache.set("categories:list", [1])
+
+        tiered_cache.invalidate_namespace("categories")
+
+        assert tiered_cache.get("categories:list") is None
+
+
+class TestCacheCodecs:
+    """Tests for binary cache codecs."""
+
+    PRODUCTS = [
+        {"id_key": i, "name": f"Product {i}", "price": 10.5, "reviews": [{"rating": 5, "comment": "ok"}]}
+        for i in range(50)
+    ]
+
+    @pytest.mark.parametrize("spec", ["json", "orjson", "msgpack", "orjson+zlib", "msgpack+lz4"])
+    def test_roundtrip(self, spec):
+        codec = CacheCodec(spec, compression_threshold=64)
+
+        assert CacheCodec.decode(codec.encode(self.PRODUCTS)) == self.PRODUCTS
+
+    def test_compression_only_above_threshold(self):
+        codec = CacheCodec("orjson+zlib", compression_threshold=10_000)
+
+        assert codec.encode([1, 2, 3]) == b"\x00\x20[1,2,3]"
+        assert len(codec.encode(self.PRODUCTS * 10)) < len(CacheCodec("orjson").encode(self.PRODUCTS * 10))
+
+    def test_legacy_text_values_still_decode(self):
+        assert CacheCodec.decode('{"name": "Laptop"}') == {"name": "Laptop"}
+        assert CacheCodec.decode(b"plain") == "plain"
+
+    def test_unknown_spec_rejected(self):
+        with pytest.raises(ValueError):
+            CacheCodec("pickle")
+
+    def test_prefix_policy_selects_codec(self, fake_cache, fake_redis):
+        fake_cache.codecs = {"products:list": CacheCodec("msgpack+zlib", compression_threshold=0)}
+        fake_cache.versioned_namespaces = ()
+
+        fake_cache.set("products:list:skip:0", self.PRODUCTS)
+        fake_cache.set("products:id:id:1", {"name": "Laptop"})
+
+        assert fake_redis.data["products:list:skip:0"].startswith(b"\x00")
+        assert fake_redis.data["products:id:id:1"] == '{"name": "Laptop"}'
+        assert fake_cache.get("products:list:skip:0") == self.PRODUCTS
+
+    async def test_async_codec_roundtrip(self, fake_cache):
+        fake_cache.codecs = {"products:filter": CacheCodec("orjson+lz4", compression_threshold=0)}
+
+        await fake_cache.aset("products:filter:x", self.PRODUCTS)
+
+        assert await fake_cache.aget("products:filter:x") == self.PRODUCTS
+
+
+class TestBatchCache:
+    """Tests for get_many / set_many / delete_many."""
+
+    def test_set_many_and_get_many_single_round_trips(self, fake_cache, fake_redis):
+        fake_cache.set_many({"products:id:id:1": {"name": "Laptop"}, "products:id:id:2": {"name": "Mouse"}})
+        assert fake_redis.round_trips == 1
+
+        fake_redis.round_trips = 0
+        values = fake_cache.get_many(["products:id:id:1", "products:id:id:2", "products:id:id:3"])
+
+        assert values == {"products:id:id:1": {"name": "Laptop"}, "products:id:id:2": {"name": "Mouse"}}
+        assert fake_redis.round_trips == 1
+
+    def test_versioned_and_codec_keys(self, fake_cache, fake_redis):
+        fake_cache.codecs = {"products:list": CacheCodec("orjson")}
+        fake_cache.invalidate_namespace("products:list")
+        mapping = {"products:list:a": [1], "categories:list": [2], "products:id:id:1": {"n": 1}}
+
+        fake_cache.set_many(mapping)
+
+        assert "products:list:g1:a" in fake_redis.data
+        assert fake_cache.get_many(list(mapping)) == mapping
+
+    def test_delete_many(self, fake_cache):
+        fake_cache.set_many({"products:id:id:1": 1, "products:id:id:2": 2})
+
+        assert fake_cache.delete_many(["products:id:id:1", "products:id:id:2"]) == 2
+        assert fake_cache.get_many(["products:id:id:1"]) == {}
+
+    async def test_async_batch(self, fake_cache):
+        await fake_cache.aset_many({"products:id:id:1": {"name": "Laptop"}})
+
+        assert await fake_cache.aget_many(["products:id:id:1", "products:id:id:9"]) == {
+            "products:id:id:1": {"name": "Laptop"}
+        }
+        assert await fake_cache.adelete_many(["products:id:id:1"]) == 1
+
+
+class TestStaleWhileRevalidate:
+    """Tests for get_or_set(stale_ttl=...)."""
+
+    STALE = {SWR_MARKER: 0, "value": "old"}
+
+    def test_fresh_entry_stored_with_soft_expiry(self, fake_cache, fake_redis):
+        assert fake_cache.get_or_set("k", lambda: "new", ttl=60, stale_ttl=600) == "new"
+
+        entry = fake_cache.get("k")
+        assert entry["value"] == "new"
+        assert entry[SWR_MARKER] > time.time()
+        assert fake_redis.expires_at["k"] - time.monotonic() > 600
+
+    def test_stale_entry_served_while_single_refresh_runs(self, fake_cache):
+        fake_cache.set("k", self.STALE, 600)
+        refreshes = []
+
+        def refresh():
+            refreshes.append(1)
+            return "new"
+
+        def callback():
+            raise AssertionError("request path must not recompute a stale entry")
+
+        assert fake_cache.get_or_set("k", callback, ttl=60, stale_ttl=600, refresh_callback=refresh) == "old"
+        fake_cache._refresh_executor.shutdown(wait=True)
+
+        assert refreshes == [1]
+        assert fake_cache.get_or_set("k", callback, ttl=60, stale_ttl=600) == "new"
+
+    def test_stale_entry_not_refreshed_when_lock_held(self, fake_cache, fake_redis):
+        fake_cache.set("k", self.STALE, 600)
+        fake_redis.set("lock:k", "1", nx=True, ex=10)
+
+        assert fake_cache.get_or_set("k", lambda: "new", stale_ttl=600) == "old"
+        assert fake_cache._refresh_executor is None
+
+    async def test_async_stale_refresh(self, fake_cache):
+        await fake_cache.aset("k", self.STALE, 600)
+
+        async def refresh():
+            return "new"
+
+        assert await fake_cache.aget_or_set("k", refresh, ttl=60, stale_ttl=600) == "old"
+        await asyncio.gather(*fake_cache._refresh_tasks)
+
+        assert await fake_cache.aget_or_set("k", refresh, ttl=60, stale_ttl=600) == "new"
+        assert await fake_cache.aget("lock:k") is None
+
+
+class TestEarlyRecompute:
+    """Tests for XFetch probabilistic early recomputation (get_or_set(beta=...))."""
+
+    def test_should_refresh_probability_rises_towards_expiry(self):
+        random.seed(7)
+        near = sum(should_refresh(100.0, 1.0, beta=1.0, now=99.5) for _ in range(1000))
+        far = sum(should_refresh(100.0, 1.0, beta=1.0, now=95.0) for _ in range(1000))
+
+        assert far < near < 1000
+        assert should_refresh(100.0, 1.0, now=100.0)
+        assert not should_refresh(100.0, 1.0, now=99.9)
+
+    def test_compute_time_stored_with_value(self, fake_cache):
+        fake_cache.get_or_set("k", lambda: "v", ttl=60, beta=1.0)
+
+        entry = fake_cache.get("k")
+        assert entry["value"] == "v"
+        assert entry["delta"] >= 0
+
+    def test_hit_recomputes_early(self, fake_cache, monkeypatch):
+        fake_cache.get_or_set("k", lambda: "old", ttl=60, beta=1.0)
+        fake_cache.set("k", {**fake_cache.get("k"), "delta": 10.0}, 60)
+
+        # rand -> 1 makes -ln(1 - rand) large: this hit recomputes ahead of expiry
+        monkeypatch.setattr(random, "random", lambda: 0.999999)
+
+        assert fake_cache.get_or_set("k", lambda: "new", ttl=60, beta=1.0) == "new"
+        assert fake_cache.get("k")["value"] == "new"
+        assert fake_cache.get("lock:k") is None
+
+    def test_hit_skips_early_recompute_when_lock_held(self, fake_cache, fake_redis, monkeypatch):
+        fake_cache.set("k", {SWR_MARKER: time.time() + 60, "delta": 10.0, "value": "old"}, 60)
+        fake_redis.set("lock:k", "1", nx=True, ex=10)
+        monkeypatch.setattr(random, "random", lambda: 0.999999)
+
+        assert fake_cache.get_or_set("k", lambda: "new", ttl=60, beta=1.0) == "old"
+
+    async def test_async_early_recompute(self, fake_cache, monkeypatch):
+        await fake_cache.aset("k", {SWR_MARKER: time.time() + 60, "delta": 10.0, "value": "old"}, 60)
+        monkeypatch.setattr(random, "random", lambda: 0.999999)
+
+        async def compute():
+            return "new"
+
+        assert await fake_cache.aget_or_set("k", compute, ttl=60, beta=1.0) == "new"
@@ -0,0 +1,109 @@
+"""Tests for the hot-key CacheWarmer."""
+import time
+from concurrent.futures import wait
+
+import pytest
+
+from config.constants import PaginationConfig
+from services.cache_warmer import HOT_TARGETS_KEY, CacheWarmer
+
+
+class FakeSession:
+    closed = False
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def warmer(fake_cache):
+    warmer = CacheWarmer(
+        cache=fake_cache,
+        targets=(("categories:list", {"skip": 0, "limit": 100}),),
+        concurrency=2,
+        debounce_seconds=0.02,
+        learned_targets=5,
+        session_factory=FakeSession
+    )
+    warmer.loads = []
+    warmer.register_loader("categories:list", lambda db, params: warmer.loads.append(("categories:list", params)))
+    warmer.register_loader("products:list", lambda db, params: warmer.loads.append(("products:list", params)))
+    yield warmer
+    warmer.stop()
+
+
+class TestCacheWarmer:
+    """Tests for CacheWarmer."""
+
+    def test_hot_targets_merge_configured_and_learned(self, warmer, fake_redis):
+        for _ in range(3):
+            warmer.record("products:list", skip=0, limit=20, include_inactive=False)
+        warmer.record("categories:list", skip=0, limit=100)
+        warmer.record("unknown:list", skip=0)
+
+        targets = warmer.hot_targets()
+
+        assert ("categories:list", {"skip": 0, "limit": 100}) in targets
+        assert ("products:list", {"skip": 0, "limit": 20, "include_inactive": False}) in targets
+        assert len(targets) == 2
+        # Counts are shared with the other workers through Redis
+        assert max(fake_redis.data[HOT_TARGETS_KEY].values()) == 3
+
+    def test_hot_targets_filtered_by_namespace(self, warmer):
+        warmer.record("products:list", skip=0, limit=20, include_inactive=False)
+
+        assert warmer.hot_targets("products") == [
+            ("products:list", {"skip": 0, "limit": 20, "include_inactive": False})
+        ]
+
+    def test_start_warms_every_target(self, warmer):
+        warmer.start()
+        wait(warmer.warm())
+
+        assert ("categories:list", {"skip": 0, "limit": 100}) in warmer.loads
+        assert warmer.stats()["errors"] == 0
+
+    def test_invalidations_coalesced_into_one_warm_pass(self, warmer, fake_cache):
+        warmer.start()
+        time.sleep(0.05)
+        warmer.loads.clear()
+
+        for _ in range(5):
+            fake_cache.invalidate_namespace("categories")
+        time.sleep(0.1)
+        warmer._get_executor().shutdown(wait=True)
+
+        assert warmer.loads == [("categories:list", {"skip": 0, "limit": 100})]
+
+    def test_loads_during_warming_are_not_recorded(self, warmer, fake_redis):
+        warmer.register_loader(
+            "products:list",
+            lambda db, params: warmer.record("products:list", **params)
+        )
+
+        assert warmer.warm_target("products:list", {"skip": 0})
+        assert warmer._counts == {}
+
+    def test_counts_and_hot_set_are_bounded(self, warmer, fake_redis):
+        warmer.max_counted = 4
+        warmer.hot_set_size = 5
+        for skip in range(10):
+            warmer.record("products:list", skip=skip, limit=20)
+        assert len(warmer._counts) <= warmer.max_counted
+
+        for limit in range(10):
+            warmer.record("products:list", skip=0, limit=limit)
+            warmer.hot_targets()
+
+        assert len(fake_redis.data[HOT_TARGETS_KEY]) == warmer.hot_set_size
+        assert HOT_TARGETS_KEY in fake_redis.expires_at
+
+    def test_only_canonical_first_pages_recorded(self, warmer):
+        limit = PaginationConfig.DEFAULT_LIMIT
+        warmer.record_page("categories:list", 20, limit)
+        warmer.record_page("categories:list", 0, 7)
+        warmer.record_page("categories:list", 0, limit, cursor="abc")
+        assert warmer._counts == {}
+
+        warmer.record_page("categories:list", 0, limit)
+        assert len(warmer._counts) == 1
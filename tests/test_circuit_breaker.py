@@ -0,0 +1,191 @@
+"""Tests for the Redis circuit breaker and its fast-fail paths."""
+from unittest.mock import MagicMock, patch
+
+import pytest
+import redis
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from middleware.rate_limiter import RateLimiterMiddleware
+from services.cache_service import CacheService
+from tests.conftest import FakeRedis
+from utils.circuit_breaker import CircuitBreaker
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_breaker(clock=None, **kwargs):
+    options = dict(
+        window_size=10, min_calls=4, failure_rate=0.5, slow_call_seconds=0.1,
+        slow_call_rate=0.5, open_seconds=5.0, half_open_probes=2,
+        failure_exceptions=(redis.RedisError, OSError),
+    )
+    options.update(kwargs)
+    return CircuitBreaker("redis", clock=clock or FakeClock(), **options)
+
+
+class TestCircuitBreaker:
+    """State machine of CircuitBreaker."""
+
+    def test_opens_on_failure_rate(self):
+        breaker = make_breaker()
+        breaker.record_success(0.01)
+        breaker.record_failure()
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.CLOSED  # below min_calls
+
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+        assert not breaker.allow()
+        assert breaker.stats()["rejected"] == 1
+
+    def test_opens_on_slow_calls(self):
+        breaker = make_breaker()
+        for elapsed in (0.5, 0.01, 0.5, 0.01):
+            breaker.record_success(elapsed)
+
+        assert breaker.state == CircuitBreaker.OPEN
+
+    def test_half_open_probes_close_or_reopen(self):
+        clock = FakeClock()
+        breaker = make_breaker(clock)
+        for _ in range(4):
+            breaker.record_failure()
+        clock.now = 5.0
+
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        assert breaker.allow() and breaker.allow()
+        assert not breaker.allow()  # only half_open_probes calls go through
+
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+
+        clock.now = 10.0
+        assert breaker.allow() and breaker.allow()
+        breaker.record_success(0.01)
+        breaker.record_success(0.01)
+        assert breaker.state == CircuitBreaker.CLOSED
+        assert breaker.times_opened == 2
+
+    def test_unreported_probes_are_rearmed(self):
+        clock = FakeClock()
+        breaker = make_breaker(clock)
+        for _ in range(4):
+            breaker.record_failure()
+        clock.now = 5.0
+        assert breaker.allow() and breaker.allow()
+        assert not breaker.allow()
+
+        clock.now = 10.0
+        assert breaker.allow()
+
+    def test_track_records_only_failure_exceptions(self):
+        breaker = make_breaker(min_calls=1)
+
+        with pytest.raises(ValueError):
+            with breaker.track():
+                raise ValueError("not a Redis problem")
+        assert breaker.state == CircuitBreaker.CLOSED
+
+        with pytest.raises(redis.ConnectionError):
+            with breaker.track():
+                raise redis.ConnectionError("down")
+        assert breaker.state == CircuitBreaker.OPEN
+
+    def test_disabled_breaker_always_allows(self):
+        breaker = make_breaker(enabled=False)
+        for _ in range(10):
+            breaker.record_failure()
+
+        assert breaker.allow()
+        assert not breaker.is_open()
+
+
+class FailingRedis(FakeRedis):
+    """FakeRedis whose reads fail like a Redis brownout."""
+
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    def get(self, key):
+        self.calls += 1
+        raise redis.TimeoutError("Timeout reading from socket")
+
+    def register_script(self, script):
+        self.calls += 1
+        return super().register_script(script)
+
+
+class TestFastFail:
+    """CacheService and rate limiting skip Redis while the circuit is open."""
+
+    def test_get_or_set_goes_to_db_once_open(self):
+        fake_redis = FailingRedis()
+        cache = CacheService()
+        cache.enabled = True
+        cache.redis_client = cache.binary_redis_client = fake_redis
+        cache.breaker = make_breaker(min_calls=2)
+
+        assert cache.get_or_set("products:list", lambda: "from db") == "from db"
+        assert cache.get_or_set("products:list", lambda: "from db") == "from db"
+        assert cache.breaker.is_open()
+
+        calls = fake_redis.calls
+        assert cache.get_or_set("products:list", lambda: "from db") == "from db"
+        assert cache.get("products:list") is None
+        assert fake_redis.calls == calls
+
+    def test_get_or_set_claims_one_half_open_probe(self):
+        clock = FakeClock()
+        cache = CacheService()
+        cache.enabled = True
+        cache.redis_client = cache.binary_redis_client = FakeRedis()
+        cache.breaker = make_breaker(clock, min_calls=1)
+        cache.breaker.record_failure()
+        clock.now += 5.0
+
+        # Miss: GET, lock, re-read, SET and release all ride on one probe
+        assert cache.get_or_set("products:list", lambda: "from db") == "from db"
+        assert cache.breaker.state == CircuitBreaker.HALF_OPEN
+        assert cache.breaker._probes_admitted == 1
+
+        assert cache.get_or_set("products:list", lambda: "from db") == "from db"
+        assert cache.breaker.state == CircuitBreaker.CLOSED
+
+    def test_lock_helpers_refused_once_open(self):
+        fake_redis = FailingRedis()
+        cache = CacheService()
+        cache.enabled = True
+        cache.redis_client = cache.binary_redis_client = fake_redis
+        cache.breaker = make_breaker(min_calls=1)
+        cache.breaker.record_failure()
+
+        assert cache._try_lock("products:list", cache._lock_for("products:list")) is None
+        assert cache._acquire_refresh_lock("products:list") is None
+        assert fake_redis.calls == 0
+
+    def test_rate_limiter_fails_open_without_redis_call(self):
+        app = FastAPI()
+
+        @app.get("/test")
+        async def test_endpoint():
+            return {"message": "success"}
+
+        breaker = make_breaker(min_calls=1)
+        breaker.record_failure()
+        redis_client = MagicMock()
+        with patch("middleware.rate_limiter.get_async_redis_client", return_value=redis_client), \
+                patch("middleware.rate_limiter.redis_breaker", breaker):
+            app.add_middleware(RateLimiterMiddleware, calls=1, period=60)
+            client = TestClient(app)
+            responses = [client.get("/test") for _ in range(3)]
+
+        assert [response.status_code for response in responses] == [200, 200, 200]
+        redis_client.pipeline.assert_not_called()
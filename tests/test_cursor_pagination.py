@@ -0,0 +1,117 @@
+"""Tests for keyset (cursor) pagination."""
+import pytest
+from pydantic import TypeAdapter
+
+from controllers.response_cache import ResponseCache
+from models.product import ProductModel
+from repositories.product_repository import ProductRepository, product_sort_key
+from utils.cursor_pagination import (
+    ID_ASC, NEXT_CURSOR_HEADER, InvalidCursorError, decode_cursor, encode_cursor, next_cursor
+)
+
+PRICES = [10.0, 5.0, 10.0, 7.5, 5.0, 10.0, 1.0]
+
+
+@pytest.fixture
+def catalog(db_session):
+    db_session.add_all(
+        ProductModel(name=f"Product {index % 3}", price=price, stock=1)
+        for index, price in enumerate(PRICES)
+    )
+    db_session.commit()
+
+
+def walk(repository, sort_by, limit):
+    """Every page of filter_products following the cursors"""
+    pages, cursor = [], None
+    while True:
+        page = repository.filter_products(sort_by=sort_by, limit=limit, cursor=cursor)
+        pages.append(page)
+        cursor = next_cursor(page, product_sort_key(sort_by), limit)
+        if cursor is None:
+            return pages
+
+
+class TestCursorTokens:
+    """Encoding and validation of cursor tokens."""
+
+    def test_round_trip(self):
+        key = product_sort_key("price_asc")
+        assert decode_cursor(encode_cursor(key, [9.99, 42]), key) == [9.99, 42]
+
+    def test_cursor_of_another_sort_is_rejected(self):
+        token = encode_cursor(product_sort_key("price_asc"), [9.99, 42])
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(token, product_sort_key("name"))
+
+    def test_garbage_is_rejected(self):
+        with pytest.raises(InvalidCursorError):
+            decode_cursor("not-a-cursor", ID_ASC)
+
+    def test_no_cursor_after_last_page(self):
+        assert next_cursor([], ID_ASC, 10) is None
+        assert next_cursor([object()], ID_ASC, 10) is None
+
+
+@pytest.mark.usefixtures("catalog")
+class TestKeysetPages:
+    """Cursor pages cover the same rows as one big page, without gaps or repeats."""
+
+    @pytest.mark.parametrize("sort_by", [None, "price_asc", "price_desc", "name"])
+    def test_pages_match_full_listing(self, db_session, sort_by):
+        repository = ProductRepository(db_session)
+        expected = [product.id_key for product in repository.filter_products(sort_by=sort_by, limit=100)]
+
+        pages = walk(repository, sort_by, limit=2)
+
+        assert [product.id_key for page in pages for product in page] == expected
+        assert all(len(page) <= 2 for page in pages)
+
+    def test_price_ties_broken_by_id(self, db_session):
+        products = ProductRepository(db_session).filter_products(sort_by="price_asc", limit=100)
+        keys = [(product.price, product.id_key) for product in products]
+        assert keys == sorted(keys)
+
+    def test_find_all_cursor(self, db_session):
+        repository = ProductRepository(db_session)
+        first = repository.find_all(limit=3)
+        second = repository.find_all(limit=3, cursor=next_cursor(first, ID_ASC, 3))
+
+        assert [p.id_key for p in first + second] == [p.id_key for p in repository.find_all(limit=6)]
+
+
+@pytest.mark.usefixtures("catalog")
+class TestNextCursorHeader:
+    """List endpoints expose the next cursor in X-Next-Cursor."""
+
+    def test_filter_follows_header(self, api_client):
+        seen, cursor = [], None
+        while True:
+            params = {"sort_by": "price_desc", "limit": 3}
+            if cursor:
+                params["cursor"] = cursor
+            response = api_client.get("/products/filter", params=params)
+            assert response.status_code == 200
+            seen.extend(product["id_key"] for product in response.json())
+            cursor = response.headers.get(NEXT_CURSOR_HEADER)
+            if cursor is None:
+                break
+
+        assert sorted(seen) == list(range(1, len(PRICES) + 1))
+        assert len(seen) == len(set(seen))
+
+    def test_invalid_cursor_is_400(self, api_client):
+        response = api_client.get("/products/", params={"cursor": "not-a-cursor"})
+        assert response.status_code == 400
+
+    async def test_response_cache_replays_header(self, fake_cache):
+        response_cache = ResponseCache(fake_cache)
+
+        async def produce():
+            return [1, 2]
+
+        headers = lambda items: {NEXT_CURSOR_HEADER: encode_cursor(ID_ASC, [items[-1]])}
+        await response_cache.get_or_render("products:list", produce, TypeAdapter(list[int]), headers=headers)
+        cached = await response_cache.get("products:list")
+
+        assert decode_cursor(cached.headers[NEXT_CURSOR_HEADER], ID_ASC) == [2]
@@ -0,0 +1,95 @@
+"""Tests for the Postgres NOTIFY -> cache invalidation listener."""
+import json
+
+import pytest
+
+from services.cache_invalidation import cache_invalidation
+from services.db_change_listener import DatabaseChangeListener
+from services.product_service import product_cache_keys
+
+
+@pytest.fixture
+def cache(fake_cache, monkeypatch):
+    monkeypatch.setattr(cache_invalidation, "cache", fake_cache)
+    return fake_cache
+
+
+@pytest.fixture
+def listener(cache):
+    return DatabaseChangeListener(connect=lambda: None, registry=cache_invalidation)
+
+
+def notification(table, op, new=None, old=None):
+    message = {"table": table, "op": op}
+    if new is not None:
+        message["new"] = new
+    if old is not None:
+        message["old"] = old
+    return json.dumps(message)
+
+
+class TestDatabaseChangeListener:
+    """Trigger payloads become cache invalidations."""
+
+    def test_product_update_evicts_item_and_lists(self, listener, cache):
+        item_key = product_cache_keys(7)[0]
+        cache.set(item_key, {"id_key": 7})
+        cache.set("products:list:skip:0", [7])
+
+        row = {"id_key": 7, "category_id": 1}
+        assert listener.handle_payloads([notification("products", "UPDATE", new=row, old=row)])
+
+        assert cache.get(item_key) is None
+        assert cache.get("products:list:skip:0") is None
+
+    def test_review_insert_evicts_its_product(self, listener, cache):
+        item_key = product_cache_keys(3)[0]
+        cache.set(item_key, {"id_key": 3})
+
+        listener.handle_payloads([notification("reviews", "INSERT", new={"id_key": 1, "product_id": 3})])
+
+        assert cache.get(item_key) is None
+
+    def test_batch_is_one_round_trip(self, listener, cache, fake_redis):
+        payloads = [
+            notification("products", "INSERT", new={"id_key": product_id, "category_id": 1})
+            for product_id in range(1, 101)
+        ]
+        round_trips = fake_redis.round_trips
+
+        listener.handle_payloads(payloads)
+
+        assert fake_redis.round_trips == round_trips + 1
+        assert listener.stats()["received"] == 100
+        assert listener.stats()["applied"] == 1
+
+    def test_truncate_invalidates_namespaces(self, listener, cache):
+        cache.set("categories:list:skip:0", [1])
+
+        assert listener.handle_payloads([notification("categories", "TRUNCATE")])
+
+        assert cache.get("categories:list:skip:0") is None
+
+    def test_malformed_payloads_are_ignored(self, listener, fake_redis):
+        round_trips = fake_redis.round_trips
+
+        assert not listener.handle_payloads(["not json", json.dumps({"op": "UPDATE"})])
+        assert fake_redis.round_trips == round_trips
+
+    def test_unregistered_table_bumps_only_its_query_version(self, listener, fake_redis, monkeypatch):
+        monkeypatch.setattr(cache_invalidation, "table_versions", True)
+
+        assert listener.handle_payloads([notification("clients", "UPDATE", new={"id_key": 1})])
+        assert fake_redis.get("gen:query:clients") is not None
+        assert fake_redis.get("gen:products:list") is None
+
+    def test_single_leader(self, cache):
+        first = DatabaseChangeListener(connect=lambda: None, registry=cache_invalidation)
+        second = DatabaseChangeListener(connect=lambda: None, registry=cache_invalidation)
+
+        lock = first.try_lead()
+        assert lock is not None
+        assert second.try_lead() is None
+
+        lock.release()
+        assert second.try_lead() is not None
@@ -8,7 +8,7 @@ Tests verify the implementation of:
 - P12: Health check with thresholds
 """
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import AsyncMock, Mock, patch, MagicMock
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine, select
 from sqlalchemy.orm import sessionmaker, Session
@@ -49,20 +49,20 @@ def db_session():
 
 @pytest.fixture
 def mock_redis():
-    """Mock Redis client for rate limiter tests"""
+    """Mock redis.asyncio client for rate limiter tests"""
     redis_mock = Mock()
-    redis_mock.ping.return_value = True
-    redis_mock.set.return_value = True
-    redis_mock.get.return_value = None
-    redis_mock.incr.return_value = 1
-    redis_mock.expire.return_value = True
-    redis_mock.delete.return_value = 1
-
-    # Pipeline mock
+    redis_mock.ping = AsyncMock(return_value=True)
+    redis_mock.set = AsyncMock(return_value=True)
+    redis_mock.get = AsyncMock(return_value=None)
+    redis_mock.incr = AsyncMock(return_value=1)
+    redis_mock.expire = AsyncMock(return_value=True)
+    redis_mock.delete = AsyncMock(return_value=1)
+
+    # Pipeline mock (commands are queued synchronously, execute is awaited)
     pipeline_mock = Mock()
     pipeline_mock.incr.return_value = None
     pipeline_mock.expire.return_value = None
-    pipeline_mock.execute.return_value = [1, 1]  # [incr result, expire result]
+    pipeline_mock.execute = AsyncMock(return_value=[1, 1])  # [incr result, expire result]
     redis_mock.pipeline.return_value = pipeline_mock
 
     return redis_mock
@@ -71,7 +71,7 @@ def mock_redis():
 @pytest.fixture
 def test_app_with_redis(mock_redis):
     """Create test FastAPI app with mocked Redis"""
-    with patch('middleware.rate_limiter.get_redis_client', return_value=mock_redis):
+    with patch('middleware.rate_limiter.get_async_redis_client', return_value=mock_redis):
         app = create_fastapi_app()
         client = TestClient(app)
         yield client, mock_redis
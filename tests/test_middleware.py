@@ -403,3 +403,78 @@ class TestRateLimiterIntegration:
         # 6th request should be blocked
         response = client.get("/endpoint1")
         assert response.status_code == 429
+
+
+class TestPureASGIMiddleware:
+    """Tests for the pure ASGI RequestID and RateLimiter middleware."""
+
+    @staticmethod
+    def _async_redis(counts):
+        """redis.asyncio stand-in whose pipeline INCR returns successive counts."""
+        from unittest.mock import AsyncMock
+
+        client = MagicMock()
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(side_effect=[[count, True] for count in counts])
+        client.pipeline.return_value = pipe
+        client.get = AsyncMock(side_effect=lambda key: str(counts[0]))
+        return client
+
+    def test_request_id_header_and_state(self):
+        """Request ID is propagated from the header and exposed on request.state."""
+        from middleware.request_id_middleware import RequestIDMiddleware
+
+        app = FastAPI()
+
+        @app.get("/test")
+        async def test_endpoint(request: Request):
+            return {"request_id": request.state.request_id}
+
+        app.add_middleware(RequestIDMiddleware)
+        client = TestClient(app)
+
+        response = client.get("/test", headers={"X-Request-ID": "abc-123"})
+        assert response.headers["X-Request-ID"] == "abc-123"
+        assert response.json() == {"request_id": "abc-123"}
+        assert response.headers["X-Response-Time"].endswith("ms")
+
+        generated = client.get("/test")
+        assert generated.json()["request_id"] == generated.headers["X-Request-ID"]
+
+    def test_rate_limiter_headers_and_429(self):
+        """Allowed requests carry X-RateLimit-* headers; over-limit ones get 429."""
+        app = FastAPI()
+
+        @app.get("/test")
+        async def test_endpoint():
+            return {"message": "success"}
+
+        redis_client = self._async_redis([1, 3])
+        with patch("middleware.rate_limiter.get_async_redis_client", return_value=redis_client):
+            app.add_middleware(RateLimiterMiddleware, calls=2, period=60)
+            client = TestClient(app)
+
+            allowed = client.get("/test")
+            blocked = client.get("/test")
+
+        assert allowed.status_code == 200
+        assert allowed.headers["X-RateLimit-Limit"] == "2"
+        assert allowed.headers["X-RateLimit-Remaining"] == "1"
+        assert blocked.status_code == 429
+        assert "rate limit exceeded" in blocked.json()["detail"].lower()
+
+    def test_rate_limiter_skips_health_check(self):
+        """Health check never touches Redis."""
+        app = FastAPI()
+
+        @app.get("/health_check")
+        async def health():
+            return {"status": "healthy"}
+
+        redis_client = self._async_redis([])
+        with patch("middleware.rate_limiter.get_async_redis_client", return_value=redis_client):
+            app.add_middleware(RateLimiterMiddleware, calls=1, period=60)
+            response = TestClient(app).get("/health_check")
+
+        assert response.status_code == 200
+        redis_client.pipeline.assert_not_called()
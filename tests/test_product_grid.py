@@ -0,0 +1,78 @@
+"""Tests for the lean product list (Core column select, /products/grid)."""
+import pytest
+
+from models.category import CategoryModel
+from models.product import ProductModel
+from models.review import ReviewModel
+from repositories.product_repository import ProductRepository
+from schemas.product_schema import ProductListSchema
+from services.product_service import ProductService
+from utils.cursor_pagination import ID_ASC, NEXT_CURSOR_HEADER, next_cursor
+
+LIST_FIELDS = set(ProductListSchema.model_fields)
+
+
+@pytest.fixture
+def catalog(db_session):
+    category = CategoryModel(name="Audio")
+    db_session.add(category)
+    db_session.flush()
+    for index in range(7):
+        product = ProductModel(
+            name=f"Headphones {index}", price=50.0 + index, stock=index,
+            image_url=f"/static/images/{index}.jpg", category_id=category.id_key, active=index != 3
+        )
+        product.reviews = [ReviewModel(rating=5, comment="Great sound quality")]
+        db_session.add(product)
+    db_session.commit()
+    db_session.expunge_all()
+
+
+@pytest.mark.usefixtures("catalog")
+class TestLeanRepository:
+    """find_all_lean returns the same page as find_all, flat and in one query."""
+
+    @pytest.mark.parametrize("include_inactive", [False, True])
+    def test_same_rows_as_full_list(self, db_session, include_inactive):
+        repository = ProductRepository(db_session)
+        full = repository.find_all(limit=4, include_inactive=include_inactive)
+        lean = repository.find_all_lean(limit=4, include_inactive=include_inactive)
+
+        assert [p.model_dump() for p in lean] == [p.model_dump(include=LIST_FIELDS) for p in full]
+
+    def test_cursor_pages(self, db_session):
+        repository = ProductRepository(db_session)
+        first = repository.find_all_lean(limit=3, include_inactive=True)
+        second = repository.find_all_lean(limit=3, include_inactive=True, cursor=next_cursor(first, ID_ASC, 3))
+
+        assert [p.id_key for p in first + second] == list(range(1, 7))
+
+    def test_single_query_without_orm_objects(self, db_session, sql_statements):
+        ProductRepository(db_session).find_all_lean(limit=100)
+
+        assert len(sql_statements) == 1
+        assert "JOIN" not in sql_statements[0] and "reviews" not in sql_statements[0]
+        assert len(db_session.identity_map) == 0
+
+
+@pytest.mark.usefixtures("catalog")
+class TestLeanService:
+
+    def test_lean_pages_are_cached_apart(self, db_session):
+        service = ProductService(db_session)
+        assert service.list_cache_key(0, 10, False) != service.list_cache_key(0, 10, False, lean=True)
+
+    def test_returns_list_schemas(self, db_session):
+        products = ProductService(db_session).get_all(limit=2, lean=True)
+        assert all(isinstance(product, ProductListSchema) for product in products)
+
+
+@pytest.mark.usefixtures("catalog")
+class TestGridEndpoint:
+
+    def test_flat_items_with_cursor(self, api_client):
+        response = api_client.get("/products/grid", params={"limit": 2})
+
+        assert response.status_code == 200
+        assert [set(item) for item in response.json()] == [LIST_FIELDS, LIST_FIELDS]
+        assert NEXT_CURSOR_HEADER in response.headers
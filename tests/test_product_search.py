@@ -0,0 +1,86 @@
+"""Tests for product search (full-text on PostgreSQL, ILIKE fallback elsewhere)."""
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from models.product import ProductModel
+from repositories.product_repository import (
+    RELEVANCE_SORT, ProductRepository, apply_search, order_by_relevance, product_sort_key, search_tsquery
+)
+from utils.cursor_pagination import NEXT_CURSOR_HEADER, InvalidCursorError, apply_page
+
+NAMES = ["Gaming Laptop", "Office Laptop", "Gaming Mouse", "Desk Lamp"]
+
+
+@pytest.fixture
+def catalog(db_session):
+    db_session.add_all(ProductModel(name=name, price=10.0, stock=1) for name in NAMES)
+    db_session.commit()
+
+
+class TestTsquery:
+    """Search terms become a prefix tsquery without user operators."""
+
+    def test_words_are_prefix_matched_and_anded(self):
+        assert search_tsquery("Gaming  Lap") == "gaming:* & lap:*"
+
+    def test_operators_are_dropped(self):
+        assert search_tsquery("lap & !top | (x):*") == "lap:* & top:* & x:*"
+
+    def test_no_words(self):
+        assert search_tsquery("&|!") is None
+
+
+class TestPostgresQuery:
+    """On PostgreSQL the search uses the GIN-indexed vector and ranks matches."""
+
+    def compile(self, search):
+        stmt, rank = apply_search(select(ProductModel), search, "postgresql")
+        stmt = apply_page(order_by_relevance(stmt, rank), ProductModel, RELEVANCE_SORT, None, 0, 10)
+        return str(stmt.compile(dialect=postgresql.dialect()))
+
+    def test_full_text_match_ranked(self):
+        sql = self.compile("gaming")
+        assert "products.search_vector @@ to_tsquery(" in sql
+        assert "ORDER BY ts_rank(products.search_vector" in sql
+        assert "ILIKE" not in sql
+
+    def test_falls_back_to_ilike_without_words(self):
+        assert "ILIKE" in self.compile("&&")
+
+    def test_search_vector_is_not_loaded(self):
+        sql = str(select(ProductModel).compile(dialect=postgresql.dialect()))
+        assert "search_vector" not in sql
+
+
+@pytest.mark.usefixtures("catalog")
+class TestSqliteSearch:
+    """SQLite keeps the substring search."""
+
+    def test_substring_match(self, db_session):
+        products = ProductRepository(db_session).filter_products(search="lapt")
+        assert sorted(product.name for product in products) == ["Gaming Laptop", "Office Laptop"]
+
+    def test_relevance_is_default_sort_for_searches(self):
+        assert product_sort_key(None, "gaming") is RELEVANCE_SORT
+        assert product_sort_key("price_asc", "gaming").name == "price_asc"
+        assert product_sort_key(None).name == "id_desc"
+
+    def test_relevance_pages_have_no_cursor(self, db_session):
+        with pytest.raises(InvalidCursorError):
+            ProductRepository(db_session).filter_products(search="gaming", cursor="eyJzIjoicmVsZXZhbmNlIn0")
+
+
+@pytest.mark.usefixtures("catalog")
+class TestSearchEndpoint:
+
+    def test_relevance_search_is_offset_paged(self, api_client):
+        response = api_client.get("/products/filter", params={"search": "laptop", "limit": 1})
+        assert response.status_code == 200
+        assert len(response.json()) == 1
+        assert NEXT_CURSOR_HEADER not in response.headers
+
+    def test_sorted_search_keeps_cursor(self, api_client):
+        response = api_client.get("/products/filter", params={"search": "laptop", "sort_by": "name", "limit": 1})
+        assert response.status_code == 200
+        assert NEXT_CURSOR_HEADER in response.headers
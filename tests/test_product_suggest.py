@@ -0,0 +1,83 @@
+"""Tests for the product typeahead endpoint (/products/suggest)."""
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from models.product import ProductModel
+from repositories.product_repository import ProductRepository, suggest_statement
+from services.product_service import ProductService
+
+PRODUCTS = [
+    ("Wireless Gaming Mouse", True),
+    ("Gaming Laptop", True),
+    ("Gaming Chair", False),
+    ("100% Cotton Shirt", True),
+    ("Desk Lamp", True),
+]
+
+
+@pytest.fixture
+def catalog(db_session):
+    db_session.add_all(
+        ProductModel(name=name, price=10.0, stock=1, active=active, image_url=f"/static/images/{index}.png")
+        for index, (name, active) in enumerate(PRODUCTS)
+    )
+    db_session.commit()
+
+
+@pytest.mark.usefixtures("catalog")
+class TestSuggestQuery:
+    """The typeahead query selects only the suggestion columns."""
+
+    def test_prefix_matches_first(self, db_session):
+        names = [s.name for s in ProductRepository(db_session).suggest("gaming")]
+        assert names == ["Gaming Laptop", "Wireless Gaming Mouse"]
+
+    def test_inactive_products_are_hidden(self, db_session):
+        assert ProductRepository(db_session).suggest("chair") == []
+
+    def test_like_wildcards_are_literal(self, db_session):
+        assert [s.name for s in ProductRepository(db_session).suggest("100%")] == ["100% Cotton Shirt"]
+        assert ProductRepository(db_session).suggest("_") == []
+
+    def test_postgres_orders_by_similarity(self):
+        sql = str(suggest_statement("gam", 8, "postgresql").compile(dialect=postgresql.dialect()))
+        assert "similarity(products.name" in sql
+        assert "products.category_id" not in sql
+        assert "JOIN" not in sql
+
+
+@pytest.mark.usefixtures("catalog")
+class TestSuggestService:
+    """Suggestions are cached per normalized prefix."""
+
+    def test_cached_per_prefix(self, db_session, fake_cache, monkeypatch):
+        service = ProductService(db_session)
+        service.cache = fake_cache
+        calls = []
+        original = service._repository.suggest
+        monkeypatch.setattr(service._repository, "suggest", lambda *args: calls.append(args) or original(*args))
+
+        first = service.suggest("Gaming", 5)
+        second = service.suggest("  gaming ", 5)
+
+        assert first == second
+        assert calls == [("gaming", 5)]
+
+    def test_short_prefix_skips_the_database(self, db_session, monkeypatch):
+        service = ProductService(db_session)
+        monkeypatch.setattr(service._repository, "suggest", lambda *args: pytest.fail("queried"))
+        assert service.suggest(" g ") == []
+
+
+@pytest.mark.usefixtures("catalog")
+class TestSuggestEndpoint:
+
+    def test_returns_suggestion_fields(self, api_client):
+        response = api_client.get("/products/suggest", params={"q": "lamp"})
+        assert response.status_code == 200
+        assert response.json() == [
+            {"id_key": 5, "name": "Desk Lamp", "price": 10.0, "image_url": "/static/images/4.png"}
+        ]
+
+    def test_limit_is_capped(self, api_client):
+        assert api_client.get("/products/suggest", params={"q": "lamp", "limit": 100}).status_code == 422
@@ -0,0 +1,127 @@
+"""Tests for the repository query cache with per-table versions."""
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from models.base_model import base as Base
+from models.product import ProductModel
+from models.review import ReviewModel
+from repositories.base_repository_impl import AsyncBaseRepositoryImpl
+from repositories.query_cache import query_cache, schema_tables
+from repositories.review_repository import ReviewRepository
+from schemas.product_schema import ProductListSchema, ProductSchema
+from schemas.review_schema import ReviewSchema
+from services.cache_invalidation import cache_invalidation
+
+
+@pytest.fixture
+def cache(fake_cache, monkeypatch):
+    monkeypatch.setattr(cache_invalidation, "cache", fake_cache)
+    monkeypatch.setattr(cache_invalidation, "table_versions", True)
+    monkeypatch.setattr(query_cache, "cache", fake_cache)
+    monkeypatch.setattr(query_cache, "enabled", True)
+    return fake_cache
+
+
+@pytest.fixture
+def catalog(db_session):
+    product = ProductModel(name="Laptop", price=999.99, stock=10)
+    db_session.add(product)
+    db_session.flush()
+    db_session.add(ReviewModel(rating=4.0, comment="Works as expected", product_id=product.id_key))
+    db_session.commit()
+
+
+def selects(statements):
+    return [statement for statement in statements if statement.lstrip().upper().startswith("SELECT")]
+
+
+class TestQueryCache:
+    """find() / find_all() results are cached until a table they read changes."""
+
+    def test_find_all_served_from_cache(self, cache, catalog, db_session, sql_statements):
+        repository = ReviewRepository(db_session)
+
+        first = repository.find_all()
+        executed = len(selects(sql_statements))
+        second = repository.find_all()
+
+        assert second == first
+        assert len(selects(sql_statements)) == executed
+        assert query_cache.stats()["hits"] >= 1
+
+    def test_write_through_repository_bumps_table_version(self, cache, catalog, db_session, sql_statements):
+        repository = ReviewRepository(db_session)
+        review_id = repository.find_all()[0].id_key
+        repository.find(review_id)
+
+        repository.update(review_id, {"rating": 2.0})
+
+        assert repository.find(review_id).rating == 2.0
+        assert repository.find_all()[0].rating == 2.0
+
+    def test_write_outside_repository_bumps_table_version(self, cache, catalog, db_session):
+        repository = ReviewRepository(db_session)
+        review_id = repository.find_all()[0].id_key
+
+        db_session.get(ReviewModel, review_id).rating = 5.0
+        db_session.commit()
+
+        assert repository.find(review_id).rating == 5.0
+
+    def test_uncommitted_changes_bypass_cache(self, cache, catalog, db_session, fake_redis):
+        repository = ReviewRepository(db_session)
+        db_session.add(ReviewModel(rating=1.0, comment="Broke on day one", product_id=1))
+        db_session.flush()
+
+        assert len(repository.find_all()) == 2
+        db_session.rollback()
+
+        assert len(repository.find_all()) == 1
+
+    def test_opt_in_per_repository(self, cache, catalog, db_session, sql_statements):
+        repository = ReviewRepository(db_session)
+        repository.query_cache_ttl = None
+
+        repository.find_all()
+        executed = len(selects(sql_statements))
+        repository.find_all()
+
+        assert len(selects(sql_statements)) > executed
+
+    def test_dependent_tables_follow_schema_relationships(self):
+        assert schema_tables(ProductModel, ProductSchema) >= {"products", "categories", "reviews"}
+        assert schema_tables(ReviewModel, ReviewSchema) == {"reviews"}
+
+    def test_key_depends_on_schema(self, cache):
+        stmt = select(ProductModel)
+
+        list_key, _ = query_cache.lookup(stmt, ProductModel, ProductListSchema)
+        detail_key, _ = query_cache.lookup(stmt, ProductModel, ProductSchema)
+
+        assert list_key.startswith("query:products:ProductListSchema:")
+        assert detail_key.startswith("query:products:ProductSchema:")
+
+    async def test_async_find_cached(self, cache):
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        factory = async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+
+        async with factory() as db:
+            repository = AsyncBaseRepositoryImpl(ReviewModel, ReviewSchema, db)
+            repository.query_cache_ttl = 60
+            product = ProductModel(name="Laptop", price=999.99, stock=10)
+            db.add(product)
+            await db.flush()
+            saved = await repository.save(ReviewModel(rating=3.0, comment="Average laptop", product_id=product.id_key))
+
+            assert (await repository.find(saved.id_key)).rating == 3.0
+            hits = query_cache.hits
+            assert (await repository.find(saved.id_key)).rating == 3.0
+            assert query_cache.hits == hits + 1
+
+            await repository.update(saved.id_key, {"rating": 4.0})
+            assert (await repository.find(saved.id_key)).rating == 4.0
+
+        await engine.dispose()
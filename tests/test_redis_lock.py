@@ -0,0 +1,113 @@
+"""Tests for the owner-token RedisLock and its use in get_or_set."""
+import asyncio
+import threading
+import time
+
+from services.redis_lock import RedisLock
+from tests.conftest import FakeAsyncRedis
+
+
+def make_lock(fake_redis, timeout=10.0):
+    return RedisLock("lock:k", fake_redis, FakeAsyncRedis(fake_redis), timeout)
+
+
+class TestRedisLock:
+    """Tests for RedisLock."""
+
+    def test_acquire_is_exclusive(self, fake_redis):
+        first, second = make_lock(fake_redis), make_lock(fake_redis)
+
+        assert first.acquire()
+        assert not second.acquire()
+        assert first.release()
+        assert second.acquire()
+
+    def test_release_does_not_delete_lock_taken_over(self, fake_redis):
+        slow = make_lock(fake_redis, timeout=0.05)
+        assert slow.acquire()
+        time.sleep(0.06)
+
+        other = make_lock(fake_redis)
+        assert other.acquire()
+
+        assert not slow.release()
+        assert fake_redis.get("lock:k") == other.token
+
+    def test_renewing_keeps_lock_past_timeout(self, fake_redis):
+        lock = make_lock(fake_redis, timeout=0.06)
+        assert lock.acquire()
+
+        with lock.renewing():
+            time.sleep(0.15)
+            assert fake_redis.get("lock:k") == lock.token
+
+        assert lock.release()
+
+    def test_release_wakes_every_waiter(self, fake_redis):
+        holder = make_lock(fake_redis)
+        assert holder.acquire()
+        woken = []
+
+        def wait():
+            woken.append(make_lock(fake_redis).wait_for_release(timeout=2.0))
+
+        waiters = [threading.Thread(target=wait) for _ in range(3)]
+        for thread in waiters:
+            thread.start()
+        time.sleep(0.02)
+        started = time.monotonic()
+        holder.release()
+        for thread in waiters:
+            thread.join()
+
+        assert woken == [True, True, True]
+        assert time.monotonic() - started < 1.0
+
+    async def test_async_lock(self, fake_redis):
+        lock = make_lock(fake_redis, timeout=0.06)
+        assert await lock.aacquire()
+
+        async with lock.arenewing():
+            await asyncio.sleep(0.15)
+        waiter = asyncio.create_task(make_lock(fake_redis).await_for_release(timeout=2.0))
+        await asyncio.sleep(0.01)
+
+        assert await lock.arelease()
+        assert await waiter
+
+
+class TestGetOrSetLocking:
+    """Stampede behaviour of get_or_set with RedisLock."""
+
+    def test_waiters_wake_on_release_without_recomputing(self, fake_cache, fake_redis):
+        cache = fake_cache
+        calls = []
+        results = []
+
+        def compute():
+            calls.append(1)
+            time.sleep(0.3)  # longer than the old 3 x 0.1s polling budget
+            return "value"
+
+        threads = [
+            threading.Thread(target=lambda: results.append(cache.get_or_set("k", compute)))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert calls == [1]
+        assert results == ["value"] * 4
+        assert fake_redis.get("lock:k") is None
+
+    async def test_sync_wait_on_the_event_loop_is_short(self, fake_cache, fake_redis):
+        holder = make_lock(fake_redis)
+        assert holder.acquire()
+
+        started = time.monotonic()
+        assert fake_cache.get_or_set("k", lambda: "value") == "value"
+
+        # Inline services block the loop: no waiting out the 10s lock timeout
+        assert time.monotonic() - started < fake_cache.LOOP_LOCK_WAIT + 0.5
@@ -0,0 +1,121 @@
+"""Tests for the pre-serialized GET response cache."""
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from pydantic import TypeAdapter
+
+from controllers.response_cache import ResponseCache
+from schemas.category_schema import CategoryBaseSchema
+
+
+class TestResponseCache:
+    """Tests for ResponseCache."""
+
+    async def test_get_or_render_serializes_once(self, fake_cache):
+        response_cache = ResponseCache(fake_cache)
+        adapter = TypeAdapter(list[CategoryBaseSchema])
+        calls = []
+
+        async def produce():
+            calls.append(1)
+            return [CategoryBaseSchema(id_key=1, name="Books")]
+
+        first = await response_cache.get_or_render("categories:list:skip:0", produce, adapter)
+        second = await response_cache.get_or_render("categories:list:skip:0", produce, adapter)
+
+        assert len(calls) == 1
+        assert first.body == second.body == b'[{"id_key":1,"name":"Books"}]'
+        assert first.headers["ETag"] == second.headers["ETag"]
+        assert second.media_type == "application/json"
+
+    async def test_namespace_invalidation_drops_response(self, fake_cache):
+        response_cache = ResponseCache(fake_cache)
+        adapter = TypeAdapter(list[int])
+        values = iter([[1], [2]])
+
+        async def produce():
+            return next(values)
+
+        await response_cache.get_or_render("categories:list", produce, adapter)
+        await fake_cache.ainvalidate_namespace("categories")
+        response = await response_cache.get_or_render("categories:list", produce, adapter)
+
+        assert response.body == b"[2]"
+
+    async def test_if_none_match_answered_from_etag_key(self, fake_cache):
+        response_cache = ResponseCache(fake_cache)
+        adapter = TypeAdapter(list[int])
+        first = await response_cache.get_or_render("categories:list", lambda: _value([1]), adapter)
+        etag = first.headers["ETag"]
+        # Only the ETag key is read: the body entry is not needed for a 304
+        await fake_cache.adelete(fake_cache.build_response_key("categories:list"))
+
+        async def produce():
+            raise AssertionError("a 304 must not run the producer")
+
+        response = await response_cache.get_or_render(
+            "categories:list", produce, adapter, if_none_match=f'W/{etag}, "other"'
+        )
+
+        assert response.status_code == 304
+        assert response.body == b""
+        assert response.headers["ETag"] == etag
+        assert response.headers["Cache-Control"] == "public, max-age=0, must-revalidate"
+        assert response.headers["Vary"] == "Accept-Encoding"
+
+    async def test_stale_etag_gets_full_response(self, fake_cache):
+        response_cache = ResponseCache(fake_cache)
+        response = await response_cache.get_or_render(
+            "categories:list", lambda: _value([1]), TypeAdapter(list[int]), if_none_match='"old"'
+        )
+
+        assert response.status_code == 200
+        assert response.body == b"[1]"
+
+
+async def _value(value):
+    return value
+
+
+class TestControllerResponseCache:
+    """Tests for cached GET routes in BaseControllerImpl."""
+
+    def test_hit_skips_service(self, fake_cache):
+        from controllers.base_controller_impl import BaseControllerImpl
+
+        calls = []
+
+        class FakeService:
+            def __init__(self, db):
+                pass
+
+            def list_cache_key(self, skip, limit):
+                return f"categories:list:skip:{skip}:limit:{limit}"
+
+            def get_all(self, skip=0, limit=100):
+                calls.append((skip, limit))
+                return [CategoryBaseSchema(id_key=1, name="Books")]
+
+        controller = BaseControllerImpl(
+            schema=CategoryBaseSchema,
+            service_factory=FakeService,
+            tags=["Fake"],
+            cache_responses=True
+        )
+        controller.response_cache = ResponseCache(fake_cache)
+        app = FastAPI()
+        app.include_router(controller.router, prefix="/fake")
+        app.dependency_overrides[controller.db_dependency] = lambda: None
+        client = TestClient(app)
+
+        first = client.get("/fake/")
+        second = client.get("/fake/")
+
+        assert first.json() == second.json() == [{"id_key": 1, "name": "Books"}]
+        assert second.headers["etag"] == first.headers["etag"]
+        assert calls == [(0, 100)]
+
+        revalidated = client.get("/fake/", headers={"If-None-Match": first.headers["etag"]})
+
+        assert revalidated.status_code == 304
+        assert revalidated.content == b""
+        assert calls == [(0, 100)]
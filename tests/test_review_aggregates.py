@@ -0,0 +1,134 @@
+"""Tests for the review aggregates on products and the per-product reviews endpoint."""
+import pytest
+
+from models.product import ProductModel
+from models.review import ReviewModel
+from repositories.base_repository_impl import InstanceNotFoundError
+from repositories.product_repository import ProductRepository
+from schemas.review_schema import ReviewSchema
+from services.review_service import ReviewService
+from utils.cursor_pagination import NEXT_CURSOR_HEADER
+
+
+@pytest.fixture
+def catalog(db_session):
+    db_session.add_all([
+        ProductModel(name="Headphones", price=99.0, stock=5),
+        ProductModel(name="Speaker", price=49.0, stock=5),
+    ])
+    db_session.commit()
+
+
+def review(rating: float, product_id: int = 1) -> ReviewSchema:
+    return ReviewSchema(rating=rating, comment="Sounds really good", product_id=product_id)
+
+
+def aggregates(session, product_id: int = 1):
+    product = session.get(ProductModel, product_id)
+    session.refresh(product)
+    return product.rating_avg, product.rating_count
+
+
+@pytest.mark.usefixtures("catalog")
+class TestRatingAggregates:
+    """ReviewService keeps rating_avg / rating_count in step with the reviews."""
+
+    def test_new_product_has_no_rating(self, db_session):
+        assert aggregates(db_session) == (None, 0)
+
+    def test_save_update_delete(self, db_session):
+        service = ReviewService(db_session)
+        first = service.save(review(5.0))
+        service.save(review(2.0))
+        assert aggregates(db_session) == (3.5, 2)
+
+        service.update(first.id_key, review(4.0))
+        assert aggregates(db_session) == (3.0, 2)
+
+        service.delete(first.id_key)
+        assert aggregates(db_session) == (2.0, 1)
+
+    def test_deleting_last_review_clears_average(self, db_session):
+        service = ReviewService(db_session)
+        saved = service.save(review(4.0))
+        service.delete(saved.id_key)
+        assert aggregates(db_session) == (None, 0)
+
+    def test_moving_a_review_updates_both_products(self, db_session):
+        service = ReviewService(db_session)
+        saved = service.save(review(4.0, product_id=1))
+        service.save(review(2.0, product_id=1))
+
+        service.update(saved.id_key, review(5.0, product_id=2))
+
+        assert aggregates(db_session, 1) == (2.0, 1)
+        assert aggregates(db_session, 2) == (5.0, 1)
+
+    def test_failed_save_keeps_aggregates(self, db_session, monkeypatch):
+        service = ReviewService(db_session)
+
+        def fail():
+            raise RuntimeError("connection lost")
+
+        monkeypatch.setattr(db_session, "commit", fail)
+        with pytest.raises(RuntimeError):
+            service.save(review(5.0))
+        monkeypatch.undo()
+
+        assert aggregates(db_session) == (None, 0)
+        assert db_session.query(ReviewModel).count() == 0
+
+    def test_unknown_product(self, db_session):
+        with pytest.raises(InstanceNotFoundError):
+            ReviewService(db_session).save(review(5.0, product_id=99))
+
+
+@pytest.mark.usefixtures("catalog")
+class TestListingsWithoutReviews:
+    """Product listings expose the aggregates and never read the reviews table."""
+
+    def test_find_all_does_not_load_reviews(self, db_session, sql_statements):
+        ReviewService(db_session).save(review(4.0))
+        db_session.expunge_all()
+        sql_statements.clear()
+
+        products = ProductRepository(db_session).find_all()
+
+        assert not any("reviews" in statement for statement in sql_statements)
+        assert (products[0].rating_avg, products[0].rating_count) == (4.0, 1)
+        assert "reviews" not in products[0].model_dump()
+
+
+@pytest.mark.usefixtures("catalog")
+class TestProductReviewsEndpoint:
+
+    def test_pages_newest_first(self, api_client, db_session):
+        service = ReviewService(db_session)
+        ids = [service.save(review(rating)).id_key for rating in (1.0, 2.0, 3.0, 4.0, 5.0)]
+        service.save(review(5.0, product_id=2))
+
+        seen, params = [], {"limit": 2}
+        while True:
+            response = api_client.get("/products/id/1/reviews", params=params)
+            assert response.status_code == 200
+            seen.extend(item["id_key"] for item in response.json())
+            if NEXT_CURSOR_HEADER not in response.headers:
+                break
+            params["cursor"] = response.headers[NEXT_CURSOR_HEADER]
+
+        assert seen == list(reversed(ids))
+
+    def test_listing_shows_aggregates(self, api_client, db_session):
+        ReviewService(db_session).save(review(3.0))
+        item = api_client.get("/products/").json()[0]
+
+        assert (item["rating_avg"], item["rating_count"]) == (3.0, 1)
+        assert "reviews" not in item
+
+    def test_unknown_product_is_404(self, api_client):
+        assert api_client.get("/products/id/99/reviews").status_code == 404
+
+    def test_product_without_reviews(self, api_client):
+        response = api_client.get("/products/id/2/reviews")
+        assert response.status_code == 200
+        assert response.json() == []
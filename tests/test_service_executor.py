@@ -0,0 +1,102 @@
+"""Tests for the bounded service executor used by BaseControllerImpl."""
+import asyncio
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from utils.service_executor import ServiceExecutor
+
+
+@pytest.fixture
+def executor():
+    service_executor = ServiceExecutor(max_workers=4, default_group_limit=2, group_limits={"Orders": 1})
+    yield service_executor
+    service_executor.shutdown()
+
+
+class TestServiceExecutor:
+    """Tests for ServiceExecutor."""
+
+    async def test_runs_blocking_call_off_the_event_loop(self, executor):
+        loop_thread = threading.get_ident()
+
+        result = await executor.run("Products", threading.get_ident)
+
+        assert result != loop_thread
+
+    async def test_group_limit_caps_concurrency(self, executor):
+        running = []
+        peak = []
+        lock = threading.Lock()
+
+        def slow_call():
+            with lock:
+                running.append(1)
+                peak.append(len(running))
+            time.sleep(0.05)
+            with lock:
+                running.pop()
+
+        await asyncio.gather(*(executor.run("Products", slow_call) for _ in range(6)))
+
+        assert max(peak) == 2
+
+    async def test_group_overrides_and_pool_size_bound_the_limit(self, executor):
+        assert executor.get_group_limit("Orders") == 1
+        assert executor.get_group_limit("Products") == 2
+
+        capped = ServiceExecutor(max_workers=2, default_group_limit=10)
+        assert capped.get_group_limit("Products") == 2
+
+    async def test_metrics_record_calls_errors_and_queue_time(self, executor):
+        def failing_call():
+            raise ValueError("boom")
+
+        await executor.run("Categories", lambda: 1)
+        with pytest.raises(ValueError):
+            await executor.run("Categories", failing_call)
+
+        metrics = executor.metrics()["groups"]["Categories"]
+        assert metrics["calls"] == 2
+        assert metrics["errors"] == 1
+        assert metrics["in_flight"] == 0
+        assert metrics["waiting"] == 0
+        assert metrics["max_queue_ms"] >= 0.0
+
+
+class TestControllerDispatch:
+    """Tests for BaseControllerImpl dispatch in threadpool mode."""
+
+    def test_threadpool_mode_runs_service_in_executor(self):
+        from controllers.base_controller_impl import BaseControllerImpl
+        from schemas.category_schema import CategoryBaseSchema
+
+        threads = []
+
+        class FakeService:
+            def __init__(self, db):
+                pass
+
+            def get_all(self, skip=0, limit=100):
+                threads.append(threading.current_thread().name)
+                return [CategoryBaseSchema(id_key=1, name="Books")]
+
+        controller = BaseControllerImpl(
+            schema=CategoryBaseSchema,
+            service_factory=FakeService,
+            tags=["Fake"]
+        )
+        app = FastAPI()
+        app.include_router(controller.router, prefix="/fake")
+        app.dependency_overrides[controller.db_dependency] = lambda: None
+
+        with patch("controllers.base_controller_impl.is_threadpool_dispatch", return_value=True):
+            response = TestClient(app).get("/fake/")
+
+        assert response.status_code == 200
+        assert response.json()[0]["name"] == "Books"
+        assert threads[0].startswith("service-executor")
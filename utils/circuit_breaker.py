@@ -0,0 +1,253 @@
+"""
+Circuit Breaker
+
+Stops calling a dependency that is failing or slow, so callers degrade to
+their fallback (cache -> direct DB, rate limiting -> fail open) right away
+instead of each waiting for a socket timeout.
+
+- closed:    calls go through; the outcome and latency of the last
+             `window_size` calls are kept. Once at least `min_calls` are
+             recorded, the breaker opens when the failure rate or the
+             slow-call rate (calls slower than `slow_call_seconds`) reaches
+             its threshold.
+- open:      allow() is False for `open_seconds`; nothing touches the
+             dependency.
+- half_open: up to `half_open_probes` calls are let through. If they all
+             succeed (and are fast) the breaker closes, any failed or slow
+             probe opens it again. Probes that never report back are
+             re-armed after `open_seconds`, so the breaker cannot get stuck.
+
+Thread-safe; the same instance is shared by sync and asyncio callers.
+"""
+import contextlib
+import logging
+import threading
+import time
+from collections import deque
+from typing import Callable, Tuple, Type
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitBreaker:
+    """
+    Error-rate / latency circuit breaker
+
+    Usage:
+        if breaker.allow():
+            try:
+                with breaker.track():
+                    value = redis_client.get(key)
+            except RedisError:
+                value = None  # fallback
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        name: str,
+        window_size: int = 50,
+        min_calls: int = 10,
+        failure_rate: float = 0.5,
+        slow_call_seconds: float = 0.25,
+        slow_call_rate: float = 0.5,
+        open_seconds: float = 5.0,
+        half_open_probes: int = 3,
+        failure_exceptions: Tuple[Type[BaseException], ...] = (Exception,),
+        enabled: bool = True,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            name: Name used in logs and stats (e.g. "redis")
+            window_size: Number of recent calls the rates are computed over
+            min_calls: Calls needed in the window before the breaker can open
+            failure_rate: Failure fraction that opens the breaker
+            slow_call_seconds: Calls slower than this count as slow
+            slow_call_rate: Slow-call fraction that opens the breaker
+            open_seconds: Time spent open before probing (half-open)
+            half_open_probes: Successful probes needed to close again
+            failure_exceptions: Exceptions counted as failures by track()
+            enabled: When False, allow() is always True and nothing is recorded
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.name = name
+        self.window_size = window_size
+        self.min_calls = min_calls
+        self.failure_rate = failure_rate
+        self.slow_call_seconds = slow_call_seconds
+        self.slow_call_rate = slow_call_rate
+        self.open_seconds = open_seconds
+        self.half_open_probes = half_open_probes
+        self.failure_exceptions = failure_exceptions
+        self.enabled = enabled
+        self._clock = clock
+
+        self._lock = threading.Lock()
+        # (failed, slow) per call, newest last
+        self._window: deque = deque(maxlen=window_size)
+        self._state = self.CLOSED
+        self._opened_at = 0.0
+        self._half_open_since = 0.0
+        self._probes_admitted = 0
+        self._probes_succeeded = 0
+        self.times_opened = 0
+        self.rejected = 0
+
+    # ------------------------------------------------------------------
+    # State
+    # ------------------------------------------------------------------
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            self._advance()
+            return self._state
+
+    def _advance(self):
+        """open -> half_open once open_seconds have passed (lock held)"""
+        if self._state == self.OPEN and self._clock() - self._opened_at >= self.open_seconds:
+            self._state = self.HALF_OPEN
+            self._half_open_since = self._clock()
+            self._probes_admitted = 0
+            self._probes_succeeded = 0
+            logger.info(f"Circuit '{self.name}' half-open: probing")
+
+    def _open(self, reason: str):
+        """Trip the breaker (lock held)"""
+        self._state = self.OPEN
+        self._opened_at = self._clock()
+        self._window.clear()
+        self.times_opened += 1
+        logger.warning(f"⚠️  Circuit '{self.name}' opened ({reason}) for {self.open_seconds}s")
+
+    def _close(self):
+        self._state = self.CLOSED
+        self._window.clear()
+        logger.info(f"✅ Circuit '{self.name}' closed")
+
+    def allow(self) -> bool:
+        """
+        Whether a call may go to the dependency now
+
+        In half-open state every True claims one probe slot, so callers
+        should make the call (and record its outcome) when this returns True.
+        """
+        if not self.enabled:
+            return True
+        with self._lock:
+            self._advance()
+            if self._state == self.CLOSED:
+                return True
+            if self._state == self.HALF_OPEN:
+                if self._clock() - self._half_open_since >= self.open_seconds:
+                    # Probes that never reported back: re-arm
+                    self._half_open_since = self._clock()
+                    self._probes_admitted = self._probes_succeeded
+                if self._probes_admitted < self.half_open_probes:
+                    self._probes_admitted += 1
+                    return True
+            self.rejected += 1
+            return False
+
+    def is_open(self) -> bool:
+        """True while the breaker is open (every call rejected)"""
+        return self.enabled and self.state == self.OPEN
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+
+    def record_success(self, elapsed: float = 0.0):
+        """Record a completed call and how long it took (seconds)"""
+        if not self.enabled:
+            return
+        slow = elapsed >= self.slow_call_seconds
+        with self._lock:
+            self._advance()
+            if self._state == self.HALF_OPEN:
+                if slow:
+                    self._open(f"slow probe: {elapsed * 1000:.0f}ms")
+                    return
+                # One success per admitted probe: an operation making several
+                # round trips under one allow() cannot close the breaker alone
+                self._probes_succeeded = min(self._probes_succeeded + 1, self._probes_admitted)
+                if self._probes_succeeded >= self.half_open_probes:
+                    self._close()
+                return
+            if self._state == self.CLOSED:
+                self._window.append((False, slow))
+                self._evaluate()
+
+    def record_failure(self):
+        """Record a failed call"""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._advance()
+            if self._state == self.HALF_OPEN:
+                self._open("probe failed")
+            elif self._state == self.CLOSED:
+                self._window.append((True, False))
+                self._evaluate()
+
+    def _evaluate(self):
+        """Open when the window crosses a threshold (lock held, state closed)"""
+        calls = len(self._window)
+        if calls < self.min_calls:
+            return
+        failures = sum(1 for failed, _ in self._window if failed)
+        slow = sum(1 for _, is_slow in self._window if is_slow)
+        if failures / calls >= self.failure_rate:
+            self._open(f"{failures}/{calls} calls failed")
+        elif slow / calls >= self.slow_call_rate:
+            self._open(f"{slow}/{calls} calls slower than {self.slow_call_seconds * 1000:.0f}ms")
+
+    @contextlib.contextmanager
+    def track(self):
+        """
+        Time the enclosed call and record its outcome
+
+        Exceptions listed in failure_exceptions are recorded as failures and
+        re-raised; any other exception propagates without being recorded.
+        Works around awaits too (`with breaker.track(): await client.get(k)`).
+        """
+        started = time.perf_counter()
+        try:
+            yield self
+        except self.failure_exceptions:
+            self.record_failure()
+            raise
+        else:
+            self.record_success(time.perf_counter() - started)
+
+    def reset(self):
+        """Back to closed with an empty window"""
+        with self._lock:
+            self._state = self.CLOSED
+            self._window.clear()
+            self._probes_admitted = 0
+            self._probes_succeeded = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            self._advance()
+            calls = len(self._window)
+            failures = sum(1 for failed, _ in self._window if failed)
+            slow = sum(1 for _, is_slow in self._window if is_slow)
+            retry_in = None
+            if self._state == self.OPEN:
+                retry_in = round(max(0.0, self.open_seconds - (self._clock() - self._opened_at)), 2)
+            return {
+                "enabled": self.enabled,
+                "state": self._state,
+                "window_calls": calls,
+                "failure_rate": round(failures / calls, 3) if calls else 0.0,
+                "slow_call_rate": round(slow / calls, 3) if calls else 0.0,
+                "times_opened": self.times_opened,
+                "rejected": self.rejected,
+                "retry_in_seconds": retry_in,
+            }
@@ -0,0 +1,106 @@
+"""
+Keyset (Cursor) Pagination
+
+OFFSET pagination makes the database scan and discard every row before the
+page, so deep pages (infinite scroll) get slower as the table grows. Keyset
+pagination seeks past the last row instead:
+
+    WHERE (price, id_key) > (:last_price, :last_id) ORDER BY price, id_key LIMIT n
+
+which an index on the sort key answers in the same time for any page.
+
+Cursors are opaque URL-safe tokens holding the sort mode and the sort key
+values of the last row of the previous page. The primary key is always the
+last sort column, so the order is total and no row is skipped or repeated
+between pages. List endpoints accept `cursor` next to the legacy skip/limit
+and return the token of the next page in the X-Next-Cursor header (absent on
+the last page).
+"""
+import base64
+import json
+from typing import Any, List, NamedTuple, Optional, Sequence, Tuple
+
+from sqlalchemy import tuple_
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+class InvalidCursorError(ValueError):
+    """The cursor is malformed or was issued for another sort order"""
+    pass
+
+
+class SortKey(NamedTuple):
+    """
+    Sort mode: model attributes (primary key last) and direction
+
+    A key without attributes is ordered by the caller (e.g. search relevance)
+    and only supports OFFSET pages.
+    """
+    name: str
+    attributes: Tuple[str, ...]
+    descending: bool = False
+
+
+ID_ASC = SortKey("id", ("id_key",))
+
+
+def encode_cursor(key: SortKey, values: Sequence[Any]) -> str:
+    raw = json.dumps({"s": key.name, "k": list(values)}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: str, key: SortKey) -> List[Any]:
+    """
+    Sort key values stored in a cursor
+
+    Raises:
+        InvalidCursorError: If the token is malformed or belongs to another sort order
+    """
+    try:
+        data = json.loads(base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)))
+        sort_name, values = data["s"], data["k"]
+    except (ValueError, KeyError, TypeError) as e:
+        raise InvalidCursorError("Invalid cursor") from e
+    if sort_name != key.name or not isinstance(values, list) or len(values) != len(key.attributes):
+        raise InvalidCursorError(f"Cursor does not match sort order '{key.name}'")
+    return values
+
+
+def order_by(model: Any, key: SortKey) -> list:
+    columns = [getattr(model, attribute) for attribute in key.attributes]
+    return [column.desc() if key.descending else column.asc() for column in columns]
+
+
+def seek_condition(model: Any, key: SortKey, values: Sequence[Any]):
+    """Rows after the cursor: (k1, ..., id) > (v1, ..., id) (< when descending)"""
+    columns = [getattr(model, attribute) for attribute in key.attributes]
+    if len(columns) == 1:
+        row, bound = columns[0], values[0]
+    else:
+        row, bound = tuple_(*columns), tuple_(*values)
+    return row < bound if key.descending else row > bound
+
+
+def apply_page(query: Any, model: Any, key: SortKey, cursor: Optional[str], skip: int, limit: int) -> Any:
+    """
+    Order a Query / Select by the sort key and cut one page
+
+    With a cursor the page starts right after it (skip is ignored);
+    without one it is the legacy OFFSET page.
+    """
+    if key.attributes:
+        query = query.order_by(*order_by(model, key))
+    if cursor:
+        if not key.attributes:
+            raise InvalidCursorError(f"Sort order '{key.name}' does not support cursors, use skip")
+        return query.filter(seek_condition(model, key, decode_cursor(cursor, key))).limit(limit)
+    return query.offset(skip).limit(limit)
+
+
+def next_cursor(items: Sequence[Any], key: SortKey, limit: int) -> Optional[str]:
+    """Cursor of the page after items, None if items is the last page"""
+    if not key.attributes or not items or len(items) < limit:
+        return None
+    last = items[-1]
+    return encode_cursor(key, [getattr(last, attribute) for attribute in key.attributes])
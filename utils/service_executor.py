@@ -0,0 +1,187 @@
+"""
+Service Executor
+
+Runs blocking (sync SQLAlchemy) service calls in a dedicated, bounded thread
+pool so the event loop stays free for health checks, cache hits and I/O.
+
+Each route group (controller tag) gets its own concurrency cap, and the time
+every call spends queued before starting is recorded so pool saturation is
+visible in the health check.
+"""
+import asyncio
+import logging
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from config.constants import ExecutorConfig
+
+logger = logging.getLogger(__name__)
+
+
+class _GroupMetrics:
+    """Counters for a single route group"""
+
+    __slots__ = ("calls", "errors", "in_flight", "waiting",
+                 "total_queue_ms", "max_queue_ms", "total_run_ms")
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.in_flight = 0
+        self.waiting = 0
+        self.total_queue_ms = 0.0
+        self.max_queue_ms = 0.0
+        self.total_run_ms = 0.0
+
+    def as_dict(self, limit: int) -> dict:
+        return {
+            "limit": limit,
+            "calls": self.calls,
+            "errors": self.errors,
+            "in_flight": self.in_flight,
+            "waiting": self.waiting,
+            "avg_queue_ms": round(self.total_queue_ms / self.calls, 2) if self.calls else 0.0,
+            "max_queue_ms": round(self.max_queue_ms, 2),
+            "avg_run_ms": round(self.total_run_ms / self.calls, 2) if self.calls else 0.0,
+        }
+
+
+class ServiceExecutor:
+    """
+    Bounded thread pool with per-group concurrency caps and queue-time metrics
+
+    Usage:
+        result = await service_executor.run("Products", service.get_all, skip=0, limit=20)
+    """
+
+    def __init__(
+        self,
+        max_workers: int = ExecutorConfig.MAX_WORKERS,
+        default_group_limit: int = ExecutorConfig.DEFAULT_GROUP_LIMIT,
+        group_limits: Optional[Dict[str, int]] = None
+    ):
+        self.max_workers = max_workers
+        self.default_group_limit = default_group_limit
+        self.group_limits = dict(group_limits or ExecutorConfig.GROUP_LIMITS)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        self._metrics: Dict[str, _GroupMetrics] = {}
+        self._metrics_lock = threading.Lock()
+        # asyncio primitives are bound to one loop, so keep one set per loop
+        self._semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Semaphore]]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix="service-executor"
+                    )
+                    logger.info(f"✅ Service executor started with {self.max_workers} threads")
+        return self._executor
+
+    def get_group_limit(self, group: str) -> int:
+        """Concurrency cap for a route group (never above the pool size)"""
+        return min(self.group_limits.get(group, self.default_group_limit), self.max_workers)
+
+    def _get_semaphore(self, group: str) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        semaphores = self._semaphores.setdefault(loop, {})
+        if group not in semaphores:
+            semaphores[group] = asyncio.Semaphore(self.get_group_limit(group))
+        return semaphores[group]
+
+    def _group_metrics(self, group: str) -> _GroupMetrics:
+        with self._metrics_lock:
+            if group not in self._metrics:
+                self._metrics[group] = _GroupMetrics()
+            return self._metrics[group]
+
+    async def run(self, group: str, func: Callable, *args, **kwargs) -> Any:
+        """
+        Run a blocking callable in the pool, honoring the group's cap
+
+        Args:
+            group: Route group name (e.g. controller tag)
+            func: Blocking callable
+            *args, **kwargs: Arguments for func
+
+        Returns:
+            Whatever func returns (exceptions propagate unchanged)
+        """
+        metrics = self._group_metrics(group)
+        enqueued_at = time.perf_counter()
+
+        with self._metrics_lock:
+            metrics.waiting += 1
+
+        def timed_call():
+            started_at = time.perf_counter()
+            with self._metrics_lock:
+                metrics.waiting -= 1
+                metrics.in_flight += 1
+                queue_ms = (started_at - enqueued_at) * 1000
+                metrics.total_queue_ms += queue_ms
+                metrics.max_queue_ms = max(metrics.max_queue_ms, queue_ms)
+            try:
+                return func(*args, **kwargs)
+            except Exception:
+                with self._metrics_lock:
+                    metrics.errors += 1
+                raise
+            finally:
+                with self._metrics_lock:
+                    metrics.in_flight -= 1
+                    metrics.calls += 1
+                    metrics.total_run_ms += (time.perf_counter() - started_at) * 1000
+
+        semaphore = self._get_semaphore(group)
+        try:
+            await semaphore.acquire()
+        except BaseException:
+            with self._metrics_lock:
+                metrics.waiting -= 1
+            raise
+
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), timed_call)
+        finally:
+            semaphore.release()
+
+    def metrics(self) -> dict:
+        """Snapshot of executor configuration and per-group counters"""
+        with self._metrics_lock:
+            groups = {
+                name: group.as_dict(self.get_group_limit(name))
+                for name, group in self._metrics.items()
+            }
+        return {
+            "mode": ExecutorConfig.DISPATCH_MODE,
+            "max_workers": self.max_workers,
+            "default_group_limit": self.default_group_limit,
+            "groups": groups,
+        }
+
+    def shutdown(self, wait: bool = True):
+        """Stop the worker threads (called on application shutdown)"""
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=wait)
+                self._executor = None
+                logger.info("Service executor shut down")
+
+
+def is_threadpool_dispatch() -> bool:
+    """True when sync service calls must be dispatched to the executor"""
+    return ExecutorConfig.DISPATCH_MODE == "threadpool"
+
+
+# Global executor instance (threads are created on first use)
+service_executor = ServiceExecutor()